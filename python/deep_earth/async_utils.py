@@ -7,18 +7,46 @@ in environments where the main thread may already have an event loop
 """
 
 import asyncio
-import concurrent.futures
-from typing import TypeVar, Coroutine, Any
+import threading
+from typing import (
+    Any, AsyncIterator, Awaitable, Coroutine, Iterable, Optional, Tuple,
+    TypeVar, Union,
+)
 
 T = TypeVar('T')
 
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
+
+def _ensure_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the shared background event loop, starting it on first use.
+
+    The loop is a ``SelectorEventLoop`` running forever in a daemon
+    thread, so repeated ``run_async`` calls reuse one thread and loop
+    instead of creating and tearing them down per coroutine.
+    """
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None or _LOOP.is_closed():
+            loop = asyncio.SelectorEventLoop()
+            thread = threading.Thread(
+                target=loop.run_forever,
+                name="deep-earth-async",
+                daemon=True,
+            )
+            thread.start()
+            _LOOP = loop
+        return _LOOP
+
 
 def run_async(coro: Coroutine[Any, Any, T]) -> T:
     """
     Execute an async coroutine from a synchronous context.
 
-    Always runs the coroutine in a separate thread with its own
-    ``SelectorEventLoop``.  This bypasses DCC hosts (like Houdini 21.0)
+    Always runs the coroutine on a persistent background thread with its
+    own ``SelectorEventLoop``.  This bypasses DCC hosts (like Houdini 21.0)
     that monkey-patch ``asyncio`` with custom event loops enforcing
     main-thread-only task creation (``haio``).
 
@@ -28,6 +56,10 @@ def run_async(coro: Coroutine[Any, Any, T]) -> T:
     Returns:
         The result of the coroutine
 
+    Raises:
+        RuntimeError: If called from a coroutine already running on the
+            background loop (waiting on it would deadlock).
+
     Example:
         async def fetch_data():
             async with aiohttp.ClientSession() as session:
@@ -36,36 +68,151 @@ def run_async(coro: Coroutine[Any, Any, T]) -> T:
         # From Houdini Python SOP:
         result = run_async(fetch_data())
     """
-    def _run_in_thread() -> T:
-        loop = asyncio.SelectorEventLoop()
-        asyncio.set_event_loop(loop)
-        try:
-            return loop.run_until_complete(coro)
-        finally:
-            loop.close()
+    loop = _ensure_loop()
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    if running is loop:
+        coro.close()
+        raise RuntimeError(
+            "run_async() cannot be called from the background event loop"
+        )
+
+    return asyncio.run_coroutine_threadsafe(coro, loop).result()
+
+
+class AdmissionController:
+    """
+    Concurrency limiter whose capacity can be resized at runtime.
 
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(_run_in_thread)
-        return future.result()
+    A counter guarded by an ``asyncio.Condition`` replaces a fixed
+    ``asyncio.Semaphore``, so callers can back off (e.g. on HTTP 429)
+    or ramp up without touching semaphore internals.
 
+    Attributes:
+        cap (int): Maximum number of concurrent holders.
+        active (int): Number of holders currently admitted.
+    """
 
-async def gather_with_concurrency(limit: int, *coros: Coroutine[Any, Any, T]) -> list[T]:
+    def __init__(self, cap: int):
+        """
+        Initialize the controller.
+
+        Args:
+            cap: Initial maximum number of concurrent holders (>= 1).
+        """
+        if cap < 1:
+            raise ValueError(f"cap must be >= 1, got {cap}")
+        self._cap = cap
+        self._active = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def cap(self) -> int:
+        """Current concurrency limit."""
+        return self._cap
+
+    @property
+    def active(self) -> int:
+        """Number of currently admitted holders."""
+        return self._active
+
+    async def acquire(self) -> None:
+        """Wait until a slot is free, then take it."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._active < self._cap)
+            self._active += 1
+
+    async def release(self) -> None:
+        """Give back a slot and wake one waiter."""
+        async with self._cond:
+            self._active -= 1
+            self._cond.notify(1)
+
+    async def set_cap(self, cap: int) -> None:
+        """
+        Resize the concurrency limit.
+
+        Holders already admitted are not interrupted when shrinking;
+        new acquisitions wait until ``active`` drops below the new cap.
+
+        Args:
+            cap: New maximum number of concurrent holders (>= 1).
+        """
+        if cap < 1:
+            raise ValueError(f"cap must be >= 1, got {cap}")
+        async with self._cond:
+            grew = cap > self._cap
+            self._cap = cap
+            if grew:
+                self._cond.notify_all()
+
+    async def __aenter__(self) -> "AdmissionController":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.release()
+
+
+async def gather_with_concurrency(
+    limit: Union[int, AdmissionController],
+    *coros: Coroutine[Any, Any, T],
+) -> list[T]:
     """
-    Run coroutines with a concurrency limit using a semaphore.
+    Run coroutines with a concurrency limit.
 
     Useful for limiting concurrent API requests to avoid rate limiting.
 
     Args:
-        limit: Maximum number of concurrent coroutines
+        limit: Maximum number of concurrent coroutines, or an
+            ``AdmissionController`` whose cap may be resized while the
+            coroutines run.
         *coros: Coroutines to execute
 
     Returns:
         List of results in the same order as input coroutines
     """
-    semaphore = asyncio.Semaphore(limit)
+    controller = (
+        limit if isinstance(limit, AdmissionController)
+        else AdmissionController(limit)
+    )
 
     async def limited_coro(coro: Coroutine[Any, Any, T]) -> T:
-        async with semaphore:
+        async with controller:
             return await coro
 
     return await asyncio.gather(*(limited_coro(c) for c in coros))
+
+
+async def as_completed_with_names(
+    named: Iterable[Tuple[str, Awaitable[T]]],
+) -> AsyncIterator[Tuple[str, Union[T, Exception]]]:
+    """
+    Yield ``(name, result)`` pairs as awaitables finish.
+
+    Like ``asyncio.gather(..., return_exceptions=True)``, a failure is
+    yielded as its exception instead of being raised, but results arrive
+    in completion order so callers can process fast providers while slow
+    ones are still running.
+
+    Args:
+        named: Pairs of a label and the awaitable to run under it.
+
+    Yields:
+        The label and either the awaitable's result or the exception it
+        raised.
+    """
+    async def labelled(
+        name: str, aw: Awaitable[T],
+    ) -> Tuple[str, Union[T, Exception]]:
+        try:
+            return name, await aw
+        except Exception as exc:
+            return name, exc
+
+    for next_done in asyncio.as_completed(
+        [labelled(name, aw) for name, aw in named]
+    ):
+        yield await next_done
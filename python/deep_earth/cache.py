@@ -1,12 +1,130 @@
 import os
+import sys
 import json
 import time
+import errno
+import mmap
+import atexit
+import ctypes
+import ctypes.util
 import logging
-from datetime import datetime, timezone
-from typing import Dict, Any, Optional, Union, cast
+import weakref
+import threading
+import functools
+from collections import OrderedDict
+from datetime import datetime
+from typing import BinaryIO, Dict, Any, Optional, Tuple, Union, cast
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    HAS_ORJSON = False
 
 logger = logging.getLogger(__name__)
 
+
+if HAS_ORJSON:
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+    def _load_file(f: BinaryIO) -> Any:
+        """Parses JSON from an mmap of ``f``, skipping the read() copy."""
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty files can't be mapped
+            return orjson.loads(b"")
+        with mm, memoryview(mm) as view:
+            return orjson.loads(view)
+else:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def _load_file(f: BinaryIO) -> Any:
+        return json.loads(f.read())
+
+# Managers with possibly unflushed metadata; flushed at interpreter exit.
+_LIVE_MANAGERS: "weakref.WeakSet[CacheManager]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_managers() -> None:
+    for manager in list(_LIVE_MANAGERS):
+        manager.flush()
+
+
+# statx(2) flags: resolve relative to the CWD, don't force a sync with a
+# remote filesystem (NFS/CIFS), and only request the file type.
+_AT_FDCWD = -100
+_AT_STATX_DONT_SYNC = 0x4000
+_STATX_TYPE = 0x0001
+_STATX_BUF_SIZE = 256  # sizeof(struct statx)
+
+
+@functools.lru_cache(maxsize=1)
+def _statx_func() -> Optional[Any]:
+    """Returns libc's ``statx`` on Linux, or None where it is unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        statx = libc.statx
+    except (OSError, AttributeError):
+        return None
+    statx.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_int, ctypes.c_uint, ctypes.c_void_p]
+    statx.restype = ctypes.c_int
+    return statx
+
+
+def _fast_exists(path: str) -> bool:
+    """``os.path.exists`` that answers from the kernel's attribute cache.
+
+    Uses ``statx`` with ``AT_STATX_DONT_SYNC`` on Linux so lookups on network
+    filesystems don't round-trip to the server; falls back to
+    ``os.path.exists`` elsewhere, or when statx fails for any reason other
+    than a missing path (e.g. ENOSYS, or EPERM under a seccomp filter).
+    """
+    statx = _statx_func()
+    if statx is not None:
+        buf = ctypes.create_string_buffer(_STATX_BUF_SIZE)
+        if statx(_AT_FDCWD, os.fsencode(path), _AT_STATX_DONT_SYNC, _STATX_TYPE, buf) == 0:
+            return True
+        if ctypes.get_errno() in (errno.ENOENT, errno.ENOTDIR):
+            return False
+    return os.path.exists(path)
+
+
+def _expires_at(created: float, ttl_days: Optional[float]) -> Optional[float]:
+    """Returns the expiry epoch for an entry, or None if it never expires."""
+    if ttl_days is None:
+        return None
+    return created + ttl_days * 86400.0
+
+
+def _iso_timestamp(epoch: float) -> str:
+    """Formats an epoch as the ISO8601 UTC string stored in metadata.
+
+    Uses ``time.strftime`` rather than building a ``datetime`` per entry;
+    sub-second precision is dropped, which TTLs measured in days don't need.
+    """
+    return time.strftime("%Y-%m-%dT%H:%M:%S+00:00", time.gmtime(epoch))
+
+
+def _entry_expires_at(entry: Dict[str, Any]) -> Optional[float]:
+    """Derives ``expires_at`` from an entry's ISO timestamp and TTL.
+
+    Invalid timestamps yield 0.0 so the entry is treated as expired.
+    """
+    timestamp_str = entry.get("timestamp")
+    ttl_days = entry.get("ttl_days")
+    if timestamp_str is None or ttl_days is None:
+        return None
+    try:
+        created = datetime.fromisoformat(timestamp_str).timestamp()
+        return _expires_at(created, ttl_days)
+    except (ValueError, TypeError):
+        return 0.0
+
 class CacheManager:
     """
     Manages a local file-based cache for geospatial data.
@@ -17,12 +135,34 @@ class CacheManager:
         "key": {
             "category": str,
             "timestamp": str (ISO8601),
+            "created": float (epoch seconds, entries written since v0.2),
             "ttl_days": int,
-            "extension": str
+            "extension": str,
+            "expires_at": float (epoch seconds) or None
         }
     }
+
+    All metadata access goes through one re-entrant lock, so the manager
+    can be shared by adapters fetching on different threads.
+
+    Metadata is read lazily on first access, and writes are batched: the
+    JSON file is rewritten every ``FLUSH_THRESHOLD`` mutations, on
+    ``flush()``/``close()``, and at interpreter exit. ``save`` records only
+    the epoch; the ISO ``timestamp`` is formatted when the entry is written.
     """
     
+    # Metadata mutations buffered before the JSON file is rewritten.
+    FLUSH_THRESHOLD = 64
+
+    # Seconds a path existence probe result is reused before re-stat'ing.
+    PATH_CACHE_TTL = 1.0
+
+    # Maximum number of memoized get_path results.
+    RESOLVE_CACHE_SIZE = 4096
+
+    # Maximum number of memoized path existence probes.
+    PATH_CACHE_SIZE = 4096
+
     TTL_DAYS = {
         "srtm": None,      # Never expires
         "osm": 30,         # 30 days
@@ -36,22 +176,51 @@ class CacheManager:
         Args:
             cache_dir: Root directory for the cache.
         """
+        self._lock = threading.RLock()
         self.cache_dir = cache_dir
-        if not os.path.exists(self.cache_dir):
-            os.makedirs(self.cache_dir)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._category_prefixes: Dict[str, str] = {}
+        self._path_cache: "OrderedDict[str, Tuple[float, bool]]" = OrderedDict()
+        self._resolve_cache: "OrderedDict[Tuple[str, str, str], Tuple[float, Optional[str]]]" = OrderedDict()
+        for category in self.TTL_DAYS:
+            self._ensure_category(category)
         self.metadata_path = os.path.join(self.cache_dir, "cache_metadata.json")
-        self._load_metadata()
+        self._dirty = False
+        self._mutations_since_flush = 0
+        self._metadata: Optional[Dict[str, Any]] = None
+        _LIVE_MANAGERS.add(self)
+
+    def __del__(self) -> None:
+        try:
+            self.flush()
+        except Exception:
+            pass
+
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Cache metadata, read from disk on first access."""
+        if self._metadata is None:
+            with self._lock:
+                if self._metadata is None:
+                    self._load_metadata()
+        return cast(Dict[str, Any], self._metadata)
+
+    @metadata.setter
+    def metadata(self, value: Dict[str, Any]) -> None:
+        self._metadata = value
 
     def _load_metadata(self) -> None:
         """Loads and migrates cache metadata from disk."""
         if os.path.exists(self.metadata_path):
             try:
-                with open(self.metadata_path, 'r') as f:
-                    self.metadata = json.load(f)
+                with open(self.metadata_path, "rb") as f:
+                    self.metadata = _load_file(f)
                 
                 # Migration logic
                 if self.metadata.get("version") == "1.0":
                     self._migrate_v1_to_v2()
+                else:
+                    self._backfill_expires_at()
                     
             except (json.JSONDecodeError, IOError):
                 logger.error(f"Failed to load cache metadata from {self.metadata_path}. Initializing new metadata.")
@@ -60,12 +229,16 @@ class CacheManager:
             self.metadata = {"version": "2.0", "entries": {}}
 
     def _migrate_v1_to_v2(self) -> None:
-        """Migrates metadata from version 1.0 to 2.0."""
+        """Migrates metadata from version 1.0 to 2.0.
+
+        The migrated metadata is only marked dirty, so it reaches disk with
+        the first batched flush rather than as an extra rewrite at startup.
+        """
         logger.info("Migrating cache metadata from v1.0 to v2.0")
         new_entries = {}
         for key, entry in self.metadata.get("entries", {}).items():
             created = entry.get("created", time.time())
-            timestamp = datetime.fromtimestamp(created, tz=timezone.utc).isoformat()
+            timestamp = _iso_timestamp(created)
             
             category = entry.get("category", "unknown")
             ttl_days = self.TTL_DAYS.get(category)
@@ -74,49 +247,123 @@ class CacheManager:
                 "category": category,
                 "timestamp": timestamp,
                 "ttl_days": ttl_days,
-                "extension": entry.get("extension", "tif")
+                "extension": entry.get("extension", "tif"),
+                "expires_at": _expires_at(created, ttl_days),
             }
         
         self.metadata = {
             "version": "2.0",
             "entries": new_entries
         }
-        self._save_metadata()
+        self._mark_dirty()
+
+    def _backfill_expires_at(self) -> None:
+        """Adds ``expires_at`` to entries written before it was stored."""
+        backfilled = False
+        for entry in self.metadata.get("entries", {}).values():
+            if "expires_at" not in entry:
+                entry["expires_at"] = _entry_expires_at(entry)
+                backfilled = True
+        if backfilled:
+            self._mark_dirty()
 
     def _save_metadata(self) -> None:
-        """Saves cache metadata to disk."""
-        try:
-            with open(self.metadata_path, 'w') as f:
-                json.dump(self.metadata, f, indent=2)
-        except IOError as e:
-            logger.error(f"Failed to save cache metadata: {e}")
+        """Saves cache metadata to disk.
+
+        The JSON is encoded compactly, written to a temporary file and moved
+        over the live file with ``os.replace``, so a crash mid-write never
+        leaves a truncated metadata file behind. ISO timestamps for entries
+        recorded by ``save`` are formatted here, once per entry.
+        """
+        with self._lock:
+            for entry in self.metadata["entries"].values():
+                if "timestamp" not in entry:
+                    entry["timestamp"] = _iso_timestamp(entry["created"])
+
+            tmp_path = f"{self.metadata_path}.{os.getpid()}.tmp"
+            try:
+                data = _dumps(self.metadata)
+                with open(tmp_path, "wb") as f:
+                    f.write(data)
+                os.replace(tmp_path, self.metadata_path)
+            except IOError as e:
+                logger.error(f"Failed to save cache metadata: {e}")
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+    def _mark_dirty(self) -> None:
+        """Records a metadata mutation, writing to disk every FLUSH_THRESHOLD."""
+        self._dirty = True
+        self._mutations_since_flush += 1
+        if self._mutations_since_flush >= self.FLUSH_THRESHOLD:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes pending metadata changes to disk."""
+        if not getattr(self, "_dirty", False):
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            self._mutations_since_flush = 0
+            self._save_metadata()
+
+    def close(self) -> None:
+        """Flushes pending metadata; the manager stays usable afterwards."""
+        self.flush()
 
     def _get_full_path(self, key: str, category: str, extension: str = "tif") -> str:
         """Calculates the full filesystem path for a cache entry."""
+        prefix = self._category_prefixes.get(category) or self._ensure_category(category)
+        return f"{prefix}{key}.{extension}"
+
+    def _ensure_category(self, category: str) -> str:
+        """Creates a category directory once and memoizes its path prefix.
+
+        Returns:
+            The category directory with a trailing separator, so entry paths
+            are a plain concatenation rather than an ``os.path.join``.
+        """
         category_dir = os.path.join(self.cache_dir, category)
-        if not os.path.exists(category_dir):
-            os.makedirs(category_dir)
-        return os.path.join(category_dir, f"{key}.{extension}")
+        os.makedirs(category_dir, exist_ok=True)
+        prefix = category_dir + os.sep
+        self._category_prefixes[category] = prefix
+        return prefix
+
+    def _cached_exists(self, path: str) -> bool:
+        """``os.path.exists`` with results (hits and misses) reused for PATH_CACHE_TTL.
+
+        Probes are kept in a bounded LRU; callers hold ``_lock``.
+        """
+        now = time.monotonic()
+        cached = self._path_cache.get(path)
+        if cached is not None and now - cached[0] < self.PATH_CACHE_TTL:
+            self._path_cache.move_to_end(path)
+            return cached[1]
+        found = _fast_exists(path)
+        self._remember_path(path, now, found)
+        return found
+
+    def _remember_path(self, path: str, now: float, found: bool) -> None:
+        """Records an existence probe, evicting the least recently used."""
+        self._path_cache[path] = (now, found)
+        self._path_cache.move_to_end(path)
+        if len(self._path_cache) > self.PATH_CACHE_SIZE:
+            self._path_cache.popitem(last=False)
 
     def _is_expired(self, key: str) -> bool:
         """Checks if a cache entry has exceeded its TTL."""
-        if key not in self.metadata["entries"]:
-            return False 
-            
-        entry = self.metadata["entries"][key]
-        timestamp_str = entry.get("timestamp")
-        ttl_days = entry.get("ttl_days")
-        
-        if timestamp_str is None or ttl_days is None:
+        entry = self.metadata["entries"].get(key)
+        if entry is None:
             return False
-            
-        try:
-            created = datetime.fromisoformat(timestamp_str)
-            now = datetime.now(timezone.utc)
-            age_days = (now - created).total_seconds() / (24 * 3600)
-            return cast(bool, age_days > ttl_days)
-        except (ValueError, TypeError):
-            return True # Assume expired if timestamp is invalid
+
+        if "expires_at" not in entry:
+            entry["expires_at"] = _entry_expires_at(entry)
+        expires_at = entry["expires_at"]
+        return expires_at is not None and time.time() > expires_at
 
     def save(self, key: str, data: bytes, category: str, extension: str = "tif") -> str:
         """Saves binary data to the cache."""
@@ -124,60 +371,137 @@ class CacheManager:
         try:
             with open(path, "wb") as f:
                 f.write(data)
-            
-            self.metadata["entries"][key] = {
-                "category": category,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
-                "ttl_days": self.TTL_DAYS.get(category),
-                "extension": extension
-            }
-            self._save_metadata()
+            self._register(key, path, category, extension)
             return path
         except IOError as e:
             logger.error(f"Failed to save data to cache path {path}: {e}")
             raise
 
+    def partial_path(self, key: str, category: str, extension: str = "tif") -> str:
+        """Returns a scratch path in the cache for streaming an entry to disk.
+
+        Write the download there, then hand it to ``save_file``; the
+        entry only becomes visible once that rename completes.
+        """
+        return self._get_full_path(key, category, extension) + ".part"
+
+    def save_file(self, key: str, src_path: str, category: str, extension: str = "tif") -> str:
+        """Moves an already-written file into the cache as ``key``.
+
+        Args:
+            src_path: File to adopt, normally from ``partial_path``; it
+                must be on the cache's filesystem.
+
+        Returns:
+            The cache path of the entry.
+        """
+        path = self._get_full_path(key, category, extension)
+        try:
+            os.replace(src_path, path)
+            self._register(key, path, category, extension)
+            return path
+        except OSError as e:
+            logger.error(f"Failed to move {src_path} to cache path {path}: {e}")
+            raise
+
+    def _register(self, key: str, path: str, category: str, extension: str) -> None:
+        """Records a freshly written entry in the metadata and path caches."""
+        now = time.time()
+        ttl_seconds = CATEGORY_TTL_SECONDS.get(category)
+        with self._lock:
+            self._remember_path(path, time.monotonic(), True)
+            self._resolve_cache.pop((key, category, extension), None)
+            self.metadata["entries"][key] = {
+                "category": category,
+                "created": now,
+                "ttl_days": self.TTL_DAYS.get(category),
+                "extension": extension,
+                "expires_at": None if ttl_seconds is None else now + ttl_seconds,
+            }
+            self._mark_dirty()
+
     def exists(self, key: str, category: str, extension: str = "tif") -> bool:
         """Checks if a key exists in the cache and is not expired."""
-        if self._is_expired(key):
-             self.invalidate(key)
-             return False
+        with self._lock:
+            if self._is_expired(key):
+                self.invalidate(key)
+                return False
 
-        path = self._get_full_path(key, category, extension)
-        return os.path.exists(path)
+            path = self._get_full_path(key, category, extension)
+            return self._cached_exists(path)
 
     def get_path(self, key: str, category: str, extension: str = "tif") -> Optional[str]:
-        """Returns the path to a cached file if it exists and is not expired."""
+        """Returns the path to a cached file if it exists and is not expired.
+
+        Results are memoized in a bounded LRU for PATH_CACHE_TTL seconds, so
+        repeated lookups of the same key collapse to a single dict probe.
+        """
+        resolve_key = (key, category, extension)
+        with self._lock:
+            now = time.monotonic()
+            hit = self._resolve_cache.get(resolve_key)
+            if hit is not None and now - hit[0] < self.PATH_CACHE_TTL:
+                self._resolve_cache.move_to_end(resolve_key)
+                return hit[1]
+
+            path = self._resolve_path(key, category, extension)
+            self._resolve_cache[resolve_key] = (now, path)
+            self._resolve_cache.move_to_end(resolve_key)
+            if len(self._resolve_cache) > self.RESOLVE_CACHE_SIZE:
+                self._resolve_cache.popitem(last=False)
+            return path
+
+    def _resolve_path(self, key: str, category: str, extension: str) -> Optional[str]:
+        """Uncached body of ``get_path``."""
         if self._is_expired(key):
              self.invalidate(key)
              return None
 
         path = self._get_full_path(key, category, extension)
-        if os.path.exists(path):
+        if self._cached_exists(path):
             return path
         return None
 
+    def _remove_entry_file(self, key: str, entry: Dict[str, Any]) -> None:
+        """Unlinks an entry's file; a file that is already gone is not an error."""
+        path = self._get_full_path(key, entry["category"], entry.get("extension", "tif"))
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.error(f"Failed to remove cache file {path}: {e}")
+        self._path_cache.pop(path, None)
+        self._resolve_cache.pop((key, entry["category"], entry.get("extension", "tif")), None)
+
     def invalidate(self, key: str) -> None:
         """Removes an entry from the cache."""
-        if key in self.metadata["entries"]:
-            entry = self.metadata["entries"][key]
-            path = self._get_full_path(key, entry["category"], entry.get("extension", "tif"))
-            if os.path.exists(path):
-                try:
-                    os.remove(path)
-                except OSError as e:
-                    logger.error(f"Failed to remove cache file {path}: {e}")
-            
-            del self.metadata["entries"][key]
-            self._save_metadata()
-            
+        with self._lock:
+            entry = self.metadata["entries"].pop(key, None)
+            if entry is not None:
+                self._remove_entry_file(key, entry)
+                self._mark_dirty()
+
     def clear_expired(self) -> int:
-        """Clears all expired entries from the cache."""
-        keys = list(self.metadata["entries"].keys())
-        cleared_count = 0
-        for key in keys:
-            if self._is_expired(key):
-                self.invalidate(key)
-                cleared_count += 1
-        return cleared_count
+        """Clears all expired entries from the cache.
+
+        Expired files are unlinked in one pass and the metadata is written
+        once at the end, rather than once per entry.
+        """
+        with self._lock:
+            entries = self.metadata["entries"]
+            expired = [key for key in entries if self._is_expired(key)]
+            for key in expired:
+                self._remove_entry_file(key, entries.pop(key))
+            if expired:
+                self._mark_dirty()
+                self.flush()
+            return len(expired)
+
 
+# Per-category TTL in seconds (None = never expires), precomputed once so
+# writes don't redo the days-to-seconds conversion.
+CATEGORY_TTL_SECONDS: Dict[str, Optional[float]] = {
+    category: _expires_at(0.0, ttl_days)
+    for category, ttl_days in CacheManager.TTL_DAYS.items()
+}
@@ -1,42 +1,137 @@
 import argparse
 import asyncio
+import functools
 import json
 import logging
 import os
 import sys
-from typing import Any, Dict, List, Optional, cast
-
+import warnings
+from typing import (
+    TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Optional, Tuple,
+    cast,
+)
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover - orjson is an optional accelerator
+    HAS_ORJSON = False
+
+from deep_earth.async_utils import as_completed_with_names
 from deep_earth.cache import CacheManager
-from deep_earth.config import Config
+from deep_earth.config import get_config
 from deep_earth.credentials import CredentialsManager
 from deep_earth.logging_config import setup_logging
-from deep_earth.providers.base import DataProviderAdapter
-from deep_earth.providers.earth_engine import EarthEngineAdapter
-from deep_earth.providers.local import LocalFileAdapter
-from deep_earth.providers.osm import OverpassAdapter
-from deep_earth.providers.srtm import SRTMAdapter
-from deep_earth.region import RegionContext
+
+if TYPE_CHECKING:
+    from deep_earth.providers.base import DataProviderAdapter
+    from deep_earth.region import RegionContext
+
+# Provider and region modules pull in numpy, rasterio, pyproj and the Earth
+# Engine client; they are imported inside the fetch path so that
+# ``deep-earth setup`` and ``--help`` start without loading them.
 
 logger = logging.getLogger(__name__)
 
+# Largest preview raster side; the 10x8in, 150dpi figure can't show more.
+PREVIEW_MAX_DIM = 2048
+
+# Fetch plan: (output name, adapter key, call starting the fetch). Each
+# call takes (adapter, bbox, resolution, year, dataset_id, local_dir).
+# "local" only runs when a local directory is given.
+PROVIDERS: Tuple[Tuple[str, str, Callable[..., Awaitable[Any]]], ...] = (
+    ("srtm", "srtm", lambda a, bbox, res, year, ds, local: a.fetch(bbox, 30)),
+    ("embeddings", "gee",
+     lambda a, bbox, res, year, ds, local: a.fetch(bbox, res, year, ds)),
+    ("osm", "osm",
+     lambda a, bbox, res, year, ds, local: a.fetch_path(bbox, res)),
+    ("local", "local",
+     lambda a, bbox, res, year, ds, local: a.fetch(bbox, res, local)),
+)
+
 
 class CLIError(Exception):
     """Raised when the CLI encounters an error that should exit."""
 
-    def __init__(self, message: str, exit_code: int = 1):
+    def __init__(self, message: str, exit_code: int = 1, reported: bool = False):
         super().__init__(message)
         self.exit_code = exit_code
+        # True when the error was already written into streamed output
+        self.reported = reported
+
+def _json_bytes(obj: Any) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON with 2-space indentation.
+
+    Uses orjson when available; the stdlib fallback gives the same layout.
+    """
+    if HAS_ORJSON:
+        return cast(bytes, orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    return json.dumps(obj, indent=2).encode()
+
+def _write_stdout(data: bytes) -> None:
+    """Write ``data`` straight to the stdout buffer and flush.
+
+    The text layer is flushed first to keep output ordered.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(data.decode())
+        sys.stdout.flush()
+        return
+    sys.stdout.flush()
+    buffer.write(data)
+    buffer.flush()
+
+def _print_json(obj: Dict[str, Any]) -> None:
+    """Print ``obj`` to stdout as indented JSON."""
+    _write_stdout(_json_bytes(obj) + b"\n")
+
+class _ResultStream:
+    """Writes the fetch summary to stdout while providers are running.
+
+    Each ``results`` entry is written as soon as its provider finishes, in
+    completion order; the remaining keys follow once the run completes.
+    The layout matches ``_print_json``, and values are encoded the same
+    way.
+    """
+
+    def __init__(self) -> None:
+        self.started = False
+
+    def add(self, name: str, path: Optional[str]) -> None:
+        """Emit one ``results`` entry, opening the document if needed."""
+        prefix = b",\n    " if self.started else b'{\n  "results": {\n    '
+        self.started = True
+        _write_stdout(prefix + _json_bytes(name) + b": " + _json_bytes(path))
+
+    def finish(self, output: Dict[str, Any]) -> None:
+        """Close ``results`` and emit every other key of ``output``."""
+        parts = [b"\n  }" if self.started else b'{\n  "results": {}']
+        for key, value in output.items():
+            if key == "results":
+                continue
+            body = _json_bytes(value).replace(b"\n", b"\n  ")
+            parts.append(b",\n  " + _json_bytes(key) + b": " + body)
+        parts.append(b"\n}\n")
+        self.started = True
+        _write_stdout(b"".join(parts))
 
 async def run_fetch_all(
-    bbox: RegionContext, 
+    bbox: "RegionContext", 
     resolution: float, 
     year: int,
     dataset_id: str = "GOOGLE/SATELLITE_EMBEDDING/V1/ANNUAL",
     local_dir: Optional[str] = None,
-    adapters: Optional[Dict[str, DataProviderAdapter]] = None
+    adapters: Optional[Dict[str, "DataProviderAdapter"]] = None,
+    preview_path: Optional[str] = None,
+    on_result: Optional[Callable[[str, Optional[str]], None]] = None,
 ) -> Dict[str, Any]:
     """Fetch all data sources for the given bbox.
 
+    When adapters are built here, credentials are checked once up front
+    and providers without them are skipped and reported in ``errors``
+    rather than started.
+
     Args:
         bbox: Target bounding box.
         resolution: Requested master resolution.
@@ -44,82 +139,111 @@ async def run_fetch_all(
         dataset_id: Earth Engine dataset ID.
         local_dir: Path to directory for local raster ingestion.
         adapters: Optional dictionary of injected adapters (for testing).
+        preview_path: If set, an elevation preview is rendered to this
+            file in a worker thread as soon as SRTM arrives, overlapping
+            the remaining provider fetches.
+        on_result: Called with each provider's name and path (or None) as
+            soon as that provider finishes or is skipped.
 
     Returns:
         Dictionary with ``results`` (provider -> path or None) and
-        ``errors`` (provider -> error message) keys.
+        ``errors`` (provider -> error message) keys, plus ``preview``
+        (the saved image path) when a requested preview succeeded.
     """
+    # Providers known to be unusable before any request is made
+    skipped: Dict[str, str] = {}
+
     if adapters is None:
-        config = Config()
+        from deep_earth.http_client import get_session
+        from deep_earth.providers.earth_engine import EarthEngineAdapter
+        from deep_earth.providers.local import LocalFileAdapter
+        from deep_earth.providers.osm import OverpassAdapter
+        from deep_earth.providers.srtm import SRTMAdapter
+
+        config = get_config()
         creds = CredentialsManager()
         cache = CacheManager(config.cache_path)
+        session = await get_session()
 
         adapters = {
-            "srtm": SRTMAdapter(creds, cache),
-            "gee": EarthEngineAdapter(creds, cache),
-            "osm": OverpassAdapter(cache_dir=config.cache_path),
+            "srtm": SRTMAdapter(creds, cache, session=session),
+            "gee": EarthEngineAdapter(creds, cache, session=session),
+            "osm": OverpassAdapter(cache=cache, session=session),
             "local": LocalFileAdapter(cache)
         }
-    
-    # Extract adapters (safe cast as we know the keys if created above)
-    srtm_a = adapters["srtm"]
-    gee_a = cast(EarthEngineAdapter, adapters["gee"])
-    osm_a = cast(OverpassAdapter, adapters["osm"])
-    local_a = cast(LocalFileAdapter, adapters.get("local"))
+
+        valid = creds.validate()
+        if not valid["opentopography"]:
+            skipped["srtm"] = "OpenTopography API key missing"
+        if not valid["earth_engine"]:
+            skipped["embeddings"] = "Earth Engine credentials missing"
 
     results: Dict[str, Optional[str]] = {}
     errors: Dict[str, str] = {}
-
-    # Run fetches concurrently
-    # Note: validation logic can be moved here or kept in adapters
-    
-    tasks = [
-        srtm_a.fetch(bbox, 30),
-        gee_a.fetch(bbox, resolution, year, dataset_id),
-        osm_a.fetch(bbox, resolution)
-    ]
-    names = ["srtm", "embeddings", "osm_data"]
-
-    if local_dir and local_a:
-        tasks.append(local_a.fetch(bbox, resolution, local_dir))
-        names.append("local")
-
-    # Use return_exceptions=True to prevent one failure from aborting all
-    fetched_results = await asyncio.gather(*tasks, return_exceptions=True)
-
-    config_for_osm_cache = Config() # Need config for cache key generation if not injected
-
-    for name, result in zip(names, fetched_results):
-        if isinstance(result, Exception):
-            logger.error(f"Failed to fetch {name}: {result}")
-            out_name = "osm" if name == "osm_data" else name
-            results[out_name] = None
-            errors[out_name] = str(result)
-        elif result is None:
-            out_name = "osm" if name == "osm_data" else name
-            results[out_name] = None
-            if name != "local": # Local is optional depending on args, but if task ran and return None...
-                 errors[out_name] = "provider returned no data"
-        else:
-            if name == "osm_data":
-                # OSM fetch returns data dict, not path; look up
-                # cached path via the adapter's cache key.
-                cache_kp = CacheManager(Config().cache_path)
-                results["osm"] = cache_kp.get_path(
-                    osm_a.get_cache_key(bbox, resolution),
-                    "osm", "json",
-                )
+    preview_task: Optional["asyncio.Task[bool]"] = None
+
+    names: List[str] = []
+    pending: List[Tuple[str, Awaitable[Any]]] = []
+    for name, key, start in PROVIDERS:
+        if name == "local" and not (local_dir and adapters.get(key)):
+            continue
+        names.append(name)
+        if name not in skipped:
+            pending.append((name, start(
+                adapters[key], bbox, resolution, year, dataset_id, local_dir,
+            )))
+
+    for name, reason in skipped.items():
+        logger.warning(f"Skipping {name}: {reason}")
+        results[name] = None
+        errors[name] = reason
+        if on_result is not None:
+            on_result(name, None)
+
+    # Failures are yielded, not raised, so one provider can't abort the
+    # rest; results are handled as each provider finishes.
+    try:
+        async for name, result in as_completed_with_names(pending):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to fetch {name}: {result}")
+                results[name] = None
+                errors[name] = str(result)
+            elif result is None:
+                results[name] = None
+                if name != "local": # Local is optional depending on args, but if task ran and return None...
+                     errors[name] = "provider returned no data"
             else:
-                results[name] = cast(str, result)
-
-    output: Dict[str, Any] = {"results": results}
-    if errors:
-        output["errors"] = errors
-    return output
+                path = cast(str, result)
+                results[name] = path
+                if name == "srtm" and preview_path is not None:
+                    preview_task = asyncio.create_task(asyncio.to_thread(
+                        _render_preview, path, preview_path,
+                    ))
+            if on_result is not None:
+                on_result(name, results[name])
+
+        output: Dict[str, Any] = {
+            "results": {name: results[name] for name in names},
+        }
+        if errors:
+            output["errors"] = errors
+        if preview_path is not None:
+            if preview_task is None:
+                logger.warning("No SRTM data available for preview")
+            elif await preview_task:
+                output["preview"] = preview_path
+        return output
+    finally:
+        # Don't orphan a running preview if the fetch loop raised
+        if preview_task is not None and not preview_task.done():
+            preview_task.cancel()
 
 def main_logic(args: argparse.Namespace) -> Dict[str, Any]:
     """Main execution logic for the CLI.
 
+    The JSON summary is streamed to stdout: each provider's result is
+    written as it arrives, and errors and preview follow at the end.
+
     Args:
         args: Parsed command line arguments.
 
@@ -131,18 +255,27 @@ def main_logic(args: argparse.Namespace) -> Dict[str, Any]:
     """
     setup_logging()
 
+    import numpy as np
+
+    from deep_earth.region import RegionContext
+
     # Parse bbox: "lat_min,lon_min,lat_max,lon_max"
     try:
-        lat_min, lon_min, lat_max, lon_max = map(
-            float, args.bbox.split(","),
-        )
+        with warnings.catch_warnings():
+            # NumPy < 2.3 warns (rather than raising) on trailing junk
+            warnings.simplefilter("error", DeprecationWarning)
+            coords = np.fromstring(args.bbox, dtype=np.float64, sep=",")
+        if coords.size != 4:
+            raise ValueError(f"expected 4 values, got {coords.size}")
+        lat_min, lon_min, lat_max, lon_max = coords.tolist()
         bbox = RegionContext(lat_min, lat_max, lon_min, lon_max)
-    except ValueError:
+    except (ValueError, DeprecationWarning):
         raise CLIError(
             f"Invalid bbox format '{args.bbox}'. "
             "Expected 'lat_min,lon_min,lat_max,lon_max'"
         )
 
+    stream = _ResultStream()
     try:
         dataset_id = getattr(
             args, "dataset_id",
@@ -150,54 +283,87 @@ def main_logic(args: argparse.Namespace) -> Dict[str, Any]:
         )
         local_dir = getattr(args, "local_dir", None)
 
-        output = asyncio.run(
-            run_fetch_all(
-                bbox, args.resolution, args.year,
-                dataset_id, local_dir,
-            ),
-        )
+        async def fetch_and_close() -> Dict[str, Any]:
+            from deep_earth.http_client import close_session
+
+            try:
+                return await run_fetch_all(
+                    bbox, args.resolution, args.year,
+                    dataset_id, local_dir,
+                    preview_path=getattr(args, "preview", None),
+                    on_result=stream.add,
+                )
+            finally:
+                await close_session()
+
+        output = asyncio.run(fetch_and_close())
     except CLIError:
         raise
     except Exception as exc:
+        if stream.started:
+            # Keep the partly written document valid
+            stream.finish({"error": str(exc)})
+            raise CLIError(str(exc), reported=True) from exc
         raise CLIError(str(exc)) from exc
 
-    # Output JSON summary
-    print(json.dumps(output, indent=2))
+    # Close the streamed JSON summary
+    stream.finish(output)
 
-    # Optional preview
-    preview_path = getattr(args, "preview", None)
-    if preview_path is not None:
-        _run_preview(output, preview_path)
+    # The optional preview was rendered while the fetches ran
+    if "preview" in output:
+        print(f"Preview saved to {output['preview']}")
 
     return output
 
-def _run_preview(output: Dict[str, Any], preview_path: str) -> None:
-    """Generate an elevation preview from fetched SRTM data.
+def _read_preview_band(src: Any) -> Any:
+    """Read band 1 of ``src`` at no more than ``PREVIEW_MAX_DIM`` pixels a side.
+
+    Large DEMs are read decimated via ``out_shape``, which lets GDAL serve
+    the request from overviews (when present) instead of allocating the
+    full-resolution band only for the plot to downsample it.
 
     Args:
-        output: The structured output from ``run_fetch_all``.
-        preview_path: File path to save the preview image.
+        src: An open rasterio dataset.
+
+    Returns:
+        The (possibly decimated) band as a NumPy array.
     """
-    srtm_path = output.get("results", {}).get("srtm")
-    if not srtm_path:
-        logger.warning("No SRTM data available for preview")
-        return
+    scale = max(src.height, src.width) / PREVIEW_MAX_DIM
+    if scale <= 1:
+        return src.read(1)
+    out_shape = (
+        max(1, int(src.height / scale)),
+        max(1, int(src.width / scale)),
+    )
+    return src.read(1, out_shape=out_shape)
+
+def _render_preview(srtm_path: str, preview_path: str) -> bool:
+    """Render an elevation preview of ``srtm_path`` to ``preview_path``.
+
+    Safe to run in a worker thread; failures are logged, not raised.
+
+    Args:
+        srtm_path: Path to the fetched SRTM GeoTIFF.
+        preview_path: File path to save the preview image.
 
+    Returns:
+        True if the preview was written.
+    """
     try:
         import rasterio
         from deep_earth.preview import generate_preview
             
         with rasterio.open(srtm_path) as src:
-            dem = src.read(1)
+            dem = _read_preview_band(src)
         generate_preview(
             dem, mode="elevation",
             title="Deep Earth — Elevation Preview",
             output_path=preview_path,
         )
-        print(f"Preview saved to {preview_path}")
+        return True
     except Exception as exc:
         logger.error(f"Preview generation failed: {exc}")
-
+        return False
 
 def run_setup_wizard(args: argparse.Namespace) -> None:
     """Run the setup wizard for configuring Deep Earth."""
@@ -207,8 +373,26 @@ def run_setup_wizard(args: argparse.Namespace) -> None:
         output_path=getattr(args, 'output', None)
     )
 
-def main() -> None:
-    """Entry point for the CLI."""
+# Subcommands whose arguments are only built when selected
+COMMANDS = ("fetch", "setup")
+
+def _selected_command(argv: List[str]) -> Optional[str]:
+    """Return the first subcommand named in ``argv``, if any."""
+    return next((arg for arg in argv if arg in COMMANDS), None)
+
+@functools.lru_cache(maxsize=None)
+def _build_parser(command: Optional[str]) -> argparse.ArgumentParser:
+    """Build the CLI parser, populating only ``command``'s subparser.
+
+    Every subcommand is registered so top-level ``--help`` lists them,
+    but argument definitions are added only for the one being run.
+
+    Args:
+        command: The selected subcommand, or None for top-level usage.
+
+    Returns:
+        The argument parser.
+    """
     parser = argparse.ArgumentParser(
         description="Deep Earth Harmonizer - Multi-modal geospatial data synthesizer for Houdini"
     )
@@ -216,18 +400,14 @@ def main() -> None:
 
     # Fetch command (default behavior)
     fetch_parser = subparsers.add_parser("fetch", help="Fetch geospatial data for a region")
-    fetch_parser.add_argument("--bbox", type=str, required=True, help="lat_min,lon_min,lat_max,lon_max")
-    fetch_parser.add_argument("--resolution", type=float, default=10.0, help="Resolution in meters (default: 10.0)")
-    fetch_parser.add_argument("--year", type=int, default=2023, help="Embedding year (default: 2023)")
-    fetch_parser.add_argument("--dataset-id", type=str, default="GOOGLE/SATELLITE_EMBEDDING/V1/ANNUAL", help="Earth Engine Dataset ID")
-    fetch_parser.add_argument("--local-dir", type=str, help="Directory containing local raster files for ingestion")
-    fetch_parser.add_argument("--output-dir", type=str, help="Optional output directory (currently uses cache)")
-    fetch_parser.add_argument("--preview", type=str, metavar="FILE", help="Save an elevation preview image to FILE (e.g. preview.png)")
+    if command == "fetch":
+        _add_fetch_arguments(fetch_parser)
 
     # Setup command
     setup_parser = subparsers.add_parser("setup", help="Run the setup wizard")
-    setup_parser.add_argument("--generate-template", action="store_true", help="Generate template files without prompts")
-    setup_parser.add_argument("--output", "-o", type=str, help="Output path for generated files")
+    if command == "setup":
+        setup_parser.add_argument("--generate-template", action="store_true", help="Generate template files without prompts")
+        setup_parser.add_argument("--output", "-o", type=str, help="Output path for generated files")
 
     # Support legacy direct --bbox usage
     parser.add_argument("--bbox", type=str, help="lat_min,lon_min,lat_max,lon_max (legacy, use 'fetch' subcommand)")
@@ -237,7 +417,23 @@ def main() -> None:
     parser.add_argument("--local-dir", type=str, help=argparse.SUPPRESS)
     parser.add_argument("--output-dir", type=str, help=argparse.SUPPRESS)
 
-    args = parser.parse_args()
+    return parser
+
+def _add_fetch_arguments(fetch_parser: argparse.ArgumentParser) -> None:
+    """Add the ``fetch`` subcommand's arguments."""
+    fetch_parser.add_argument("--bbox", type=str, required=True, help="lat_min,lon_min,lat_max,lon_max")
+    fetch_parser.add_argument("--resolution", type=float, default=10.0, help="Resolution in meters (default: 10.0)")
+    fetch_parser.add_argument("--year", type=int, default=2023, help="Embedding year (default: 2023)")
+    fetch_parser.add_argument("--dataset-id", type=str, default="GOOGLE/SATELLITE_EMBEDDING/V1/ANNUAL", help="Earth Engine Dataset ID")
+    fetch_parser.add_argument("--local-dir", type=str, help="Directory containing local raster files for ingestion")
+    fetch_parser.add_argument("--output-dir", type=str, help="Optional output directory (currently uses cache)")
+    fetch_parser.add_argument("--preview", type=str, metavar="FILE", help="Save an elevation preview image to FILE (e.g. preview.png)")
+
+def main() -> None:
+    """Entry point for the CLI."""
+    argv = sys.argv[1:]
+    parser = _build_parser(_selected_command(argv))
+    args = parser.parse_args(argv)
 
     if args.command == "setup":
         run_setup_wizard(args)
@@ -245,7 +441,8 @@ def main() -> None:
         try:
             main_logic(args)
         except CLIError as exc:
-            print(json.dumps({"error": str(exc)}))
+            if not exc.reported:
+                _print_json({"error": str(exc)})
             sys.exit(exc.exit_code)
     else:
         parser.print_help()
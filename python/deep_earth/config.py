@@ -1,9 +1,26 @@
 import os
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Optional, Set
 
 logger = logging.getLogger(__name__)
 
+# Fallback Houdini preference directory, resolved once at import.
+_DEFAULT_HOUDINI_PREF_DIR = os.path.expanduser("~/.houdini")
+
+
+def houdini_user_pref_dir() -> str:
+    """
+    Return the Houdini user preference directory.
+
+    ``$HOUDINI_USER_PREF_DIR`` is read on each call so it can change at
+    runtime; the ``~/.houdini`` fallback is expanded only once.
+
+    Returns:
+        The preference directory path.
+    """
+    return os.environ.get("HOUDINI_USER_PREF_DIR", _DEFAULT_HOUDINI_PREF_DIR)
+
 class Config:
     """
     Global configuration manager for the Deep Earth package.
@@ -11,6 +28,9 @@ class Config:
     Attributes:
         cache_path (str): The directory used for caching fetched data.
     """
+
+    # Cache directories already created by this process.
+    _ensured: Set[str] = set()
     
     def __init__(self, cache_path: Optional[str] = None):
         """
@@ -25,15 +45,14 @@ class Config:
             self.cache_path = cache_path
         else:
             # Default to Houdini user pref dir
-            houdini_user_pref = os.environ.get(
-                "HOUDINI_USER_PREF_DIR", 
-                os.path.expanduser("~/.houdini")
+            self.cache_path = os.path.join(
+                houdini_user_pref_dir(), "deep_earth_cache"
             )
-            self.cache_path = os.path.join(houdini_user_pref, "deep_earth_cache")
             
-        if not os.path.exists(self.cache_path):
+        if self.cache_path not in Config._ensured:
             try:
-                os.makedirs(self.cache_path)
+                os.makedirs(self.cache_path, exist_ok=True)
+                Config._ensured.add(self.cache_path)
             except OSError as e:
                 logger.error(f"Failed to create cache directory {self.cache_path}: {e}")
 
@@ -44,3 +63,21 @@ class Config:
             "dem_plus_embed": 0.75,
             "all": 1.0
         }
+
+
+@lru_cache(maxsize=1)
+def get_config(cache_path: Optional[str] = None) -> Config:
+    """
+    Return a shared ``Config``, built on first use.
+
+    The environment is read once per process; call
+    ``get_config.cache_clear()`` to pick up a changed
+    ``HOUDINI_USER_PREF_DIR``.
+
+    Args:
+        cache_path: Optional custom cache path, as for ``Config``.
+
+    Returns:
+        The cached ``Config`` for ``cache_path``.
+    """
+    return Config(cache_path)
@@ -1,6 +1,40 @@
 import os
 import json
-from typing import Optional, Dict, Any, cast
+from typing import Optional, Dict, Any, Tuple, cast
+
+from deep_earth.config import houdini_user_pref_dir
+
+# Parsed credentials files keyed by path, stored with the (mtime_ns, size)
+# they were read at so an edited file is re-read on the next construction.
+_CRED_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _load_credentials_file(path: str) -> Dict[str, Any]:
+    """Parses a credentials file, reusing the last parse if it is unchanged.
+
+    The returned dict may be shared between managers and must not be
+    mutated.
+
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON.
+        IOError: If the file cannot be read.
+    """
+    try:
+        st = os.stat(path)
+        stamp: Optional[Tuple[int, int]] = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+
+    if stamp is not None:
+        cached = _CRED_CACHE.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
+    with open(path, "r") as f:
+        data = cast(Dict[str, Any], json.load(f))
+    if stamp is not None:
+        _CRED_CACHE[path] = (stamp, data)
+    return data
 
 
 class CredentialsManager:
@@ -31,19 +65,16 @@ class CredentialsManager:
             path = os.environ.get("DEEP_EARTH_CREDENTIALS_PATH")
         
         if path is None:
-            houdini_user_pref = os.environ.get(
-                "HOUDINI_USER_PREF_DIR", 
-                os.path.expanduser("~/.houdini")
+            path = os.path.join(
+                houdini_user_pref_dir(), "deep_earth", "credentials.json"
             )
-            path = os.path.join(houdini_user_pref, "deep_earth", "credentials.json")
         
         self.path = path
         
         # Load from file if it exists
         if os.path.exists(self.path):
             try:
-                with open(self.path, "r") as f:
-                    self.data = json.load(f)
+                self.data = _load_credentials_file(self.path)
             except (json.JSONDecodeError, IOError):
                 pass
     
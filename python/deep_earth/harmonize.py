@@ -1,16 +1,63 @@
 import logging
 import math
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 import numpy as np
 import rasterio
+from rasterio.crs import CRS
 from rasterio.warp import Resampling, reproject
+from rasterio.windows import Window
+from rasterio.windows import transform as window_transform
 
 from deep_earth.region import RegionContext
 
+try:
+    import cupy as cp
+    from cupyx.scipy import ndimage as cupy_ndimage
+    HAS_CUPY = True
+except ImportError:  # pragma: no cover - cupy is an optional accelerator
+    HAS_CUPY = False
+
 logger = logging.getLogger(__name__)
 
+# Edge length (pixels) of the destination tiles reprojected per GDAL call.
+RESAMPLE_TILE_SIZE = 1024
+
+# Spacing (destination pixels) of the exactly projected lattice that
+# resample_gpu interpolates source coordinates from, as GDAL's
+# approximate transformer does.
+GPU_LATTICE_STEP = 16
+
+# Default GDAL warp memory budget and block cache size, in MB.
+WARP_MEM_LIMIT_MB = 512
+GDAL_CACHEMAX_MB = 512
+
+# Sources with more pixels than this multiple of the master grid are warped
+# in strips rather than gathered: the nearest-pixel index warp allocates a
+# source-sized index array.
+NEAREST_GATHER_MAX_SOURCE_RATIO = 4
+
+# Source grids whose nearest-pixel index maps are kept (least recently
+# used first out); each holds an int32 and a bool master-sized grid.
+INDEX_CACHE_SIZE = 4
+
+
+def _dtype_kind(dtype: np.dtype) -> Optional[str]:
+    """Classifies a layer dtype as float ("f"), integer ("i") or string
+    ("s"); returns None for anything else."""
+    if np.issubdtype(dtype, np.floating):
+        return "f"
+    if np.issubdtype(dtype, np.integer):
+        return "i"
+    if np.issubdtype(dtype, np.str_) or dtype == object:
+        return "s"
+    return None
+
 
 @dataclass
 class FetchResult:
@@ -42,19 +89,35 @@ class Harmonizer:
         x_min, y_min, x_max, y_max (float): Bounding box in UTM.
         dst_transform (rasterio.Affine): Transform matrix for the master grid.
         dst_crs (str): Target Coordinate Reference System.
+        xs (np.ndarray): UTM easting of each column's cell center, shape (width,).
+        ys (np.ndarray): UTM northing of each row's cell center, shape (height,).
         layers (Dict[str, np.ndarray]): Dictionary of harmonized data layers.
+        num_threads (int): GDAL warp threads used by ``resample``.
+        warp_mem_limit (int): GDAL warp memory budget in MB.
     """
     
-    def __init__(self, coordinate_manager: RegionContext, resolution: float = 10.0):
+    def __init__(
+        self,
+        coordinate_manager: RegionContext,
+        resolution: float = 10.0,
+        num_threads: Optional[int] = None,
+        warp_mem_limit: int = WARP_MEM_LIMIT_MB,
+    ):
         """
         Initialize the Harmonizer.
 
         Args:
             coordinate_manager: Coordinate manager for the target region.
             resolution: Master resolution in meters.
+            num_threads: GDAL warp threads; defaults to all CPUs but one.
+            warp_mem_limit: GDAL warp memory budget in MB.
         """
         self.cm = coordinate_manager
         self.resolution = resolution
+        if num_threads is None:
+            num_threads = max(1, (os.cpu_count() or 1) - 1)
+        self.num_threads = num_threads
+        self.warp_mem_limit = warp_mem_limit
         
         # Calculate master grid dimensions in UTM
         utm_bbox = self.cm.get_utm_bbox()
@@ -67,21 +130,72 @@ class Harmonizer:
             self.x_min, self.y_min, self.x_max, self.y_max, self.width, self.height
         )
         self.dst_crs = f"EPSG:{self.cm.utm_epsg}"
+
+        # Cell-center coordinates as 1-D vectors (O(H+W) instead of H*W)
+        t = self.dst_transform
+        self.xs = t.c + (np.arange(self.width, dtype=np.float64) + 0.5) * t.a
+        self.ys = t.f + (np.arange(self.height, dtype=np.float64) + 0.5) * t.e
         
         self.layers: Dict[str, np.ndarray] = {}
+        self._layer_kinds: Dict[str, Optional[str]] = {}
+
+        # Contiguous warp buffers for multi-band strips, reused across
+        # resample calls and keyed by dtype; per thread, so concurrent
+        # resamples never share one.
+        self._scratch_local = threading.local()
+
+        # Nearest-pixel index maps keyed by source grid, bounded to
+        # INDEX_CACHE_SIZE entries; see _nearest_index.
+        self._index_cache: "OrderedDict[Tuple[Any, ...], Tuple[np.ndarray, np.ndarray, Window]]" = OrderedDict()
 
-    def resample(self, src_path: str, bands: Optional[Union[int, List[int]]] = None) -> np.ndarray:
+    def xy_meshgrid(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Returns (X, Y) cell-center coordinate grids of shape (height, width).
+
+        The grids are broadcast views of ``xs``/``ys`` and share their
+        memory; copy them before writing.
+        """
+        xx, yy = np.meshgrid(self.xs, self.ys, copy=False)
+        return xx, yy
+
+    def resample(
+        self,
+        src_path: str,
+        bands: Optional[Union[int, List[int]]] = None,
+        tile_size: int = RESAMPLE_TILE_SIZE,
+        out_path: Optional[str] = None,
+        resampling: Optional[Resampling] = None,
+    ) -> np.ndarray:
         """
         Resamples the given source GeoTIFF to the master grid.
 
+        The master grid is reprojected in full-width row strips of about
+        ``tile_size ** 2`` pixels each, so GDAL's working set is bounded
+        by one strip regardless of the region size.
+
+        Nearest-neighbour resampling skips the per-band warp: a source
+        pixel index is warped once per source grid (see
+        ``_nearest_index``) and each band is gathered through it. Sources
+        much larger than the master grid (``NEAREST_GATHER_MAX_SOURCE_RATIO``)
+        take the strip warp instead.
+
         Args:
             src_path: Path to the source GeoTIFF file.
             bands: Single band index, list of band indices, or None for all bands.
+            tile_size: Edge length in pixels of the square tile whose area
+                sets the strip size.
+            out_path: Optional file path; if given, the result is written
+                into a ``np.memmap`` at this location instead of RAM.
+            resampling: Resampling method. Defaults to nearest for 8-bit
+                integer sources (class maps, masks), whose values must not
+                be interpolated, and bilinear otherwise.
 
         Returns:
-            NumPy array of the resampled data.
+            NumPy array (or memmap) of the resampled data.
         """
-        with rasterio.open(src_path) as src:
+        with rasterio.Env(
+            GDAL_CACHEMAX=GDAL_CACHEMAX_MB, GDAL_NUM_THREADS="ALL_CPUS"
+        ), rasterio.open(src_path) as src:
             if bands is None:
                 # Auto-detect all bands
                 band_indices = list(range(1, src.count + 1))
@@ -98,21 +212,353 @@ class Harmonizer:
                 dst_shape = (self.height, self.width)
             else:
                 dst_shape = (band_count, self.height, self.width)
-                
-            destination = np.zeros(dst_shape, src.dtypes[0])
-            
-            reproject(
-                source=rasterio.band(src, band_indices),
-                destination=destination,
-                src_transform=src.transform,
-                src_crs=src.crs,
-                dst_transform=self.dst_transform,
-                dst_crs=self.dst_crs,
-                resampling=Resampling.bilinear if src.dtypes[0] != 'int' else Resampling.nearest
-            )
-            
+
+            # GDAL initializes every destination pixel (INIT_DEST), so
+            # there is no need to zero-fill up front.
+            destination: np.ndarray
+            if out_path is not None:
+                destination = np.memmap(
+                    out_path, dtype=src.dtypes[0], mode="w+", shape=dst_shape
+                )
+            else:
+                destination = np.empty(dst_shape, src.dtypes[0])
+
+            if resampling is None:
+                src_dtype = np.dtype(src.dtypes[0])
+                categorical = (
+                    np.issubdtype(src_dtype, np.integer)
+                    and src_dtype.itemsize == 1
+                )
+                resampling = (
+                    Resampling.nearest if categorical else Resampling.bilinear
+                )
+
+            window = self._aligned_window(src)
+            if window is not None:
+                # Source already lies on the master grid: plain read
+                inside = (
+                    window.col_off >= 0 and window.row_off >= 0
+                    and window.col_off + self.width <= src.width
+                    and window.row_off + self.height <= src.height
+                )
+                src.read(
+                    band_indices,
+                    window=window,
+                    out=destination.reshape(band_count, self.height, self.width),
+                    boundless=not inside,
+                    fill_value=src.nodata if src.nodata is not None else 0,
+                )
+                if isinstance(destination, np.memmap):
+                    destination.flush()
+                return destination
+
+            if (
+                resampling == Resampling.nearest
+                and src.width * src.height <= min(
+                    np.iinfo(np.int32).max,
+                    NEAREST_GATHER_MAX_SOURCE_RATIO * self.width * self.height,
+                )
+            ):
+                self._gather_nearest(src, band_indices, destination)
+                if isinstance(destination, np.memmap):
+                    destination.flush()
+                return destination
+
+            windows = self._tile_windows(tile_size)
+            scratch: Optional[np.ndarray] = None
+            strip_size = band_count * windows[0].height * self.width
+            for window in windows:
+                rows, cols = window.toslices()
+                tile = destination[..., rows, cols]
+                # Single-band strips are contiguous views of the grid;
+                # multi-band strips are strided, so warp those into a
+                # reused contiguous scratch buffer and copy back.
+                strided = not tile.flags.c_contiguous
+                if strided:
+                    if scratch is None:
+                        scratch = self._scratch_buffer(
+                            np.dtype(src.dtypes[0]), strip_size
+                        )
+                    tile = scratch[:tile.size].reshape(tile.shape)
+
+                reproject(
+                    source=rasterio.band(src, band_indices),
+                    destination=tile,
+                    src_transform=src.transform,
+                    src_crs=src.crs,
+                    dst_transform=window_transform(window, self.dst_transform),
+                    dst_crs=self.dst_crs,
+                    resampling=resampling,
+                    num_threads=self.num_threads,
+                    warp_mem_limit=self.warp_mem_limit,
+                )
+                if strided:
+                    destination[..., rows, cols] = tile
+
+            if isinstance(destination, np.memmap):
+                destination.flush()
+
             return destination
 
+    def resample_gpu(
+        self,
+        src_path: str,
+        bands: Optional[Union[int, List[int]]] = None,
+    ) -> np.ndarray:
+        """
+        Bilinearly resamples a source GeoTIFF to the master grid on a
+        CUDA GPU with CuPy.
+
+        Source coordinates are projected exactly (pyproj) on a lattice
+        every ``GPU_LATTICE_STEP`` destination pixels and interpolated
+        on the device for the cells in between. Each band is then
+        sampled with ``cupyx.scipy.ndimage.map_coordinates``. Cells
+        outside the source get its nodata value, or 0; unlike GDAL,
+        nodata pixels inside the source are not excluded from the
+        bilinear weights.
+
+        Args:
+            src_path: Path to the source GeoTIFF file.
+            bands: Single band index, list of band indices, or None for all bands.
+
+        Returns:
+            NumPy array of the resampled data, shaped like ``resample``'s.
+
+        Raises:
+            ImportError: If CuPy is not installed.
+        """
+        if not HAS_CUPY:
+            raise ImportError("resample_gpu requires cupy (pip install deep-earth[gpu])")
+
+        with rasterio.open(src_path) as src:
+            if bands is None:
+                band_indices = list(range(1, src.count + 1))
+            elif isinstance(bands, int):
+                band_indices = [bands]
+            else:
+                band_indices = list(bands)
+            data = src.read(band_indices)
+            src_transform, src_crs = src.transform, src.crs
+            fill = src.nodata if src.nodata is not None else 0
+
+        # Exact source pixel coordinates on a coarse destination lattice
+        lat_rows = np.unique(np.append(
+            np.arange(0, self.height, GPU_LATTICE_STEP), self.height - 1
+        ))
+        lat_cols = np.unique(np.append(
+            np.arange(0, self.width, GPU_LATTICE_STEP), self.width - 1
+        ))
+        xx, yy = np.meshgrid(self.xs[lat_cols], self.ys[lat_rows])
+        sx, sy = rasterio.warp.transform(
+            self.dst_crs, src_crs, xx.ravel(), yy.ravel()
+        )
+        src_cols, src_rows = ~src_transform * (np.asarray(sx), np.asarray(sy))
+        lattice = np.stack([src_rows, src_cols]).reshape(2, *xx.shape)
+
+        # Interpolate the lattice to every destination cell on the device
+        rows = cp.arange(self.height, dtype=cp.float64)
+        cols = cp.arange(self.width, dtype=cp.float64)
+        rr, cc = cp.meshgrid(
+            cp.interp(rows, cp.asarray(lat_rows), cp.arange(lat_rows.size)),
+            cp.interp(cols, cp.asarray(lat_cols), cp.arange(lat_cols.size)),
+            indexing="ij",
+        )
+        coords = cp.stack([
+            cupy_ndimage.map_coordinates(
+                cp.asarray(plane), [rr, cc], order=1
+            )
+            for plane in lattice
+        ])
+        # Pixel centres sit at +0.5 in the affine's pixel space. Cells in
+        # the outer half pixel of the source clamp to its edge, as GDAL's
+        # bilinear kernel does; cells beyond it get the fill value.
+        coords -= 0.5
+        inside = (
+            (coords[0] >= -0.5) & (coords[0] <= data.shape[1] - 0.5)
+            & (coords[1] >= -0.5) & (coords[1] <= data.shape[2] - 0.5)
+        )
+
+        out = np.empty((len(band_indices), self.height, self.width), data.dtype)
+        for i, band in enumerate(data):
+            sampled = cupy_ndimage.map_coordinates(
+                cp.asarray(band, dtype=cp.float32), coords,
+                order=1, mode="nearest",
+            )
+            sampled = cp.where(inside, sampled, fill)
+            if np.issubdtype(data.dtype, np.integer):
+                sampled = cp.rint(sampled)
+            out[i] = cp.asnumpy(sampled)
+
+        return out[0] if out.shape[0] == 1 else out
+
+    def _aligned_window(self, src: Any) -> Optional[Window]:
+        """
+        Returns the source window covering the master grid when ``src``
+        shares its CRS, pixel size and pixel alignment, else None.
+
+        Such sources need no warp: every master cell is exactly one
+        source pixel, offset by a whole number of rows and columns.
+
+        Args:
+            src: Open rasterio dataset.
+        """
+        s, t = src.transform, self.dst_transform
+        if src.crs is None or src.crs != CRS.from_user_input(self.dst_crs):
+            return None
+        if not (
+            s.b == t.b == 0 and s.d == t.d == 0
+            and math.isclose(s.a, t.a) and math.isclose(s.e, t.e)
+        ):
+            return None
+        col_off = (t.c - s.c) / s.a
+        row_off = (t.f - s.f) / s.e
+        if not (
+            math.isclose(col_off, round(col_off), abs_tol=1e-6)
+            and math.isclose(row_off, round(row_off), abs_tol=1e-6)
+        ):
+            return None
+        return Window(round(col_off), round(row_off), self.width, self.height)
+
+    def _nearest_index(
+        self, src: Any
+    ) -> Tuple[np.ndarray, np.ndarray, Window]:
+        """
+        Returns the master-grid map of nearest source pixels for ``src``.
+
+        The flat source pixel index is warped once with nearest
+        resampling and cached per source grid (CRS, transform, shape),
+        so every band and every file on the same grid reuses it. The
+        ``INDEX_CACHE_SIZE`` most recently used grids are kept.
+
+        Args:
+            src: Open rasterio dataset defining the source grid.
+
+        Returns:
+            Tuple of (index, outside, window): a (height, width) int32
+            array of flat pixel indices into ``window``, a boolean mask of
+            master-grid cells that fall outside the source, and the
+            smallest source window holding every referenced pixel.
+        """
+        key = (src.crs.to_wkt(), tuple(src.transform), src.height, src.width)
+        cached = self._index_cache.get(key)
+        if cached is not None:
+            self._index_cache.move_to_end(key)
+            return cached
+
+        src_index = np.arange(
+            src.height * src.width, dtype=np.int32
+        ).reshape(src.height, src.width)
+        index = np.empty((self.height, self.width), dtype=np.int32)
+        reproject(
+            source=src_index,
+            destination=index,
+            src_transform=src.transform,
+            src_crs=src.crs,
+            src_nodata=None,
+            dst_transform=self.dst_transform,
+            dst_crs=self.dst_crs,
+            dst_nodata=-1,
+            resampling=Resampling.nearest,
+            num_threads=self.num_threads,
+            warp_mem_limit=self.warp_mem_limit,
+        )
+        del src_index
+        outside = index < 0
+        if outside.all():
+            index[:] = 0
+            window = Window(0, 0, 1, 1)
+        else:
+            # Re-base the index on the bounding window of the pixels used
+            rows, cols = np.divmod(index, np.int32(src.width))
+            inside = ~outside
+            row_min, row_max = rows[inside].min(), rows[inside].max()
+            col_min, col_max = cols[inside].min(), cols[inside].max()
+            window = Window.from_slices(
+                (int(row_min), int(row_max) + 1),
+                (int(col_min), int(col_max) + 1),
+            )
+            rows -= row_min
+            cols -= col_min
+            index = rows * np.int32(window.width) + cols
+            index[outside] = 0
+        cached = self._index_cache[key] = (index, outside, window)
+        if len(self._index_cache) > INDEX_CACHE_SIZE:
+            self._index_cache.popitem(last=False)
+        return cached
+
+    def _gather_nearest(
+        self, src: Any, band_indices: List[int], destination: np.ndarray
+    ) -> None:
+        """
+        Fills ``destination`` by gathering source bands through the
+        cached nearest-pixel index.
+
+        Only the source window the index refers to is read. Cells outside
+        the source get its nodata value, or 0, as a nearest-neighbour
+        warp would write.
+
+        Args:
+            src: Open rasterio dataset to read bands from.
+            band_indices: 1-based band indices, in destination order.
+            destination: (height, width) or (bands, height, width) output.
+        """
+        index, outside, window = self._nearest_index(src)
+        fill = src.nodata if src.nodata is not None else 0
+        planes = destination.reshape(-1, self.height, self.width)
+        for plane, band in zip(planes, band_indices):
+            np.take(src.read(band, window=window).ravel(), index, out=plane)
+            plane[outside] = fill
+
+    def _scratch_buffer(self, dtype: np.dtype, size: int) -> np.ndarray:
+        """
+        Returns a flat buffer of at least ``size`` elements of ``dtype``.
+
+        The buffer is kept for later calls and only reallocated when a
+        larger one is needed. It is never handed back to callers.
+
+        Args:
+            dtype: Element type of the buffer.
+            size: Minimum number of elements.
+
+        Returns:
+            A 1-D ``np.ndarray``; its contents are undefined.
+        """
+        cache: Dict[np.dtype, np.ndarray] = self._scratch_cache
+        buf = cache.get(dtype)
+        if buf is None or buf.size < size:
+            buf = cache[dtype] = np.empty(size, dtype)
+        return buf
+
+    @property
+    def _scratch_cache(self) -> Dict[np.dtype, np.ndarray]:
+        """The calling thread's scratch buffers, keyed by dtype."""
+        cache = getattr(self._scratch_local, "buffers", None)
+        if cache is None:
+            cache = self._scratch_local.buffers = {}
+        return cast(Dict[np.dtype, np.ndarray], cache)
+
+    def _tile_windows(self, tile_size: int) -> List[Window]:
+        """
+        Splits the master grid into top-to-bottom full-width row strips.
+
+        Each strip holds about ``tile_size ** 2`` pixels. Full-width
+        strips keep single-band destinations contiguous and follow
+        GDAL's row-major block order.
+
+        Args:
+            tile_size: Edge length in pixels of the equivalent square tile.
+
+        Returns:
+            List of rasterio Windows covering the master grid.
+        """
+        if tile_size < 1:
+            raise ValueError(f"tile_size must be >= 1, got {tile_size}")
+        strip_rows = max(1, tile_size * tile_size // self.width)
+        return [
+            Window(0, row, self.width, min(strip_rows, self.height - row))
+            for row in range(0, self.height, strip_rows)
+        ]
+
     def add_layers(self, layers_dict: Dict[str, np.ndarray]) -> None:
         """
         Adds multiple layers to the harmonizer.
@@ -125,12 +571,29 @@ class Harmonizer:
             if data.shape != (self.height, self.width):
                 raise ValueError(f"Layer dimensions {data.shape} do not match master grid {(self.height, self.width)}")
             self.layers[name] = data
+            self._layer_kinds[name] = _dtype_kind(data.dtype)
+
+    def layer_kind(self, name: str) -> Optional[str]:
+        """
+        Returns the value kind of a layer: "f" (float), "i" (integer),
+        "s" (string) or None for unsupported dtypes.
+
+        The kind is classified once in ``add_layers``; layers assigned
+        to ``layers`` directly are classified on first lookup.
+
+        Args:
+            name: Name of a layer in ``layers``.
+        """
+        if name not in self._layer_kinds:
+            self._layer_kinds[name] = _dtype_kind(self.layers[name].dtype)
+        return self._layer_kinds[name]
 
     def process_fetch_result(
         self,
         result: Any,
         provider_name: str,
         bands: Optional[Union[int, List[int]]] = None,
+        resampling: Optional[Resampling] = None,
     ) -> Tuple[Optional[np.ndarray], FetchResult]:
         """Safely resample a provider result into a grid.
 
@@ -143,6 +606,8 @@ class Harmonizer:
                 (str), ``None``, or an ``Exception``.
             provider_name: Human-readable provider name for logging.
             bands: Band(s) to resample.
+            resampling: Resampling method; see ``resample`` for the
+                default.
 
         Returns:
             A tuple of (grid_or_None, FetchResult).
@@ -158,25 +623,63 @@ class Harmonizer:
             return None, FetchResult(provider_name, error=msg)
 
         try:
-            grid = self.resample(result, bands=bands)
+            grid = self.resample(result, bands=bands, resampling=resampling)
             return grid, FetchResult(provider_name, path=result)
         except Exception as e:
             msg = f"{provider_name} resample failed: {e}"
             logger.error(msg)
             return None, FetchResult(provider_name, error=msg)
 
+    def process_fetch_results(
+        self,
+        requests: Dict[str, Tuple[Any, Optional[Union[int, List[int]]]]],
+        max_workers: Optional[int] = None,
+    ) -> Dict[str, Tuple[Optional[np.ndarray], FetchResult]]:
+        """Resamples several provider results concurrently.
+
+        Each entry goes through ``process_fetch_result`` on its own
+        thread; GDAL releases the GIL while warping, so one provider's
+        reads and single-threaded warp stages overlap with another's.
+
+        Args:
+            requests: Mapping of provider name to ``(result, bands)``,
+                where ``result`` is a raw fetch return as accepted by
+                ``process_fetch_result``.
+            max_workers: Thread count; defaults to one per provider,
+                capped at the CPU count.
+
+        Returns:
+            Mapping of provider name to ``(grid_or_None, FetchResult)``.
+        """
+        if not requests:
+            return {}
+        if max_workers is None:
+            max_workers = min(len(requests), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                name: pool.submit(self.process_fetch_result, result, name, bands)
+                for name, (result, bands) in requests.items()
+            }
+            return {name: future.result() for name, future in futures.items()}
+
     def compute_quality_layer(self, height_grid: Optional[np.ndarray] = None, embed_grid: Optional[np.ndarray] = None) -> np.ndarray:
         """
         Computes a data quality score (0.0 - 1.0) for each grid cell.
         Uses weights defined in Config.
-        """
-        from deep_earth.config import Config
-        weights = Config().quality_weights
 
-        quality = np.zeros((self.height, self.width), dtype=np.float32)
+        Each source's contribution is recorded per cell as a bit in a
+        uint8 flag grid (DEM = 1, embeddings = 2, OSM = 4) and scores are
+        read from an 8-entry lookup table. DEM and embedding cells count
+        only where their values are finite; OSM covers the whole region
+        when present.
+
+        When every supplied grid is finite everywhere the score is the
+        same for all cells, and a read-only broadcast view of that single
+        value is returned; copy it before writing.
+        """
+        from deep_earth.config import get_config
+        weights = get_config().quality_weights
 
-        has_dem = height_grid is not None
-        has_embed = embed_grid is not None
         has_osm = "highway" in self.layers or "landuse" in self.layers
 
         # Additive weights derived from config totals:
@@ -187,11 +690,38 @@ class Harmonizer:
         osm_w = weights.get("dem_plus_osm", 0.5) - dem_w
         embed_w = weights.get("dem_plus_embed", 0.75) - dem_w
 
-        if has_dem:
-            quality += dem_w
-        if has_osm:
-            quality += osm_w
-        if has_embed:
-            quality += embed_w
+        lut = np.array(
+            [
+                dem_w * bool(f & 1) + embed_w * bool(f & 2) + osm_w * bool(f & 4)
+                for f in range(8)
+            ],
+            dtype=np.float32,
+        )
+
+        # Fully valid sources set their bit as a scalar; per-cell flags
+        # are only materialized once some source has gaps.
+        flags: Union[int, np.ndarray] = 4 if has_osm else 0
+        if height_grid is not None:
+            dem_valid = np.isfinite(height_grid)
+            if dem_valid.all():
+                flags |= 1
+            else:
+                flags = flags | dem_valid.view(np.uint8)
+        if embed_grid is not None:
+            if embed_grid.ndim == 3:
+                # Reduce band by band: a (bands, H, W) mask would be as
+                # large as the embedding itself in bytes per cell.
+                embed_valid = np.ones(embed_grid.shape[1:], dtype=bool)
+                band_valid = np.empty_like(embed_valid)
+                for band in embed_grid:
+                    embed_valid &= np.isfinite(band, out=band_valid)
+            else:
+                embed_valid = np.isfinite(embed_grid)
+            if embed_valid.all():
+                flags |= 2
+            else:
+                flags = flags | (embed_valid.view(np.uint8) << 1)
 
-        return quality
\ No newline at end of file
+        if isinstance(flags, int):
+            return np.broadcast_to(lut[flags], (self.height, self.width))
+        return cast(np.ndarray, lut[flags])
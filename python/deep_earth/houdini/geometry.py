@@ -1,4 +1,4 @@
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import numpy as np
 
@@ -6,29 +6,161 @@ from deep_earth.harmonize import Harmonizer
 from deep_earth.houdini.visualization import apply_biome_colors, compute_pca_colors
 from deep_earth.region import RegionContext
 
+# Layer kinds (see ``Harmonizer.layer_kind``) stored as volumes.
+_VOLUME_KINDS = ("f", "i")
+
+def _float32_bytes(values: np.ndarray) -> bytes:
+    """Packs values as C-ordered Float32 bytes for a HOM upload.
+
+    ``tobytes`` copies non-contiguous views (e.g. the transposed
+    embedding grid) straight into the buffer, so float32 input costs a
+    single copy. Uniform broadcast arrays, such as a constant quality
+    layer, are packed by repeating one value and never materialized.
+
+    Args:
+        values: Array of any numeric dtype and memory layout.
+    """
+    if values.size and not any(values.strides):
+        return np.float32(values.flat[0]).tobytes() * values.size
+    return values.astype(np.float32, copy=False).tobytes()
+
+def _set_point_attrib(geo: Any, name: str, values: np.ndarray) -> None:
+    """Uploads per-point numeric values as one raw buffer.
+
+    Avoids building a Python float per value via ``tolist()``: the array
+    is handed to Houdini as packed Float32 (Int8 for int8 data, Int32 for
+    other integer data).
+
+    Args:
+        geo: The Houdini geometry object (hou.Geometry).
+        name: Existing point attribute to fill.
+        values: Values in point order; tuple attributes are interleaved.
+    """
+    import hou
+
+    if values.dtype == np.int8:
+        geo.setPointIntAttribValuesFromString(
+            name,
+            values.tobytes(),
+            hou.numericData.Int8,
+        )
+    elif np.issubdtype(values.dtype, np.integer):
+        geo.setPointIntAttribValuesFromString(
+            name,
+            values.astype(np.int32, copy=False).tobytes(),
+            hou.numericData.Int32,
+        )
+    else:
+        geo.setPointFloatAttribValuesFromString(
+            name,
+            _float32_bytes(values),
+            hou.numericData.Float32,
+        )
+
+def _quantize_int8(embed_grid: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Symmetric per-band int8 quantization of an embedding grid.
+
+    NaN cells (no embedding coverage) are ignored when scaling a band and
+    quantize to 0; an all-NaN band gets a scale of 1.
+
+    Args:
+        embed_grid: (B, H, W) float embedding grid.
+
+    Returns:
+        Tuple of (quantized, scales): an (H, W, B) int8 array with bands
+        interleaved per cell, and (B,) float32 scales such that
+        ``embedding = quantized * scales``.
+    """
+    # fmax skips NaN without nanmax's all-NaN warning
+    scales = np.fmax.reduce(np.abs(embed_grid), axis=(1, 2))
+    scales = scales.astype(np.float32) / 127.0
+    scales[~np.isfinite(scales) | (scales == 0)] = 1.0
+    scaled = embed_grid.transpose(1, 2, 0) / scales
+    np.nan_to_num(scaled, copy=False, nan=0.0)
+    quantized = np.rint(scaled, out=scaled).astype(np.int8)
+    return quantized, scales
+
+def _inject_volumes(
+    geo: Any,
+    harmonizer: Harmonizer,
+    height_grid: np.ndarray,
+) -> None:
+    """Injects elevation and numeric layers as named Houdini volumes.
+
+    Each scalar grid becomes one ``W x H x 1`` volume laid in the XZ
+    plane over the same UTM extent as the point grid, so it carries no
+    per-cell Python objects. Voxels are uploaded as packed Float32;
+    integer layers (masks, class IDs) are stored exactly up to 2**24.
+
+    Args:
+        geo: The Houdini geometry object (hou.Geometry).
+        harmonizer: The Harmonizer instance containing resampled layers.
+        height_grid: (H, W) elevation grid, stored as the ``height`` volume.
+    """
+    import hou
+
+    t = harmonizer.dst_transform
+    width, height = harmonizer.width, harmonizer.height
+    # Voxel space spans [-1, 1]: index x follows columns (Easting), index
+    # y follows rows (Northing, signed by the transform), z is one cell.
+    center_x, center_z = t * (width / 2.0, height / 2.0)
+    xform = hou.Matrix4((
+        (t.a * width / 2.0, 0.0, t.d * width / 2.0, 0.0),
+        (t.b * height / 2.0, 0.0, t.e * height / 2.0, 0.0),
+        (0.0, abs(t.a) / 2.0, 0.0, 0.0),
+        (center_x, 0.0, center_z, 1.0),
+    ))
+
+    grids = {"height": height_grid}
+    for name, data in harmonizer.layers.items():
+        if harmonizer.layer_kind(name) in _VOLUME_KINDS:
+            grids[name] = data
+
+    geo.addAttrib(hou.attribType.Prim, "name", "")
+    for name, data in grids.items():
+        vol = geo.createVolume(width, height, 1)
+        vol.setTransform(xform)
+        vol.setAllVoxelsFromString(_float32_bytes(data))
+        vol.setAttribValue("name", name)
+
 def inject_heightfield(
     geo: Any,
     coordinate_manager: RegionContext,
     harmonizer: Harmonizer,
     height_grid: np.ndarray,
-    embed_grid: np.ndarray,
+    embed_grid: Optional[np.ndarray],
     viz_mode: Optional[str] = None,
-    provenance: Optional[Dict[str, Any]] = None
+    provenance: Optional[Dict[str, Any]] = None,
+    use_volumes: bool = True,
+    quantize_embeddings: bool = False,
 ) -> None:
-    """Injects elevation and embedding data as a Houdini point cloud.
+    """Injects elevation, embeddings and layers into Houdini geometry.
 
-    Creates one point per grid cell with UTM positions, elevation as
-    both the Y coordinate and a ``height`` attribute, 64-band embeddings,
-    and any additional harmonizer layers (OSM distance fields, etc.).
+    With ``use_volumes`` (the default), elevation and every float or
+    integer harmonizer layer are written as named volumes, and a point
+    per grid cell is only created when something needs one: embeddings,
+    a visualization mode, or string layers that have no volume form.
+    Without it, everything is a point attribute as before.
+
+    Points sit at UTM positions with elevation as the Y coordinate and
+    carry 64-band embeddings and any remaining harmonizer layers (OSM
+    distance fields, etc.).
 
     Args:
         geo: The Houdini geometry object (hou.Geometry).
         coordinate_manager: The RegionContext instance for the region.
         harmonizer: The Harmonizer instance containing resampled layers.
         height_grid: (H, W) elevation grid.
-        embed_grid: (64, H, W) embedding grid.
+        embed_grid: (B, H, W) embedding grid (B = 64 for satellite
+            embeddings), or None to skip embeddings.
         viz_mode: Optional visualization mode ('pca', 'biome').
         provenance: Optional metadata dictionary (e.g., source_year).
+        use_volumes: Store scalar float grids as volumes instead of
+            point attributes.
+        quantize_embeddings: Upload embeddings as int8 ``embedding_q8``
+            with a per-band ``embedding_scale`` detail attribute instead
+            of float ``embedding``; dequantize with
+            ``embedding_q8 * embedding_scale``.
     """
     import hou
     from datetime import datetime, timezone
@@ -36,69 +168,93 @@ def inject_heightfield(
     # 1. Clear existing geometry and start fresh
     geo.clear()
 
-    # 2. Create points at UTM grid locations
-    cols, rows = np.meshgrid(
-        np.arange(harmonizer.width), np.arange(harmonizer.height)
-    )
-    xs, ys = harmonizer.dst_transform * (cols + 0.5, rows + 0.5)
-
-    # X = UTM Easting, Y = Elevation, Z = UTM Northing
-    positions = np.stack([xs, height_grid, ys], axis=-1).reshape(-1, 3)
-    points = geo.createPoints(positions.tolist())
-
-    # 3. Explicit height attribute (mirrors Y position)
-    geo.addAttrib(hou.attribType.Point, "height", 0.0)
-    geo.setPointFloatAttribValues(
-        "height", height_grid.flatten().tolist()
-    )
-
-    # 4. Inject embeddings as point attribute
-    attr_name = "embedding"
-    geo.addAttrib(hou.attribType.Point, attr_name, (0.0,) * 64)
-    flattened_embeddings = embed_grid.transpose(1, 2, 0).reshape(-1, 64)
-    geo.setPointFloatAttribValues(
-        attr_name, flattened_embeddings.flatten().tolist()
-    )
-
-    # 5. Inject additional layers from Harmonizer (OSM, etc.)
-    for name, data in harmonizer.layers.items():
-        flattened_data = data.flatten()
-        if np.issubdtype(data.dtype, np.floating):
-            geo.addAttrib(hou.attribType.Point, name, 0.0)
-            geo.setPointFloatAttribValues(
-                name, flattened_data.tolist()
-            )
-        elif np.issubdtype(data.dtype, np.integer):
-            geo.addAttrib(hou.attribType.Point, name, 0)
-            geo.setPointIntAttribValues(
-                name, flattened_data.tolist()
+    if use_volumes:
+        _inject_volumes(geo, harmonizer, height_grid)
+        point_layers = {
+            name: data for name, data in harmonizer.layers.items()
+            if harmonizer.layer_kind(name) not in _VOLUME_KINDS
+        }
+        needs_points = bool(
+            embed_grid is not None or viz_mode or point_layers
+        )
+    else:
+        point_layers = dict(harmonizer.layers)
+        needs_points = True
+
+    if needs_points:
+        # 2. Create points at UTM grid locations
+        # X = UTM Easting, Y = Elevation, Z = UTM Northing. The grid is
+        # north-up, so the harmonizer's cached 1-D cell-centre vectors are
+        # broadcast straight into the packed buffer.
+        positions = np.empty(
+            (harmonizer.height, harmonizer.width, 3), dtype=np.float32
+        )
+        positions[..., 0] = harmonizer.xs[np.newaxis, :]
+        positions[..., 1] = height_grid
+        positions[..., 2] = harmonizer.ys[:, np.newaxis]
+
+        n_points = harmonizer.width * harmonizer.height
+        geo.createPoints([(0.0, 0.0, 0.0)] * n_points)
+        _set_point_attrib(geo, "P", positions)
+
+        # 3. Explicit height attribute (mirrors Y position)
+        if not use_volumes:
+            geo.addAttrib(hou.attribType.Point, "height", 0.0)
+            _set_point_attrib(geo, "height", height_grid)
+
+        # 4. Inject embeddings as point attribute (bands interleaved)
+        # Tuple size follows the band count; non-embedding datasets
+        # may have other than 64 bands.
+        if embed_grid is not None and quantize_embeddings:
+            n_bands = embed_grid.shape[0]
+            quantized, scales = _quantize_int8(embed_grid)
+            geo.addAttrib(hou.attribType.Point, "embedding_q8", (0,) * n_bands)
+            _set_point_attrib(geo, "embedding_q8", quantized)
+            geo.addAttrib(
+                hou.attribType.Global, "embedding_scale", (0.0,) * n_bands
             )
-        elif np.issubdtype(data.dtype, np.str_) or data.dtype == object:
-            geo.addAttrib(hou.attribType.Point, name, "")
-            geo.setPointStringAttribValues(
-                name, flattened_data.tolist()
+            geo.setGlobalAttribValue("embedding_scale", scales.tolist())
+        elif embed_grid is not None:
+            attr_name = "embedding"
+            geo.addAttrib(
+                hou.attribType.Point, attr_name, (0.0,) * embed_grid.shape[0]
             )
+            _set_point_attrib(geo, attr_name, embed_grid.transpose(1, 2, 0))
 
-    # 6. Visualization modes (Cd attribute)
-    if viz_mode:
-        geo.addAttrib(hou.attribType.Point, "Cd", (1.0, 1.0, 1.0))
-        colors = None
-
-        if viz_mode == "pca":
-            colors = compute_pca_colors(embed_grid)
-        elif viz_mode == "biome":
-            landuse = harmonizer.layers.get("landuse")
-            if landuse is not None:
-                colors = apply_biome_colors(landuse).reshape(-1, 3)
-            else:
-                natural = harmonizer.layers.get("natural")
-                if natural is not None:
-                    colors = apply_biome_colors(natural).reshape(-1, 3)
+        # 5. Inject additional layers from Harmonizer (OSM, etc.)
+        for name, data in point_layers.items():
+            kind = harmonizer.layer_kind(name)
+            if kind == "f":
+                geo.addAttrib(hou.attribType.Point, name, 0.0)
+                _set_point_attrib(geo, name, data)
+            elif kind == "i":
+                geo.addAttrib(hou.attribType.Point, name, 0)
+                _set_point_attrib(geo, name, data)
+            elif kind == "s":
+                geo.addAttrib(hou.attribType.Point, name, "")
+                geo.setPointStringAttribValues(
+                    name, data.ravel().tolist()
+                )
 
-        if colors is not None:
-            geo.setPointFloatAttribValues(
-                "Cd", colors.flatten().tolist()
-            )
+        # 6. Visualization modes (Cd attribute)
+        if viz_mode:
+            geo.addAttrib(hou.attribType.Point, "Cd", (1.0, 1.0, 1.0))
+            colors = None
+
+            if viz_mode == "pca" and embed_grid is not None:
+                colors = compute_pca_colors(embed_grid)
+            elif viz_mode == "biome":
+                landuse = harmonizer.layers.get("landuse")
+                if landuse is not None:
+                    colors = apply_biome_colors(landuse).reshape(-1, 3)
+                else:
+                    natural = harmonizer.layers.get("natural")
+                    if natural is not None:
+                        colors = apply_biome_colors(natural)
+                        colors = colors.reshape(-1, 3)
+
+            if colors is not None:
+                _set_point_attrib(geo, "Cd", colors)
 
     # 7. Metadata & provenance (detail attributes)
     timestamp = datetime.now(timezone.utc).isoformat()
@@ -1,4 +1,5 @@
-from typing import Dict, List, Optional, cast
+import functools
+from typing import Dict, List, Optional, Tuple, cast
 
 import numpy as np
 from sklearn.decomposition import PCA
@@ -20,17 +21,20 @@ def compute_pca_colors(embeddings: np.ndarray) -> np.ndarray:
     else:
         data = embeddings
         
-    # Apply PCA to reduce to 3 components
-    pca = PCA(n_components=3)
+    data = data.astype(np.float32, copy=False)
+
+    # Apply PCA to reduce to 3 components. Randomized SVD only needs the
+    # top-k subspace, which is far cheaper than a full SVD on (H*W, 64).
+    solver = "randomized" if min(data.shape) > 3 else "full"
+    pca = PCA(n_components=3, svd_solver=solver, random_state=0)
     pca_result = pca.fit_transform(data)
     
     # Normalize to [0, 1]
     # We use min-max scaling per component
     min_vals = pca_result.min(axis=0)
-    max_vals = pca_result.max(axis=0)
+    range_vals = np.ptp(pca_result, axis=0)
     
     # Avoid division by zero
-    range_vals = max_vals - min_vals
     range_vals[range_vals == 0] = 1.0
     
     normalized = (pca_result - min_vals) / range_vals
@@ -61,6 +65,35 @@ def get_biome_color_map() -> Dict[str, List[float]]:
         "sand": [0.9, 0.8, 0.5]
     }
 
+def _build_palette(
+    color_map: Dict[str, List[float]]
+) -> Tuple[np.ndarray, Dict[str, int]]:
+    """
+    Builds a (K+1, 3) palette and label -> row index for a color map.
+
+    The last palette row is the default grey for unknown labels.
+
+    Args:
+        color_map: Mapping from labels to RGB colors.
+
+    Returns:
+        Tuple of (palette, label_index).
+    """
+    labels = list(color_map.keys())
+    palette = np.array(
+        [color_map[label] for label in labels] + [[0.5, 0.5, 0.5]],
+        dtype=np.float32,
+    )
+    label_index = {label: i for i, label in enumerate(labels)}
+    return palette, label_index
+
+@functools.lru_cache(maxsize=1)
+def _default_biome_palette() -> Tuple[np.ndarray, Dict[str, int]]:
+    """Cached palette for ``get_biome_color_map()``; treat as read-only."""
+    palette, label_index = _build_palette(get_biome_color_map())
+    palette.setflags(write=False)
+    return palette, label_index
+
 def apply_biome_colors(landuse_data: np.ndarray, color_map: Optional[Dict[str, List[float]]] = None) -> np.ndarray:
     """
     Maps categorical landuse data (strings) to RGB colors.
@@ -73,16 +106,19 @@ def apply_biome_colors(landuse_data: np.ndarray, color_map: Optional[Dict[str, L
         NumPy array of shape (..., 3) representing RGB colors.
     """
     if color_map is None:
-        color_map = get_biome_color_map()
+        palette, label_index = _default_biome_palette()
+    else:
+        palette, label_index = _build_palette(color_map)
         
     shape = landuse_data.shape
-    flattened = landuse_data.flatten()
-    
-    # Default color: Grey
-    colors = np.full((len(flattened), 3), [0.5, 0.5, 0.5], dtype=np.float32)
-    
-    for label, color in color_map.items():
-        mask = flattened == label
-        colors[mask] = color
-        
+    flattened = landuse_data.ravel()
+    default_index = len(palette) - 1
+
+    # Resolve each distinct value once, then gather per pixel
+    uniques, inverse = np.unique(flattened, return_inverse=True)
+    lookup = np.array(
+        [label_index.get(u, default_index) for u in uniques], dtype=np.intp
+    )
+    colors = palette[lookup[inverse.ravel()]]
+
     return colors.reshape(shape + (3,))
@@ -0,0 +1,124 @@
+"""
+Shared aiohttp session for provider adapters.
+
+Adapters fetch through one pooled ``ClientSession`` so that repeated
+requests to the same host reuse TCP/TLS connections instead of paying a
+fresh handshake per fetch.  A session is bound to the event loop that
+created it; ``get_session`` transparently replaces it when called from a
+different loop (e.g. successive ``asyncio.run`` calls from the CLI).
+"""
+
+import asyncio
+import atexit
+import logging
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+# Connection pool limits for the shared session.
+CONNECTOR_LIMIT = 100
+CONNECTOR_LIMIT_PER_HOST = 10
+
+# Total timeout matches aiohttp's default so large GEE/SRTM downloads are
+# not cut short; connection setup fails fast.
+SESSION_TIMEOUT = aiohttp.ClientTimeout(total=300, connect=10)
+
+# Concurrent requests allowed per remote host. Overpass penalizes more
+# than two parallel queries from one client with HTTP 429.
+HOST_CONCURRENCY = 2
+
+# Hosts allowed more concurrent requests than ``HOST_CONCURRENCY``. Earth
+# Engine's high-volume endpoint is built for parallel tile downloads, so
+# it is bounded only by the connection pool's per-host limit.
+HOST_LIMITS: Dict[str, int] = {
+    "earthengine-highvolume.googleapis.com": CONNECTOR_LIMIT_PER_HOST,
+}
+
+_SESSION: Optional[aiohttp.ClientSession] = None
+_SESSION_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+_HOST_SEMAPHORES: Dict[str, asyncio.Semaphore] = {}
+_SEMAPHORE_LOOP: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """
+    Return the shared session for the running event loop.
+
+    The session is created on first use, and recreated if the previous
+    one was closed or belongs to another loop.
+
+    Returns:
+        An open ``aiohttp.ClientSession``.
+    """
+    global _SESSION, _SESSION_LOOP
+    loop = asyncio.get_running_loop()
+    if _SESSION is None or _SESSION.closed or _SESSION_LOOP is not loop:
+        _SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=CONNECTOR_LIMIT,
+                limit_per_host=CONNECTOR_LIMIT_PER_HOST,
+                enable_cleanup_closed=True,
+            ),
+            timeout=SESSION_TIMEOUT,
+        )
+        _SESSION_LOOP = loop
+    return _SESSION
+
+
+def host_semaphore(url: str) -> asyncio.Semaphore:
+    """
+    Return the semaphore limiting concurrent requests to ``url``'s host.
+
+    Semaphores are shared per host for the running event loop and are
+    discarded when a different loop asks for one.
+
+    Args:
+        url: Any URL on the target host.
+
+    Returns:
+        An ``asyncio.Semaphore`` admitting the host's ``HOST_LIMITS``
+        entry, or ``HOST_CONCURRENCY``, holders.
+    """
+    global _SEMAPHORE_LOOP
+    loop = asyncio.get_running_loop()
+    if _SEMAPHORE_LOOP is not loop:
+        _HOST_SEMAPHORES.clear()
+        _SEMAPHORE_LOOP = loop
+    host = urlsplit(url).netloc
+    sem = _HOST_SEMAPHORES.get(host)
+    if sem is None:
+        limit = HOST_LIMITS.get(host, HOST_CONCURRENCY)
+        sem = _HOST_SEMAPHORES[host] = asyncio.Semaphore(limit)
+    return sem
+
+
+async def close_session() -> None:
+    """Close the shared session if it belongs to the running loop."""
+    global _SESSION, _SESSION_LOOP
+    if _SESSION is None or _SESSION_LOOP is not asyncio.get_running_loop():
+        return
+    session, _SESSION, _SESSION_LOOP = _SESSION, None, None
+    if not session.closed:
+        await session.close()
+
+
+@atexit.register
+def _close_session_at_exit() -> None:
+    """Best-effort close of a session left open on a still-usable loop."""
+    loop = _SESSION_LOOP
+    if _SESSION is None or loop is None or loop.is_closed():
+        return
+    try:
+        if loop.is_running():
+            asyncio.run_coroutine_threadsafe(
+                close_session(), loop,
+            ).result(timeout=5)
+        else:
+            loop.run_until_complete(close_session())
+    except Exception as e:
+        logger.debug(f"Failed to close shared HTTP session at exit: {e}")
+
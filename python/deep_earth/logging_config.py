@@ -2,6 +2,8 @@ import logging
 import os
 from typing import Optional, List
 
+from deep_earth.config import houdini_user_pref_dir
+
 def setup_logging(level: Optional[int] = None, log_file: Optional[str] = None) -> None:
     """
     Configures centralized logging for the Deep Earth package.
@@ -15,11 +17,7 @@ def setup_logging(level: Optional[int] = None, log_file: Optional[str] = None) -
         level = getattr(logging, env_level, logging.INFO)
 
     if log_file is None:
-        houdini_user_pref = os.environ.get(
-            "HOUDINI_USER_PREF_DIR", 
-            os.path.expanduser("~/.houdini")
-        )
-        log_file = os.path.join(houdini_user_pref, "deep_earth.log")
+        log_file = os.path.join(houdini_user_pref_dir(), "deep_earth.log")
 
     handlers: List[logging.Handler] = [logging.StreamHandler()]
     
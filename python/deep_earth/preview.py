@@ -2,19 +2,32 @@ import logging
 import os
 from typing import Any, Dict, Optional, Union
 
-import matplotlib
 import numpy as np
 
-# Use non-interactive backend when no display is available or when
-# saving to file, so preview works in CI / headless servers.
-if os.environ.get("DISPLAY") is None and os.environ.get("WAYLAND_DISPLAY") is None:
-    matplotlib.use("Agg")
-import matplotlib.pyplot as plt
-
 from deep_earth.houdini.visualization import apply_biome_colors, compute_pca_colors
 
 logger = logging.getLogger(__name__)
 
+def _get_pyplot() -> Any:
+    """Imports matplotlib.pyplot on first use.
+
+    Deferred so that importing this module (e.g. from the CLI or Houdini)
+    does not pay matplotlib's import and backend start-up cost unless a
+    preview is actually drawn.
+
+    Returns:
+        The ``matplotlib.pyplot`` module.
+    """
+    import matplotlib
+
+    # Use non-interactive backend when no display is available or when
+    # saving to file, so preview works in CI / headless servers.
+    if os.environ.get("DISPLAY") is None and os.environ.get("WAYLAND_DISPLAY") is None:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    return plt
+
 def generate_preview(
     data: Union[np.ndarray, Dict[str, np.ndarray]],
     mode: str = "elevation",
@@ -34,6 +47,7 @@ def generate_preview(
     Raises:
         ValueError: If the mode is unknown or data shape is incorrect.
     """
+    plt = _get_pyplot()
     plt.figure(figsize=(10, 8))
     
     if mode == "elevation":
@@ -2,22 +2,53 @@ import asyncio
 import logging
 import os
 import time
-from typing import Any, Dict, Optional, Union, cast
+from contextlib import ExitStack
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 import aiohttp
 import ee
 import numpy as np
 import rasterio
 from google.cloud import storage
+from rasterio.merge import merge
 
 from deep_earth.cache import CacheManager
 from deep_earth.credentials import CredentialsManager
+from deep_earth.http_client import get_session
 from deep_earth.providers.base import DataProviderAdapter
 from deep_earth.region import RegionContext
-from deep_earth.retry import fetch_with_retry
+from deep_earth.retry import download_with_retry
 
 logger = logging.getLogger(__name__)
 
+# High-volume endpoint for automated, parallel requests.
+HIGH_VOLUME_URL = "https://earthengine-highvolume.googleapis.com"
+
+# Export format name accepted by getDownloadURL and batch exports.
+EXPORT_FORMAT = "GEO_TIFF"
+
+# Tile side for parallel direct downloads. At 64 float32 bands a
+# 384 px tile is ~38 MB, under getDownloadURL's 48 MB request limit.
+DIRECT_TILE_PX = 384
+
+# Regions needing more direct-download tiles than this use batch export.
+MAX_DIRECT_TILES = 32
+
+
+def _merge_geotiffs(paths: List[str], dst_path: str) -> None:
+    """Mosaic GeoTIFF tiles sharing a CRS into one GeoTIFF on disk.
+
+    rasterio writes the mosaic to ``dst_path`` window by window, so the
+    tiles and the mosaic are never held in memory whole.
+
+    Args:
+        paths: GeoTIFF tile files.
+        dst_path: File to write the mosaic to.
+    """
+    with ExitStack() as stack:
+        datasets = [stack.enter_context(rasterio.open(p)) for p in paths]
+        merge(datasets, dst_path=dst_path, dst_kwds={"driver": "GTiff"})
+
 
 class EarthEngineAdapter(DataProviderAdapter):
     """
@@ -40,9 +71,8 @@ class EarthEngineAdapter(DataProviderAdapter):
             async def wrapper(self, *args, **kwargs):
                 if not self._ensure_initialized():
                     logger.warning(
-                        f"Skipping {func.__name__} — "
-                        f"initialization failed: "
-                        f"{self._init_error}"
+                        "Skipping %s — initialization failed: %s",
+                        func.__name__, self._init_error,
                     )
                     return None
                 return await func(self, *args, **kwargs)
@@ -51,26 +81,35 @@ class EarthEngineAdapter(DataProviderAdapter):
             def wrapper(self, *args, **kwargs):
                 if not self._ensure_initialized():
                     logger.warning(
-                        f"Skipping {func.__name__} — "
-                        f"initialization failed: "
-                        f"{self._init_error}"
+                        "Skipping %s — initialization failed: %s",
+                        func.__name__, self._init_error,
                     )
                     return None if func.__name__ == 'fetch' else False
                 return func(self, *args, **kwargs)
         return wrapper
 
-    def __init__(self, credentials: CredentialsManager, cache: CacheManager):
+    def __init__(self, credentials: CredentialsManager, cache: CacheManager, session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize the Earth Engine adapter.
 
         Args:
             credentials: Credentials manager instance.
             cache: Cache manager instance.
+            session: HTTP session to download with. Defaults to the shared
+                session from ``deep_earth.http_client``.
         """
         self.credentials = credentials
         self.cache = cache
+        self.session = session
         self._initialized = False
         self._init_error: Optional[str] = None
+        # Image counts per (asset_id, year), so repeat fetches skip the
+        # blocking size() round trip.
+        self._collection_sizes: Dict[Tuple[str, int], int] = {}
+
+    def reset(self) -> None:
+        """Forgets memoized collection sizes so the next fetch re-queries them."""
+        self._collection_sizes.clear()
 
     def _ensure_initialized(self) -> bool:
         """Lazily initialize Earth Engine only when needed.
@@ -90,12 +129,13 @@ class EarthEngineAdapter(DataProviderAdapter):
         if service_account and key_file:
             try:
                 ee_creds = ee.ServiceAccountCredentials(service_account, key_file) # type: ignore
-                ee.Initialize(ee_creds)
+                # Positional: older earthengine-api releases name it opt_url
+                ee.Initialize(ee_creds, HIGH_VOLUME_URL)
                 self._initialized = True
                 return True
             except Exception as e:
                 self._init_error = str(e)
-                logger.error(f"Failed to initialize Earth Engine: {e}")
+                logger.error("Failed to initialize Earth Engine: %s", e)
                 return False
         else:
             self._init_error = "Earth Engine credentials missing"
@@ -132,9 +172,28 @@ class EarthEngineAdapter(DataProviderAdapter):
             ee.ImageCollection("GOOGLE/SATELLITE_EMBEDDING/V1/ANNUAL").limit(1).getInfo() # type: ignore
             return True
         except Exception as e:
-            logger.warning(f"Earth Engine credential validation failed: {e}")
+            logger.warning("Earth Engine credential validation failed: %s", e)
             return False
 
+    async def _collection_size(self, asset_id: str, year: int) -> int:
+        """Returns how many images ``asset_id`` holds for ``year``.
+
+        The count is memoized per (asset_id, year) on the adapter; the
+        date filter is not spatial, so it holds for every bbox. Failed
+        queries raise and are not cached.
+
+        Args:
+            asset_id: Earth Engine ImageCollection asset ID.
+            year: Calendar year to filter on.
+        """
+        key = (asset_id, year)
+        if key not in self._collection_sizes:
+            collection = ee.ImageCollection(asset_id).filterDate(f"{year}-01-01", f"{year}-12-31") # type: ignore
+            self._collection_sizes[key] = int(
+                await asyncio.to_thread(collection.size().getInfo)
+            )
+        return self._collection_sizes[key]
+
     @require_ee
     async def fetch(self, bbox: RegionContext, resolution: float, year: int = 2023, asset_id: str = "GOOGLE/SATELLITE_EMBEDDING/V1/ANNUAL") -> Optional[str]:
         """
@@ -149,19 +208,19 @@ class EarthEngineAdapter(DataProviderAdapter):
         # But wait, I am replacing the method body here. I should have replaced the definition line to add @require_ee
         # I will do that in a separate replacement chunk.
         
-        logger.info(f"Fetching EarthEngine data ({asset_id}) for bbox {bbox} at resolution {resolution}, year {year}")
+        logger.info("Fetching EarthEngine data (%s) for bbox %s at resolution %s, year %s", asset_id, bbox, resolution, year)
         cache_key = self.get_cache_key(bbox, resolution, year, asset_id)
 
         if self.cache.exists(cache_key, category="embeddings"):
-            logger.debug(f"Cache hit for {cache_key}")
+            logger.debug("Cache hit for %s", cache_key)
             path = self.cache.get_path(cache_key, category="embeddings")
             if path:
                 return path
 
-        logger.debug(f"Cache miss for {cache_key}")
+        logger.debug("Cache miss for %s", cache_key)
         try:
             # Define geometry
-            region = ee.Geometry.Rectangle([bbox.lon_min, bbox.lat_min, bbox.lon_max, bbox.lat_max]) # type: ignore
+            region = ee.Geometry.Rectangle(list(bbox.as_wsen())) # type: ignore
 
             # Handle different collection types
             start_date = f"{year}-01-01"
@@ -173,52 +232,137 @@ class EarthEngineAdapter(DataProviderAdapter):
             # A more robust way is to check the asset type or just try to filter.
             
             try:
-                collection = ee.ImageCollection(asset_id).filterDate(start_date, end_date) # type: ignore
-                if collection.size().getInfo() == 0:
-                     logger.warning(f"No data found for {asset_id} in year {year}")
+                if await self._collection_size(asset_id, year) == 0:
+                     logger.warning("No data found for %s in year %s", asset_id, year)
                      return None
+                collection = ee.ImageCollection(asset_id).filterDate(start_date, end_date) # type: ignore
                 image = collection.mosaic().clip(region)
             except Exception:
                 # Fallback if it's a single image or non-temporal
-                logger.debug(f"Assuming {asset_id} is a single image or non-filtered collection")
+                logger.debug("Assuming %s is a single image or non-filtered collection", asset_id)
                 image = ee.Image(asset_id).clip(region)
 
             # Reproject to UTM
             dst_crs = f"EPSG:{bbox.utm_epsg}"
             image = image.reproject(crs=dst_crs, scale=resolution)
 
-            # Check area size to decide export method
-            area_km2 = bbox.area_km2()
-            if area_km2 < 10.0:
-                return await self._fetch_direct(image, region, cache_key)
-            else:
-                return await self._fetch_batch(image, region, cache_key)
+            # Choose the export method by how many download tiles the
+            # region needs at this resolution
+            tiles = bbox.get_tiles(DIRECT_TILE_PX * resolution / 1000.0)
+            if len(tiles) <= 1:
+                return await self._fetch_direct(
+                    image, region, cache_key, crs=dst_crs, scale=resolution,
+                )
+            if len(tiles) <= MAX_DIRECT_TILES:
+                return await self._fetch_tiled(
+                    image, tiles, dst_crs, resolution, region, cache_key,
+                )
+            return await self._fetch_batch(
+                image, region, cache_key, crs=dst_crs, scale=resolution,
+            )
         except Exception as e:
-            logger.error(f"GEE fetch failed: {e}")
+            logger.error("GEE fetch failed: %s", e)
             return None
 
-    async def _fetch_direct(self, image: Any, region: Any, cache_key: str) -> Optional[str]:
-        """Small region: use getDownloadURL for immediate results."""
+    async def _fetch_direct(
+        self,
+        image: Any,
+        region: Any,
+        cache_key: str,
+        crs: Optional[str] = None,
+        scale: Optional[float] = None,
+    ) -> Optional[str]:
+        """Small region: use getDownloadURL for immediate results.
+
+        ``fetch`` passes the CRS and scale it reprojected the image to;
+        only when they are omitted are they read back from the image's
+        projection, which costs a server round-trip each. All Earth
+        Engine calls run in a worker thread so the event loop is not
+        blocked.
+        """
         try:
-            url = image.getDownloadURL({
-                'scale': image.projection().nominalScale().getInfo(),
-                'crs': image.projection().crs().getInfo(),
-                'format': 'GeoTIFF'
+            if scale is None:
+                scale = await asyncio.to_thread(
+                    image.projection().nominalScale().getInfo
+                )
+            if crs is None:
+                crs = await asyncio.to_thread(image.projection().crs().getInfo)
+            url = await asyncio.to_thread(image.getDownloadURL, {
+                'scale': scale,
+                'crs': crs,
+                'format': EXPORT_FORMAT
             })
 
-            logger.info(f"Downloading GEE direct export from {url}")
-            async with aiohttp.ClientSession() as session:
-                data = await fetch_with_retry(session, url)
-                return self.cache.save(cache_key, data, category="embeddings")
+            logger.info("Downloading GEE direct export from %s", url)
+            session = self.session or await get_session()
+            part_path = self.cache.partial_path(cache_key, "embeddings")
+            await download_with_retry(session, url, part_path)
+            return self.cache.save_file(cache_key, part_path, category="embeddings")
         except Exception as e:
             if "Payload too large" in str(e) or "400" in str(e):
                 logger.warning("Direct download failed due to size. Falling back to batch export.")
-                return await self._fetch_batch(image, region, cache_key)
-            logger.error(f"GEE Direct Export failed: {e}")
+                return await self._fetch_batch(
+                    image, region, cache_key, crs=crs, scale=scale,
+                )
+            logger.error("GEE Direct Export failed: %s", e)
             return None
 
-    async def _fetch_batch(self, image: Any, region: Any, cache_key: str) -> Optional[str]:
-        """Large region: use Export to GCS and poll for completion."""
+    async def _fetch_tiled(self, image: Any, tiles: List[RegionContext], crs: str, scale: float, region: Any, cache_key: str) -> Optional[str]:
+        """Medium region: download tiles in parallel and mosaic them.
+
+        Download URLs are requested concurrently from worker threads and
+        each tile is streamed to its own scratch file in the cache; the
+        mosaic is merged from those files straight to disk. Downloads run
+        up to the high-volume host's ``http_client.HOST_LIMITS`` entry at
+        a time.
+        """
+        tile_paths = [
+            self.cache.partial_path(f"{cache_key}_tile{i}", "embeddings")
+            for i in range(len(tiles))
+        ]
+        try:
+            session = self.session or await get_session()
+
+            async def fetch_tile(tile: RegionContext, path: str) -> None:
+                url = await asyncio.to_thread(image.getDownloadURL, {
+                    'region': ee.Geometry.Rectangle(list(tile.as_wsen())), # type: ignore
+                    'scale': scale,
+                    'crs': crs,
+                    'format': EXPORT_FORMAT
+                })
+                await download_with_retry(session, url, path)
+
+            logger.info("Downloading GEE region as %s tiles", len(tiles))
+            await asyncio.gather(*(
+                fetch_tile(t, p) for t, p in zip(tiles, tile_paths)
+            ))
+            part_path = self.cache.partial_path(cache_key, "embeddings")
+            await asyncio.to_thread(_merge_geotiffs, tile_paths, part_path)
+            return self.cache.save_file(cache_key, part_path, category="embeddings")
+        except Exception as e:
+            logger.warning("Tiled GEE download failed: %s. Falling back to batch export.", e)
+            return await self._fetch_batch(
+                image, region, cache_key, crs=crs, scale=scale,
+            )
+        finally:
+            for path in tile_paths:
+                if os.path.exists(path):
+                    os.remove(path)
+
+    async def _fetch_batch(
+        self,
+        image: Any,
+        region: Any,
+        cache_key: str,
+        crs: Optional[str] = None,
+        scale: Optional[float] = None,
+    ) -> Optional[str]:
+        """Large region: use Export to GCS and poll for completion.
+
+        As in ``_fetch_direct``, the CRS and scale are only read back from
+        the image's projection when omitted, and every Earth Engine call
+        runs in a worker thread.
+        """
         bucket = self.credentials.get_gcs_bucket()
         if not bucket:
             logger.warning(
@@ -229,30 +373,36 @@ class EarthEngineAdapter(DataProviderAdapter):
 
         file_name = f"{cache_key}_{int(time.time())}"
         try:
+            if scale is None:
+                scale = await asyncio.to_thread(
+                    image.projection().nominalScale().getInfo
+                )
+            if crs is None:
+                crs = await asyncio.to_thread(image.projection().crs().getInfo)
             task = ee.batch.Export.image.toCloudStorage(
                 image=image,
                 description=f"DeepEarth_{cache_key}",
                 bucket=bucket,
                 fileNamePrefix=file_name,
-                scale=image.projection().nominalScale().getInfo(),
-                crs=image.projection().crs().getInfo(),
-                format='GeoTIFF'
+                scale=scale,
+                crs=crs,
+                fileFormat=EXPORT_FORMAT
             )
 
-            task.start()
-            logger.info(f"Started GEE batch export task {task.id} to gs://{bucket}/{file_name}.tif")
+            await asyncio.to_thread(task.start)
+            logger.info("Started GEE batch export task %s to gs://%s/%s.tif", task.id, bucket, file_name)
 
             # Poll for completion
             status = await self._poll_task(task)
             if status['state'] != 'COMPLETED':
                 error_msg = status.get('error_message', 'Unknown error')
-                logger.error(f"GEE Export task failed: {error_msg}")
+                logger.error("GEE Export task failed: %s", error_msg)
                 return None
 
             # Download from GCS
             return await self._download_from_gcs(bucket, f"{file_name}.tif", cache_key)
         except Exception as e:
-            logger.error(f"GEE batch export failed: {e}")
+            logger.error("GEE batch export failed: %s", e)
             return None
 
     async def _poll_task(self, task: Any, timeout_secs: int = 600) -> Dict[str, Any]:
@@ -261,17 +411,17 @@ class EarthEngineAdapter(DataProviderAdapter):
         wait_secs: float = 5.0
         
         while True:
-            status = task.status()
+            status = await asyncio.to_thread(task.status)
             state = status['state']
             
             if state in ['COMPLETED', 'FAILED', 'CANCELLED']:
                 return cast(Dict[str, Any], status)
             
             if time.time() - start_time > timeout_secs:
-                task.cancel()
+                await asyncio.to_thread(task.cancel)
                 raise TimeoutError(f"GEE export task {task.id} timed out after {timeout_secs}s")
             
-            logger.debug(f"GEE Task {task.id} state: {state}. Waiting {wait_secs}s...")
+            logger.debug("GEE Task %s state: %s. Waiting %ss...", task.id, state, wait_secs)
             await asyncio.sleep(wait_secs)
             wait_secs = min(wait_secs * 1.5, 30) # Exponential backoff for polling
 
@@ -285,16 +435,17 @@ class EarthEngineAdapter(DataProviderAdapter):
         bucket = client.bucket(bucket_name)
         blob = bucket.blob(blob_name)
         
-        logger.info(f"Downloading {blob_name} from GCS bucket {bucket_name}")
-        data = blob.download_as_bytes()
+        logger.info("Downloading %s from GCS bucket %s", blob_name, bucket_name)
+        part_path = self.cache.partial_path(cache_key, "embeddings")
+        await asyncio.to_thread(blob.download_to_filename, part_path)
         
         # Cleanup GCS
         try:
             blob.delete()
         except Exception as e:
-            logger.warning(f"Failed to delete blob {blob_name} from GCS: {e}")
+            logger.warning("Failed to delete blob %s from GCS: %s", blob_name, e)
             
-        return self.cache.save(cache_key, data, category="embeddings")
+        return self.cache.save_file(cache_key, part_path, category="embeddings")
 
     def transform_to_grid(self, data_path: str, target_grid: Any) -> np.ndarray:
         """Loads the multi-band GeoTIFF and returns a NumPy array."""
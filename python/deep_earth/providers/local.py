@@ -1,9 +1,12 @@
+import asyncio
 import glob
 import logging
 import os
 import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import rasterio
@@ -15,6 +18,56 @@ from deep_earth.region import RegionContext
 
 logger = logging.getLogger(__name__)
 
+# Source files warped at once. Each warp holds a full destination grid, so
+# this caps peak memory independently of the machine's core count.
+MAX_WARP_WORKERS = 4
+
+
+def _reproject_one(
+    fpath: str,
+    count: int,
+    dtype: str,
+    shape: Tuple[int, int],
+    dst_transform: Any,
+    dst_crs: str,
+) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Warp one source raster onto the target grid.
+
+    Runs in a worker thread; GDAL releases the GIL while warping. The
+    coverage mask comes from an alpha band written by the same warp.
+
+    Args:
+        fpath: Source raster path.
+        count: Number of bands to read.
+        dtype: Destination data type.
+        shape: Destination (height, width).
+        dst_transform: Destination affine transform.
+        dst_crs: Destination CRS.
+
+    Returns:
+        The warped ``(count, height, width)`` array and a boolean
+        ``(height, width)`` mask of the pixels the source covers, or None
+        if the file could not be processed.
+    """
+    try:
+        with rasterio.open(fpath) as src:
+            warped = np.zeros((count + 1, *shape), dtype=dtype)
+            rasterio.warp.reproject(
+                source=rasterio.band(src, list(range(1, count + 1))),
+                destination=warped,
+                src_transform=src.transform,
+                src_crs=src.crs,
+                dst_transform=dst_transform,
+                dst_crs=dst_crs,
+                dst_alpha=count + 1,
+                resampling=rasterio.warp.Resampling.bilinear
+            )
+        return warped[:count], warped[count] != 0
+    except Exception as e:
+        logger.warning(f"Failed to process local file {fpath}: {e}")
+        return None
+
+
 class LocalFileAdapter(DataProviderAdapter):
     """
     Adapter for ingesting local geospatial data (rasters).
@@ -120,31 +173,36 @@ class LocalFileAdapter(DataProviderAdapter):
             # Note: We might want headers/footers to handle mean/max? Default to "overwrite" or "max"?
             # Rasterio merge does "last pixel wins" by default.
             
-            # Let's do a trick: we will warp each source file into the destination grid.
-            # This is effectively "harmonizing on the fly".
-            
+            # Each source file is warped onto the destination grid in a
+            # worker thread; results are composited in file order so that
+            # later files win only where they actually have coverage. At
+            # most one warp per worker is in flight, so finished grids
+            # never pile up waiting for an earlier file.
             dest_array = np.zeros((count, height, width), dtype=dtype)
-            
+
+            loop = asyncio.get_running_loop()
+            workers = min(len(source_files), os.cpu_count() or 1, MAX_WARP_WORKERS)
             success_count = 0
-            for fpath in source_files:
-                try:
-                    with rasterio.open(fpath) as src:
-                        # Reproject into our buffer
-                        # We use 'max' merging or just 'overwrite' (default).
-                        # To support sparse data merging properly, we might need a mask.
-                        # For now, use simple Reprojection.
-                        rasterio.warp.reproject(
-                            source=rasterio.band(src, list(range(1, count + 1))),
-                            destination=dest_array,
-                            src_transform=src.transform,
-                            src_crs=src.crs,
-                            dst_transform=dst_transform,
-                            dst_crs=dst_crs,
-                            resampling=rasterio.warp.Resampling.bilinear
-                        )
-                        success_count += 1
-                except Exception as e:
-                    logger.warning(f"Failed to process local file {fpath}: {e}")
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                def submit(fpath: str) -> "asyncio.Future[Optional[Tuple[np.ndarray, np.ndarray]]]":
+                    return loop.run_in_executor(
+                        pool, _reproject_one, fpath, count, dtype,
+                        (height, width), dst_transform, dst_crs,
+                    )
+
+                pending = deque(submit(f) for f in source_files[:workers])
+                queued = iter(source_files[workers:])
+                while pending:
+                    warped = await pending.popleft()
+                    next_file = next(queued, None)
+                    if next_file is not None:
+                        pending.append(submit(next_file))
+                    if warped is None:
+                        continue
+                    data, coverage = warped
+                    np.copyto(dest_array, data, where=coverage)
+                    success_count += 1
+                    del warped, data, coverage
 
             if success_count == 0:
                 return None
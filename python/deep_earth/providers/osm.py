@@ -1,3 +1,4 @@
+import functools
 import hashlib
 import json
 import logging
@@ -12,7 +13,8 @@ from shapely.geometry import LineString, Point, Polygon
 from shapely.ops import transform
 
 from deep_earth.cache import CacheManager
-from deep_earth.config import Config
+from deep_earth.config import get_config
+from deep_earth.http_client import get_session
 from deep_earth.providers.base import DataProviderAdapter
 from deep_earth.region import RegionContext
 from deep_earth.retry import fetch_with_retry
@@ -20,28 +22,41 @@ from deep_earth.retry import fetch_with_retry
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=256)
+def _bbox_cache_key(bbox_tuple: Tuple[float, float, float, float]) -> str:
+    """MD5 cache key for a (min_lat, min_lon, max_lat, max_lon) tuple."""
+    bbox_str = f"{bbox_tuple[0]},{bbox_tuple[1]},{bbox_tuple[2]},{bbox_tuple[3]}"
+    return hashlib.md5(bbox_str.encode()).hexdigest()
+
+
 class OverpassAdapter(DataProviderAdapter):
     """
     Adapter for fetching and processing OpenStreetMap data via the Overpass API.
     """
     DEFAULT_API_URL = "https://overpass-api.de/api/interpreter"
 
-    def __init__(self, base_url: Optional[str] = None, fallback_urls: Optional[List[str]] = None, cache_dir: Optional[str] = None):
+    def __init__(self, base_url: Optional[str] = None, fallback_urls: Optional[List[str]] = None, cache_dir: Optional[str] = None, cache: Optional[CacheManager] = None, session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize the OverpassAdapter.
 
         Args:
             base_url: The base URL for the Overpass API.
             fallback_urls: List of fallback API URLs.
-            cache_dir: Custom cache directory.
+            cache_dir: Custom cache directory. Ignored when ``cache`` is given.
+            cache: Shared cache manager instance.
+            session: HTTP session to fetch with. Defaults to the shared
+                session from ``deep_earth.http_client``.
         """
         self.base_url = base_url or self.DEFAULT_API_URL
         self.fallback_urls = fallback_urls or []
         
-        if cache_dir is None:
-            config = Config()
-            cache_dir = config.cache_path
-        self.cache = CacheManager(cache_dir)
+        if cache is None:
+            if cache_dir is None:
+                config = get_config()
+                cache_dir = config.cache_path
+            cache = CacheManager(cache_dir)
+        self.cache = cache
+        self.session = session
 
     def _build_query(self, bbox: Union[RegionContext, Tuple[float, float, float, float]]) -> str:
         """
@@ -61,17 +76,19 @@ class OverpassAdapter(DataProviderAdapter):
         min_lat, min_lon, max_lat, max_lon = bbox_tuple
         bbox_str = f"{min_lat},{min_lon},{max_lat},{max_lon}"
         
+        # One query for the whole region; the global [bbox] setting
+        # applies to every statement.
         query = f"""
-        [out:json][timeout:25];
+        [out:json][timeout:25][bbox:{bbox_str}];
         (
-          way["highway"]({bbox_str});
-          way["waterway"]({bbox_str});
-          way["building"]({bbox_str});
-          relation["building"]({bbox_str});
-          way["landuse"]({bbox_str});
-          relation["landuse"]({bbox_str});
-          way["natural"]({bbox_str});
-          relation["natural"]({bbox_str});
+          way["highway"];
+          way["waterway"];
+          way["building"];
+          relation["building"];
+          way["landuse"];
+          relation["landuse"];
+          way["natural"];
+          relation["natural"];
         );
         out geom;
         """
@@ -133,14 +150,17 @@ class OverpassAdapter(DataProviderAdapter):
         return features
 
     def get_cache_key(self, bbox: Union[RegionContext, Tuple[float, float, float, float]], resolution: float) -> str:
-        """Generates a unique cache key for the given parameters."""
+        """Generates a unique cache key for the given parameters.
+
+        Keys are memoized per bbox, so repeated lookups for the same
+        region skip re-hashing.
+        """
         bbox_tuple: Tuple[float, float, float, float]
         if isinstance(bbox, RegionContext):
             bbox_tuple = bbox.as_tuple()
         else:
-            bbox_tuple = bbox
-        bbox_str = f"{bbox_tuple[0]},{bbox_tuple[1]},{bbox_tuple[2]},{bbox_tuple[3]}"
-        return hashlib.md5(bbox_str.encode()).hexdigest()
+            bbox_tuple = tuple(bbox)  # type: ignore[assignment]
+        return _bbox_cache_key(bbox_tuple)
 
     async def fetch(self, bbox: Union[RegionContext, Tuple[float, float, float, float]], resolution: float) -> Dict[str, Any]:
         """
@@ -170,17 +190,59 @@ class OverpassAdapter(DataProviderAdapter):
                     return cast(Dict[str, Any], json.load(f))
 
         logger.debug(f"Cache miss for {key}")
+        data, _ = await self._download(bbox_tuple, key)
+        return cast(Dict[str, Any], json.loads(data))
+
+    async def fetch_path(self, bbox: Union[RegionContext, Tuple[float, float, float, float]], resolution: float) -> str:
+        """
+        Fetch data from Overpass API and return the cached JSON path.
+
+        Same caching as ``fetch``, but skips decoding the response so callers
+        that only need the file location (like the CLI) get a path back
+        directly, matching the other adapters.
+
+        Args:
+            bbox: RegionContext or tuple of (min_lat, min_lon, max_lat, max_lon).
+            resolution: Requested resolution (not used for fetch, but for cache key).
+
+        Returns:
+            Path to the cached Overpass JSON response.
+        """
+        bbox_tuple: Tuple[float, float, float, float]
+        if isinstance(bbox, RegionContext):
+            bbox_tuple = bbox.as_tuple()
+        else:
+            bbox_tuple = bbox
+
+        logger.info(f"Fetching OSM data for bbox {bbox_tuple}")
+        key = self.get_cache_key(bbox_tuple, resolution)
+
+        path = self.cache.get_path(key, "osm", "json")
+        if path:
+            logger.debug(f"Cache hit for {key}")
+            return path
+
+        logger.debug(f"Cache miss for {key}")
+        _, path = await self._download(bbox_tuple, key)
+        return path
+
+    async def _download(self, bbox_tuple: Tuple[float, float, float, float], key: str) -> Tuple[bytes, str]:
+        """Queries Overpass and caches the raw response under ``key``.
+
+        Returns:
+            The raw response bytes and the path they were cached to.
+        """
         query = self._build_query(bbox_tuple)
         
-        async with aiohttp.ClientSession() as session:
-            try:
-                data = await fetch_with_retry(session, self.base_url, params={'data': query})
-                logger.info("Fetched OSM data successfully")
-                self.cache.save(key, data, "osm", "json")
-                return cast(Dict[str, Any], json.loads(data))
-            except Exception as e:
-                logger.error(f"Failed to fetch OSM: {e}")
-                raise
+        session = self.session or await get_session()
+        try:
+            data = await fetch_with_retry(session, self.base_url, params={'data': query})
+            logger.info("Fetched OSM data successfully")
+            path = self.cache.save(key, data, "osm", "json")
+            return cast(bytes, data), path
+        except Exception as e:
+            logger.error(f"Failed to fetch OSM: {e}")
+            raise
 
     def validate_credentials(self) -> bool:
         """OSM Overpass API is public."""
@@ -8,6 +8,7 @@ from rasterio.warp import Resampling, calculate_default_transform, reproject
 
 from deep_earth.cache import CacheManager
 from deep_earth.credentials import CredentialsManager
+from deep_earth.http_client import get_session
 from deep_earth.providers.base import DataProviderAdapter
 from deep_earth.region import RegionContext
 from deep_earth.retry import fetch_with_retry
@@ -20,16 +21,19 @@ class SRTMAdapter(DataProviderAdapter):
     Adapter for fetching SRTM elevation data from OpenTopography.
     """
     
-    def __init__(self, credentials: CredentialsManager, cache: CacheManager):
+    def __init__(self, credentials: CredentialsManager, cache: CacheManager, session: Optional[aiohttp.ClientSession] = None):
         """
         Initialize the SRTM adapter.
 
         Args:
             credentials: Credentials manager instance.
             cache: Cache manager instance.
+            session: HTTP session to fetch with. Defaults to the shared
+                session from ``deep_earth.http_client``.
         """
         self.credentials = credentials
         self.cache = cache
+        self.session = session
         self.api_url = "https://portal.opentopography.org/API/globaldem"
 
     def get_cache_key(self, bbox: RegionContext, resolution: float) -> str:
@@ -74,14 +78,14 @@ class SRTMAdapter(DataProviderAdapter):
             "API_Key": self.credentials.get_opentopography_key()
         }
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                data = await fetch_with_retry(session, self.api_url, params=params)
-                logger.info("Fetched SRTM successfully")
-                return self.cache.save(cache_key, data, category="srtm")
-            except Exception as e:
-                logger.error(f"Failed to fetch SRTM: {e}")
-                raise
+        session = self.session or await get_session()
+        try:
+            data = await fetch_with_retry(session, self.api_url, params=params)
+            logger.info("Fetched SRTM successfully")
+            return self.cache.save(cache_key, data, category="srtm")
+        except Exception as e:
+            logger.error(f"Failed to fetch SRTM: {e}")
+            raise
 
     def transform_to_grid(self, data_path: str, target_grid: Any) -> np.ndarray:
         """
@@ -2,18 +2,100 @@
 Canonical Bounding Box and Coordinate Management for Deep Earth Harmonizer.
 """
 
+import functools
 import math
 from dataclasses import dataclass
-from typing import Any, List, Optional, Tuple, cast
+from typing import Any, List, Optional, Tuple
 
+import numpy as np
 import pyproj
 from shapely.geometry import Polygon, box
 
+
+@functools.lru_cache(maxsize=256)
+def _get_transformer(
+    src_crs: str, dst_crs: str, always_xy: bool = True
+) -> pyproj.Transformer:
+    """Returns a cached Transformer for the given CRS pair.
+
+    Transformer construction is expensive, so instances are shared
+    across regions that resolve to the same UTM zone.
+    """
+    return pyproj.Transformer.from_crs(src_crs, dst_crs, always_xy=always_xy)
+
+
+# WGS84 ellipsoid and UTM projection constants
+_WGS84_A = 6378137.0
+_WGS84_F = 1 / 298.257223563
+_UTM_K0 = 0.9996
+_UTM_FALSE_EASTING = 500000.0
+_UTM_FALSE_NORTHING_SOUTH = 10000000.0
+
+# Beyond this longitude offset from the zone's central meridian the
+# truncated series loses accuracy, so we defer to PROJ.
+_TM_MAX_DLON_DEG = 30.0
+
+_N = _WGS84_F / (2 - _WGS84_F)
+_E = 2 * math.sqrt(_N) / (1 + _N)
+_RECTIFYING_A = _WGS84_A / (1 + _N) * (1 + _N**2 / 4 + _N**4 / 64)
+# Krüger series coefficients (to 4th order in n)
+_ALPHA = (
+    _N / 2 - 2 * _N**2 / 3 + 5 * _N**3 / 16 + 41 * _N**4 / 180,
+    13 * _N**2 / 48 - 3 * _N**3 / 5 + 557 * _N**4 / 1440,
+    61 * _N**3 / 240 - 103 * _N**4 / 140,
+    49561 * _N**4 / 161280,
+)
+
+
+def _wgs84_to_utm_np(
+    lat: np.ndarray, lon: np.ndarray, zone: int, northern: bool
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Projects WGS84 lat/lon arrays to UTM with the Krüger series.
+
+    Closed-form transverse Mercator, vectorized over NumPy arrays; it
+    avoids building a PROJ pipeline for the common WGS84 -> UTM case and
+    agrees with PROJ to well under a millimetre within a UTM zone.
+
+    Args:
+        lat: Latitudes in degrees.
+        lon: Longitudes in degrees.
+        zone: UTM zone number (1-60).
+        northern: True for the northern hemisphere.
+
+    Returns:
+        Tuple of (easting, northing) arrays in meters.
+    """
+    lon0 = (zone - 1) * 6 - 180 + 3
+    phi = np.radians(lat)
+    dlam = np.radians(lon - lon0)
+
+    sin_phi = np.sin(phi)
+    t = np.sinh(np.arctanh(sin_phi) - _E * np.arctanh(_E * sin_phi))
+    xi = np.arctan2(t, np.cos(dlam))
+    eta = np.arctanh(np.sin(dlam) / np.sqrt(1 + t * t))
+
+    easting = eta.copy()
+    northing = xi.copy()
+    for j, alpha in enumerate(_ALPHA, start=1):
+        easting += alpha * np.cos(2 * j * xi) * np.sinh(2 * j * eta)
+        northing += alpha * np.sin(2 * j * xi) * np.cosh(2 * j * eta)
+
+    scale = _UTM_K0 * _RECTIFYING_A
+    easting = _UTM_FALSE_EASTING + scale * easting
+    northing = scale * northing
+    if not northern:
+        northing += _UTM_FALSE_NORTHING_SOUTH
+    return easting, northing
+
+
 @dataclass(frozen=True)
 class RegionContext:
     """
     Consolidated representation of a geographic region.
     Handles WGS84 coordinates, UTM transformations, and tile subdivision.
+
+    Instances are immutable and hashable; derived values such as the
+    centroid and UTM zone are computed once and memoized.
     """
     lat_min: float
     lat_max: float
@@ -31,70 +113,121 @@ class RegionContext:
         if self.lon_min >= self.lon_max:
             raise ValueError(f"lon_min ({self.lon_min}) must be less than lon_max ({self.lon_max})")
 
-    @property
+    @functools.cached_property
     def centroid_lat(self) -> float:
         """Center latitude of the region."""
         return (self.lat_min + self.lat_max) / 2
     
-    @property
+    @functools.cached_property
     def centroid_lon(self) -> float:
         """Center longitude of the region."""
         return (self.lon_min + self.lon_max) / 2
 
-    @property
+    @functools.cached_property
     def utm_epsg(self) -> int:
         """EPSG code for the UTM zone covering this region."""
         zone_number = int((self.centroid_lon + 180) / 6) + 1
         base = 32600 if self.centroid_lat >= 0 else 32700
         return base + zone_number
 
-    @property
+    @functools.cached_property
     def utm_zone(self) -> str:
         """UTM zone name (e.g., '15N')."""
-        zone_number = int((self.centroid_lon + 180) / 6) + 1
+        zone_number = self.utm_epsg % 100
         hemi = 'N' if self.centroid_lat >= 0 else 'S'
         return f"{zone_number}{hemi}"
 
-    @property
+    @functools.cached_property
     def transformer(self) -> pyproj.Transformer:
         """WGS84 to UTM Transformer."""
-        return pyproj.Transformer.from_crs("EPSG:4326", f"EPSG:{self.utm_epsg}", always_xy=True)
+        return _get_transformer("EPSG:4326", f"EPSG:{self.utm_epsg}")
 
     def to_utm(self, lat: float, lon: float) -> Tuple[float, float]:
         """Transforms WGS84 lat/lon to UTM Easting/Northing."""
-        return cast(Tuple[float, float], self.transformer.transform(lon, lat))
+        xs, ys = self.to_utm_array(np.array([lat]), np.array([lon]))
+        return float(xs[0]), float(ys[0])
+
+    def to_utm_array(
+        self, lats: np.ndarray, lons: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Transforms arrays of WGS84 lat/lon to UTM Easting/Northing.
+
+        Uses the closed-form transverse Mercator series, falling back to
+        the PROJ transformer for points far outside this region's zone.
+
+        Args:
+            lats: Latitudes in degrees.
+            lons: Longitudes in degrees.
+
+        Returns:
+            Tuple of (easting, northing) arrays in meters.
+        """
+        lats = np.asarray(lats, dtype=np.float64)
+        lons = np.asarray(lons, dtype=np.float64)
+        zone = self.utm_epsg % 100
+        lon0 = (zone - 1) * 6 - 180 + 3
+        if np.any(np.abs(lons - lon0) > _TM_MAX_DLON_DEG):
+            # Transform owned contiguous copies in place, so PROJ writes
+            # straight into them without copying the caller's arrays.
+            xs = np.array(lons, dtype=np.float64, order="C")
+            ys = np.array(lats, dtype=np.float64, order="C")
+            self.transformer.transform(
+                xs, ys, radians=False, errcheck=False, inplace=True
+            )
+            return xs, ys
+        return _wgs84_to_utm_np(lats, lons, zone, self.centroid_lat >= 0)
 
     def get_utm_bbox(self) -> Tuple[float, float, float, float]:
         """Returns the bounding box in UTM coordinates (x_min, y_min, x_max, y_max)."""
-        x1, y1 = self.to_utm(self.lat_min, self.lon_min)
-        x2, y2 = self.to_utm(self.lat_max, self.lon_max)
-        x3, y3 = self.to_utm(self.lat_min, self.lon_max)
-        x4, y4 = self.to_utm(self.lat_max, self.lon_min)
-        
+        # Transform all four corners in a single vectorized call
+        lons = np.array([self.lon_min, self.lon_max, self.lon_max, self.lon_min])
+        lats = np.array([self.lat_min, self.lat_max, self.lat_min, self.lat_max])
+        xs, ys = self.to_utm_array(lats, lons)
+
         return (
-            min(x1, x2, x3, x4),
-            min(y1, y2, y3, y4),
-            max(x1, x2, x3, x4),
-            max(y1, y2, y3, y4)
+            float(xs.min()),
+            float(ys.min()),
+            float(xs.max()),
+            float(ys.max())
         )
 
-    def width_km(self) -> float:
-        """Approximate width in kilometers at center latitude."""
+    @functools.cached_property
+    def _extent_km(self) -> Tuple[float, float, float]:
+        """Memoized (width_km, height_km, area_km2)."""
         lat_rad = math.radians(self.centroid_lat)
         km_per_deg = 111.32 * math.cos(lat_rad)
-        return (self.lon_max - self.lon_min) * km_per_deg
+        width = (self.lon_max - self.lon_min) * km_per_deg
+        height = (self.lat_max - self.lat_min) * 111.32
+        return width, height, width * height
+
+    def width_km(self) -> float:
+        """Approximate width in kilometers at center latitude."""
+        return self._extent_km[0]
     
     def height_km(self) -> float:
         """Approximate height in kilometers."""
-        return (self.lat_max - self.lat_min) * 111.32
+        return self._extent_km[1]
     
     def area_km2(self) -> float:
         """Approximate area in square kilometers."""
-        return self.width_km() * self.height_km()
+        return self._extent_km[2]
+
+    @functools.cached_property
+    def _tuple(self) -> Tuple[float, float, float, float]:
+        return (self.lat_min, self.lon_min, self.lat_max, self.lon_max)
+
+    @functools.cached_property
+    def _wsen(self) -> Tuple[float, float, float, float]:
+        return (self.lon_min, self.lat_min, self.lon_max, self.lat_max)
 
     def as_tuple(self) -> Tuple[float, float, float, float]:
         """Return as (lat_min, lon_min, lat_max, lon_max)."""
-        return (self.lat_min, self.lon_min, self.lat_max, self.lon_max)
+        return self._tuple
+
+    def as_wsen(self) -> Tuple[float, float, float, float]:
+        """Return as (west, south, east, north), i.e. (lon_min, lat_min, lon_max, lat_max)."""
+        return self._wsen
 
     def get_tiles(self, tile_size_km: float = 1.0) -> List['RegionContext']:
         """
@@ -1,12 +1,53 @@
+import os
+
 import aiohttp
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import RetryCallState, retry, stop_after_attempt, wait_exponential
 from typing import Any, Dict, Optional
 
-@retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10), reraise=True)
+from deep_earth.http_client import host_semaphore
+
+# Longest server-requested Retry-After delay honoured, in seconds.
+MAX_RETRY_AFTER = 60.0
+
+# Bytes read from the socket and written to disk per step when streaming.
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+_backoff = wait_exponential(multiplier=1, min=4, max=10)
+
+
+def _retry_after_seconds(exc: Optional[BaseException]) -> Optional[float]:
+    """Return the delay a 429/503 response asked for, if any."""
+    if not isinstance(exc, aiohttp.ClientResponseError) or exc.headers is None:
+        return None
+    if exc.status not in (429, 503):
+        return None
+    value = exc.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+def _wait_retry_after(retry_state: RetryCallState) -> float:
+    """Wait for the server's Retry-After if given, else back off exponentially."""
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    delay = _retry_after_seconds(exc)
+    if delay is not None:
+        return min(delay, MAX_RETRY_AFTER)
+    return float(_backoff(retry_state))
+
+
+@retry(stop=stop_after_attempt(3), wait=_wait_retry_after, reraise=True)
 async def fetch_with_retry(session: aiohttp.ClientSession, url: str, params: Optional[Dict[str, Any]] = None) -> bytes:
     """
     Performs an async GET request with exponential backoff and retries.
 
+    At most ``http_client.HOST_CONCURRENCY`` requests (or the host's
+    ``HOST_LIMITS`` entry) run against one host at a time. Rate-limited responses (429/503) carrying a ``Retry-After``
+    header are retried after the delay the server asked for.
+
     Args:
         session: An active aiohttp client session.
         url: The target URL.
@@ -18,6 +59,39 @@ async def fetch_with_retry(session: aiohttp.ClientSession, url: str, params: Opt
     Raises:
         aiohttp.ClientResponseError: if the request fails after all retries.
     """
-    async with session.get(url, params=params) as response:
-        response.raise_for_status()
-        return await response.read()
+    async with host_semaphore(url):
+        async with session.get(url, params=params) as response:
+            response.raise_for_status()
+            return await response.read()
+
+
+@retry(stop=stop_after_attempt(3), wait=_wait_retry_after, reraise=True)
+async def download_with_retry(session: aiohttp.ClientSession, url: str, path: str, params: Optional[Dict[str, Any]] = None) -> None:
+    """
+    Streams an async GET response to ``path`` with the same retry policy
+    as ``fetch_with_retry``.
+
+    The body is written in ``DOWNLOAD_CHUNK_SIZE`` chunks, so memory use
+    stays flat regardless of the file size. Each attempt rewrites the
+    file from the start; a failed attempt removes it.
+
+    Args:
+        session: An active aiohttp client session.
+        url: The target URL.
+        path: Destination file path.
+        params: Optional query parameters.
+
+    Raises:
+        aiohttp.ClientResponseError: if the request fails after all retries.
+    """
+    async with host_semaphore(url):
+        async with session.get(url, params=params) as response:
+            response.raise_for_status()
+            try:
+                with open(path, "wb") as f:
+                    async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+            except BaseException:
+                if os.path.exists(path):
+                    os.remove(path)
+                raise
@@ -1,11 +1,121 @@
 import logging
-from typing import Any, cast
+import math
+from typing import Any, Dict, Tuple, cast
 
 import numpy as np
-from scipy.ndimage import sobel, laplace, uniform_filter, generic_filter
+from scipy.ndimage import sobel, laplace, uniform_filter
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:  # pragma: no cover - numba is an optional accelerator
+    HAS_NUMBA = False
 
 logger = logging.getLogger(__name__)
 
+# fastmath without the no-NaN/no-Inf flags: DEMs may carry NaN nodata.
+_FASTMATH = {"nsz", "arcp", "contract", "afn", "reassoc"}
+
+if HAS_NUMBA:
+    @njit(parallel=True, fastmath=_FASTMATH, cache=True)
+    def _slope_aspect_nb(dem, cell_size):  # type: ignore[no-untyped-def]
+        """Fused Sobel gradient, slope (radians) and aspect (degrees).
+
+        Matches ``scipy.ndimage.sobel`` with its default ``reflect``
+        boundary, which for a 3x3 stencil is edge clamping.
+        """
+        h, w = dem.shape
+        slope = np.empty_like(dem)
+        aspect = np.empty_like(dem)
+        scale = 8.0 * cell_size
+        for i in prange(h):
+            up = max(i - 1, 0)
+            down = min(i + 1, h - 1)
+            for j in range(w):
+                left = max(j - 1, 0)
+                right = min(j + 1, w - 1)
+                dx = (
+                    (dem[up, right] - dem[up, left])
+                    + 2.0 * (dem[i, right] - dem[i, left])
+                    + (dem[down, right] - dem[down, left])
+                ) / scale
+                dy = (
+                    (dem[down, left] - dem[up, left])
+                    + 2.0 * (dem[down, j] - dem[up, j])
+                    + (dem[down, right] - dem[up, right])
+                ) / scale
+                slope[i, j] = math.atan(math.sqrt(dx * dx + dy * dy))
+                a = math.degrees(math.atan2(-dx, dy)) + 360.0
+                if a >= 360.0:
+                    a -= 360.0
+                aspect[i, j] = a
+        return slope, aspect
+
+    @njit(parallel=True, fastmath=_FASTMATH, cache=True)
+    def _tpi_nb(dem, window_size):  # type: ignore[no-untyped-def]
+        """Elevation minus its ``reflect``-padded box mean."""
+        h, w = dem.shape
+        out = np.empty_like(dem)
+        lo = window_size // 2
+        hi = window_size - lo
+        inv_area = 1.0 / (window_size * window_size)
+        for i in prange(h):
+            for j in range(w):
+                total = 0.0
+                for di in range(-lo, hi):
+                    r = i + di
+                    if r < 0:
+                        r = -r - 1
+                    elif r >= h:
+                        r = 2 * h - r - 1
+                    for dj in range(-lo, hi):
+                        c = j + dj
+                        if c < 0:
+                            c = -c - 1
+                        elif c >= w:
+                            c = 2 * w - c - 1
+                        total += dem[r, c]
+                out[i, j] = dem[i, j] - total * inv_area
+        return out
+
+
+def _as_float(dem: np.ndarray) -> np.ndarray:
+    """Returns a C-contiguous float view (or copy) of the DEM.
+
+    The dtype is the one the SciPy path computes in,
+    ``np.result_type(dem.dtype, np.float32)``, so results have the same
+    dtype with or without numba.
+    """
+    dem = np.asarray(dem)
+    dem = dem.astype(np.result_type(dem.dtype, np.float32), copy=False)
+    return np.ascontiguousarray(dem)
+
+def _gradients(dem: np.ndarray, cell_size: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Computes the Sobel gradients (dz/dx, dz/dy) scaled to the cell size.
+
+    Args:
+        dem: 2D NumPy array of elevation values.
+        cell_size: The distance between pixel centers in meters.
+
+    Returns:
+        Tuple of (dx, dy) 2D NumPy arrays.
+    """
+    # Sobel filter in SciPy:
+    # axis 1 is along columns (dx)
+    # axis 0 is along rows (dy)
+    # Write straight into preallocated float buffers and scale in place
+    # to avoid the temporaries of sobel(...) / scale.
+    out_dtype = np.result_type(dem.dtype, np.float32)
+    dx = np.empty(dem.shape, dtype=out_dtype)
+    dy = np.empty(dem.shape, dtype=out_dtype)
+    sobel(dem, axis=1, output=dx)
+    sobel(dem, axis=0, output=dy)
+    scale = 8.0 * cell_size
+    dx /= scale
+    dy /= scale
+    return dx, dy
+
 def compute_slope(dem: np.ndarray, cell_size: float = 10.0) -> np.ndarray:
     """
     Computes the slope (gradient magnitude) in degrees.
@@ -22,14 +132,13 @@ def compute_slope(dem: np.ndarray, cell_size: float = 10.0) -> np.ndarray:
     Returns:
         2D NumPy array of slope values in degrees.
     """
-    # Sobel filter in SciPy:
-    # axis 1 is along columns (dx)
-    # axis 0 is along rows (dy)
-    dx = sobel(dem, axis=1) / (8.0 * cell_size)
-    dy = sobel(dem, axis=0) / (8.0 * cell_size)
-    
-    slope_rad = np.arctan(np.sqrt(dx**2 + dy**2))
-    return cast(np.ndarray, np.degrees(slope_rad))
+    if HAS_NUMBA:
+        slope, _ = _slope_aspect_nb(_as_float(dem), cell_size)
+    else:
+        dx, dy = _gradients(dem, cell_size)
+        slope = np.hypot(dx, dy, out=dx)
+        np.arctan(slope, out=slope)
+    return cast(np.ndarray, np.degrees(slope, out=slope))
 
 def compute_aspect(dem: np.ndarray, cell_size: float = 10.0) -> np.ndarray:
     """
@@ -43,22 +152,27 @@ def compute_aspect(dem: np.ndarray, cell_size: float = 10.0) -> np.ndarray:
     Returns:
         2D NumPy array of aspect values in degrees.
     """
-    dx = sobel(dem, axis=1) / (8.0 * cell_size)
-    dy = sobel(dem, axis=0) / (8.0 * cell_size)
-    
+    if HAS_NUMBA:
+        _, aspect = _slope_aspect_nb(_as_float(dem), cell_size)
+        return cast(np.ndarray, aspect)
+
+    dx, dy = _gradients(dem, cell_size)
+
     # dz/dx (dx) is positive if height increases East
     # dz/dy (dy) is positive if height increases South
     # Aspect 0 is North (dy > 0), 180 is South (dy < 0)
     # Aspect 90 is East (dx < 0), 270 is West (dx > 0)
     
     # Formula that satisfies this: atan2(-dx, dy)
-    aspect_rad = np.arctan2(-dx, dy)
-    aspect_deg = np.degrees(aspect_rad)
-    
+    aspect = np.negative(dx, out=dx)
+    np.arctan2(aspect, dy, out=aspect)
+    np.degrees(aspect, out=aspect)
+
     # Map to 0-360
-    aspect_deg = np.mod(aspect_deg + 360, 360)
-    
-    return cast(np.ndarray, aspect_deg)
+    aspect += 360
+    np.mod(aspect, 360, out=aspect)
+
+    return cast(np.ndarray, aspect)
 
 def compute_curvature(dem: np.ndarray) -> np.ndarray:
     """
@@ -84,7 +198,12 @@ def compute_roughness(dem: np.ndarray, window_size: int = 3) -> np.ndarray:
     Returns:
         2D NumPy array of roughness values.
     """
-    return cast(np.ndarray, generic_filter(dem, np.std, size=window_size))
+    # Box standard deviation via sqrt(E[x^2] - E[x]^2), two separable
+    # passes instead of a Python callback per pixel.
+    dem = np.asarray(dem, dtype=np.float64)
+    mean = uniform_filter(dem, size=window_size)
+    mean_sq = uniform_filter(dem * dem, size=window_size)
+    return cast(np.ndarray, np.sqrt(np.maximum(mean_sq - mean * mean, 0.0)))
 
 def compute_tpi(dem: np.ndarray, window_size: int = 3) -> np.ndarray:
     """
@@ -98,6 +217,15 @@ def compute_tpi(dem: np.ndarray, window_size: int = 3) -> np.ndarray:
     Returns:
         2D NumPy array of TPI values.
     """
+    # uniform_filter keeps integer dtypes (truncating the mean), so only
+    # floating DEMs take the JIT path.
+    if (
+        HAS_NUMBA
+        and np.issubdtype(dem.dtype, np.floating)
+        and 0 < window_size <= min(dem.shape)
+    ):
+        return cast(np.ndarray, _tpi_nb(np.ascontiguousarray(dem), window_size))
+
     mean_dem = uniform_filter(dem, size=window_size)
     return cast(np.ndarray, dem - mean_dem)
 
@@ -113,13 +241,69 @@ def compute_twi(dem: np.ndarray, cell_size: float = 10.0) -> np.ndarray:
     Returns:
         2D NumPy array of TWI values.
     """
-    slope = compute_slope(dem, cell_size)
+    if HAS_NUMBA:
+        slope_rad, _ = _slope_aspect_nb(_as_float(dem), cell_size)
+    else:
+        dx, dy = _gradients(dem, cell_size)
+        slope_rad = np.hypot(dx, dy, out=dx)
+        np.arctan(slope_rad, out=slope_rad)
+    return _twi_from_slope(dem, slope_rad)
+
+def _twi_from_slope(dem: np.ndarray, slope_rad: np.ndarray) -> np.ndarray:
+    """
+    Computes the TWI proxy from a precomputed slope in radians.
+
+    Args:
+        dem: 2D NumPy array of elevation values.
+        slope_rad: 2D NumPy array of slope values in radians.
+
+    Returns:
+        2D NumPy array of TWI values.
+    """
     # tan(slope)
-    tan_beta = np.tan(np.radians(slope))
+    tan_beta = np.tan(slope_rad)
     tan_beta = np.where(tan_beta <= 0, 0.001, tan_beta) # Avoid division by zero
     
     # Simple proxy for alpha (contributing area): using TPI as a local catchment proxy
     # In reality, this is not accurate, but serves as a placeholder for the spec.
     alpha = np.maximum(1.0, compute_tpi(dem, window_size=5) + 1.0)
     
-    return np.log(alpha / tan_beta)
+    return cast(np.ndarray, np.log(alpha / tan_beta))
+
+def compute_terrain(dem: np.ndarray, cell_size: float = 10.0) -> Dict[str, np.ndarray]:
+    """
+    Computes slope, aspect and TWI in one pass over shared gradients.
+
+    Equivalent to calling ``compute_slope``, ``compute_aspect`` and
+    ``compute_twi`` separately, but the Sobel gradients are computed
+    only once.
+
+    Args:
+        dem: 2D NumPy array of elevation values.
+        cell_size: The distance between pixel centers in meters.
+
+    Returns:
+        Dictionary with ``slope`` and ``aspect`` (degrees) and ``twi``.
+    """
+    if HAS_NUMBA:
+        slope, aspect = _slope_aspect_nb(_as_float(dem), cell_size)
+    else:
+        dx, dy = _gradients(dem, cell_size)
+
+        aspect = np.arctan2(-dx, dy)
+        np.degrees(aspect, out=aspect)
+        aspect += 360
+        np.mod(aspect, 360, out=aspect)
+
+        # dx is no longer needed once aspect is known; reuse it for slope
+        slope = np.hypot(dx, dy, out=dx)
+        np.arctan(slope, out=slope)
+
+    twi = _twi_from_slope(dem, slope)
+    np.degrees(slope, out=slope)
+
+    return {
+        "slope": cast(np.ndarray, slope),
+        "aspect": cast(np.ndarray, aspect),
+        "twi": twi,
+    }
@@ -7,7 +7,6 @@ import os
 import sys
 import argparse
 import asyncio
-import numpy as np
 import logging
 
 from deep_earth.region import RegionContext
@@ -47,7 +46,7 @@ def main():
     
     srtm_a = SRTMAdapter(creds, cache)
     gee_a = EarthEngineAdapter(creds, cache)
-    osm_a = OverpassAdapter(cache_dir=config.cache_path)
+    osm_a = OverpassAdapter(cache=cache)
     harmonizer = Harmonizer(region, args.resolution)
 
     # 2. Fetch Data (Parallel)
@@ -70,22 +69,19 @@ def main():
 
     height_grid = harmonizer.resample(srtm_path, bands=1)
     
+    # Without embeddings, inject_heightfield can skip the per-cell points
     embed_grid = None
     if not isinstance(gee_path, Exception) and gee_path:
         embed_grid = harmonizer.resample(gee_path, bands=list(range(1, 65)))
     else:
         logger.warning(f"GEE failed or skipped: {gee_path}")
-        embed_grid = np.zeros((64, harmonizer.height, harmonizer.width), dtype=np.float32)
 
     if not isinstance(osm_json, Exception) and osm_json:
         osm_layers = osm_a.transform_to_grid(osm_json['elements'], harmonizer)
         harmonizer.add_layers(osm_layers)
 
     # Add Data Quality
-    quality = harmonizer.compute_quality_layer(
-        height_grid, 
-        embed_grid if not isinstance(gee_path, Exception) else None
-    )
+    quality = harmonizer.compute_quality_layer(height_grid, embed_grid)
     harmonizer.add_layers({"data_quality": quality})
 
     # 4. Save Geometry (Requires hou)
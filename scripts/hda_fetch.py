@@ -46,14 +46,14 @@ cache = CacheManager(config.cache_path)
 
 srtm_a = SRTMAdapter(creds, cache)
 gee_a = EarthEngineAdapter(creds, cache)
-osm_a = OverpassAdapter(cache_dir=config.cache_path)
+osm_a = OverpassAdapter(cache=cache)
 local_a = LocalFileAdapter(cache)
 
 async def fetch_all():
     tasks = [
         srtm_a.fetch(region, 30),
         gee_a.fetch(region, resolution, year, dataset_id),
-        osm_a.fetch(region, resolution),
+        osm_a.fetch_path(region, resolution),
     ]
     if local_dir:
         tasks.append(local_a.fetch(region, resolution, local_dir))
@@ -4,8 +4,11 @@ Verifies correct behaviour both when no event loop is running
 (normal Python) and when an event loop already exists (Houdini-like).
 """
 import asyncio
+import threading
 import pytest
-from deep_earth.async_utils import run_async, gather_with_concurrency
+from deep_earth.async_utils import (
+    AdmissionController, run_async, gather_with_concurrency,
+)
 
 
 # ---------------------------------------------------------------------------
@@ -35,7 +38,7 @@ def test_run_async_exception():
 
 @pytest.mark.asyncio
 async def test_run_async_inside_existing_loop():
-    """Uses ThreadPoolExecutor when called inside a running loop."""
+    """Uses the background loop thread when called inside a running loop."""
     async def double(x):
         return x * 2
 
@@ -54,6 +57,29 @@ async def test_run_async_inside_loop_exception():
         run_async(fail())
 
 
+def test_run_async_reuses_background_loop():
+    """Consecutive calls run on the same persistent loop and thread."""
+    async def current():
+        return asyncio.get_running_loop(), threading.get_ident()
+
+    first = run_async(current())
+    second = run_async(current())
+    assert first == second
+    assert first[1] != threading.get_ident()
+
+
+def test_run_async_from_background_loop_raises():
+    """Re-entrant calls from the background loop fail instead of hanging."""
+    async def inner():
+        return 1
+
+    async def outer():
+        run_async(inner())
+
+    with pytest.raises(RuntimeError, match="background event loop"):
+        run_async(outer())
+
+
 # ---------------------------------------------------------------------------
 # gather_with_concurrency
 # ---------------------------------------------------------------------------
@@ -72,7 +98,7 @@ async def test_gather_with_concurrency_basic():
 
 @pytest.mark.asyncio
 async def test_gather_with_concurrency_limits():
-    """Semaphore limits concurrent execution."""
+    """Admission controller limits concurrent execution."""
     max_concurrent = 0
     current = 0
 
@@ -98,3 +124,66 @@ async def test_gather_with_concurrency_single():
 
     results = await gather_with_concurrency(1, one())
     assert results == [42]
+
+
+# ---------------------------------------------------------------------------
+# AdmissionController
+# ---------------------------------------------------------------------------
+
+@pytest.mark.asyncio
+async def test_admission_controller_resize():
+    """Raising the cap mid-run admits more concurrent coroutines."""
+    controller = AdmissionController(1)
+    max_concurrent = 0
+    current = 0
+
+    async def track():
+        nonlocal max_concurrent, current
+        current += 1
+        max_concurrent = max(max_concurrent, current)
+        await asyncio.sleep(0.01)
+        current -= 1
+
+    async def widen():
+        await asyncio.sleep(0.005)
+        await controller.set_cap(3)
+
+    await asyncio.gather(
+        gather_with_concurrency(controller, *(track() for _ in range(6))),
+        widen(),
+    )
+    assert controller.cap == 3
+    assert controller.active == 0
+    assert 1 < max_concurrent <= 3
+
+
+def test_admission_controller_invalid_cap():
+    with pytest.raises(ValueError, match="cap"):
+        AdmissionController(0)
+
+
+@pytest.mark.asyncio
+async def test_as_completed_with_names_streams_in_completion_order():
+    """Results arrive as each awaitable finishes; failures are yielded."""
+    from deep_earth.async_utils import as_completed_with_names
+
+    async def delayed(value, delay):
+        await asyncio.sleep(delay)
+        return value
+
+    async def failing():
+        raise ValueError("boom")
+
+    seen = [
+        item async for item in as_completed_with_names([
+            ("slow", delayed("s", 0.05)),
+            ("fast", delayed("f", 0.0)),
+            ("bad", failing()),
+        ])
+    ]
+
+    names = [name for name, _ in seen]
+    assert names.index("fast") < names.index("slow")
+    results = dict(seen)
+    assert results["slow"] == "s"
+    assert isinstance(results["bad"], ValueError)
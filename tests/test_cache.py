@@ -31,6 +31,24 @@ def test_cache_save_retrieve(temp_cache_dir):
     with open(path, "rb") as f:
         assert f.read() == data
 
+def test_cache_save_file_adopts_partial(temp_cache_dir):
+    manager = CacheManager(temp_cache_dir)
+    part = manager.partial_path("streamed", category="embeddings")
+    with open(part, "wb") as f:
+        f.write(b"chunk-1")
+        f.write(b"chunk-2")
+
+    # Not visible until adopted
+    assert manager.get_path("streamed", category="embeddings") is None
+
+    path = manager.save_file("streamed", part, category="embeddings")
+
+    assert not os.path.exists(part)
+    assert manager.get_path("streamed", category="embeddings") == path
+    assert manager.metadata["entries"]["streamed"]["category"] == "embeddings"
+    with open(path, "rb") as f:
+        assert f.read() == b"chunk-1chunk-2"
+
 def test_cache_missing(temp_cache_dir):
     manager = CacheManager(temp_cache_dir)
     assert not manager.exists("missing_key", category="srtm")
@@ -42,6 +60,7 @@ def test_cache_metadata_creation(temp_cache_dir):
     data = b"data"
     
     manager.save(key, data, category="srtm")
+    manager.flush()
     
     meta_path = os.path.join(temp_cache_dir, "cache_metadata.json")
     assert os.path.exists(meta_path)
@@ -61,9 +80,8 @@ def test_cache_ttl_expiration(temp_cache_dir):
     key = "ttl_test"
     manager.save(key, b"data", category="osm")
     
-    # 31 days ago
-    expired_ts = (datetime.now(timezone.utc) - timedelta(days=31)).isoformat()
-    manager.metadata["entries"][key]["timestamp"] = expired_ts
+    # Expired a day ago
+    manager.metadata["entries"][key]["expires_at"] = time.time() - 86400
     manager._save_metadata()
     
     # Should be expired
@@ -125,6 +143,7 @@ def test_cache_save_metadata_io_error(temp_cache_dir):
     """IOError during metadata save is logged, not raised."""
     manager = CacheManager(temp_cache_dir)
     manager.save("k1", b"data", category="srtm")
+    manager.flush()
     # Make metadata path read-only to trigger IOError
     os.chmod(manager.metadata_path, 0o444)
     try:
@@ -164,8 +183,7 @@ def test_cache_exists_expired_invalidates(temp_cache_dir):
     """exists() on an expired key invalidates it and returns False."""
     manager = CacheManager(temp_cache_dir)
     manager.save("exp", b"data", category="osm")
-    expired_ts = (datetime.now(timezone.utc) - timedelta(days=60)).isoformat()
-    manager.metadata["entries"]["exp"]["timestamp"] = expired_ts
+    manager.metadata["entries"]["exp"]["expires_at"] = time.time() - 86400
     manager._save_metadata()
 
     assert manager.exists("exp", category="osm") is False
@@ -176,8 +194,7 @@ def test_cache_get_path_expired_returns_none(temp_cache_dir):
     """get_path() on an expired key returns None and invalidates."""
     manager = CacheManager(temp_cache_dir)
     manager.save("gp", b"data", category="osm")
-    expired_ts = (datetime.now(timezone.utc) - timedelta(days=60)).isoformat()
-    manager.metadata["entries"]["gp"]["timestamp"] = expired_ts
+    manager.metadata["entries"]["gp"]["expires_at"] = time.time() - 86400
     manager._save_metadata()
 
     assert manager.get_path("gp", category="osm") is None
@@ -208,11 +225,306 @@ def test_cache_clear_expired(temp_cache_dir):
     manager.save("stale", b"data", category="osm")
 
     # Make one expired
-    expired_ts = (datetime.now(timezone.utc) - timedelta(days=60)).isoformat()
-    manager.metadata["entries"]["stale"]["timestamp"] = expired_ts
+    manager.metadata["entries"]["stale"]["expires_at"] = time.time() - 86400
     manager._save_metadata()
 
     cleared = manager.clear_expired()
     assert cleared == 1
     assert "fresh" in manager.metadata["entries"]
-    assert "stale" not in manager.metadata["entries"]
\ No newline at end of file
+    assert "stale" not in manager.metadata["entries"]
+
+def test_cache_category_dirs_created_once(temp_cache_dir, monkeypatch):
+    """Known categories exist up front; path lookups make no syscalls."""
+    manager = CacheManager(temp_cache_dir)
+    for category in CacheManager.TTL_DAYS:
+        assert os.path.isdir(os.path.join(temp_cache_dir, category))
+
+    manager._get_full_path("warm", "local")
+    assert os.path.isdir(os.path.join(temp_cache_dir, "local"))
+
+    def fail(*args, **kwargs):
+        raise AssertionError("unexpected filesystem call")
+
+    monkeypatch.setattr(os, "makedirs", fail)
+    monkeypatch.setattr(os.path, "exists", fail)
+    path = manager._get_full_path("k", "local", "json")
+    assert path == os.path.join(temp_cache_dir, "local", "k.json")
+
+
+def test_cache_metadata_writes_are_batched(temp_cache_dir, monkeypatch):
+    """Metadata is written every FLUSH_THRESHOLD mutations or on flush()."""
+    monkeypatch.setattr(CacheManager, "FLUSH_THRESHOLD", 3)
+    manager = CacheManager(temp_cache_dir)
+    writes = []
+    monkeypatch.setattr(manager, "_save_metadata", lambda: writes.append(1))
+
+    manager.save("a", b"data", category="srtm")
+    manager.save("b", b"data", category="srtm")
+    assert writes == []
+    manager.invalidate("a")
+    assert len(writes) == 1
+
+    manager.save("c", b"data", category="srtm")
+    manager.flush()
+    manager.flush()
+    assert len(writes) == 2
+
+
+def test_cache_flush_persists_for_new_manager(temp_cache_dir):
+    """A second manager sees entries once the first has flushed."""
+    manager = CacheManager(temp_cache_dir)
+    manager.save("k", b"data", category="osm", extension="json")
+    manager.close()
+
+    reloaded = CacheManager(temp_cache_dir)
+    assert reloaded.metadata["entries"]["k"]["category"] == "osm"
+
+
+def test_cache_metadata_write_is_atomic(temp_cache_dir, monkeypatch):
+    """A failed write leaves the previous metadata file intact."""
+    manager = CacheManager(temp_cache_dir)
+    manager.save("keep", b"data", category="srtm")
+    manager.flush()
+    with open(manager.metadata_path, "rb") as f:
+        before = f.read()
+    assert b"\n" not in before  # compact encoding
+
+    def boom(src, dst):
+        raise IOError("disk full")
+
+    monkeypatch.setattr(os, "replace", boom)
+    manager.save("lost", b"data", category="srtm")
+    manager.flush()
+
+    with open(manager.metadata_path, "rb") as f:
+        assert f.read() == before
+    assert not [n for n in os.listdir(temp_cache_dir) if n.endswith(".tmp")]
+
+
+def test_cache_save_records_expires_at(temp_cache_dir):
+    """save() stores an epoch expiry; never-expiring categories store None."""
+    manager = CacheManager(temp_cache_dir)
+    before = time.time()
+    manager.save("o", b"data", category="osm", extension="json")
+    manager.save("s", b"data", category="srtm")
+
+    expires_at = manager.metadata["entries"]["o"]["expires_at"]
+    assert before + 30 * 86400 <= expires_at <= time.time() + 30 * 86400
+    assert manager.metadata["entries"]["s"]["expires_at"] is None
+
+
+def test_cache_legacy_entries_backfill_expires_at(temp_cache_dir):
+    """Entries without expires_at get it derived from their timestamp on load."""
+    os.makedirs(temp_cache_dir, exist_ok=True)
+    stale_ts = (datetime.now(timezone.utc) - timedelta(days=31)).isoformat()
+    fresh_ts = datetime.now(timezone.utc).isoformat()
+    meta = {
+        "version": "2.0",
+        "entries": {
+            "stale": {"category": "osm", "timestamp": stale_ts, "ttl_days": 30, "extension": "json"},
+            "fresh": {"category": "osm", "timestamp": fresh_ts, "ttl_days": 30, "extension": "json"},
+        },
+    }
+    with open(os.path.join(temp_cache_dir, "cache_metadata.json"), "w") as f:
+        json.dump(meta, f)
+
+    manager = CacheManager(temp_cache_dir)
+    assert all("expires_at" in e for e in manager.metadata["entries"].values())
+    assert manager._is_expired("stale") is True
+    assert manager._is_expired("fresh") is False
+
+
+def test_cache_path_probes_are_reused(temp_cache_dir, monkeypatch):
+    """Repeated lookups within PATH_CACHE_TTL reuse one existence probe."""
+    manager = CacheManager(temp_cache_dir)
+    path = manager.save("hot", b"data", category="srtm")
+    assert not manager.exists("cold", category="srtm")
+
+    probes = []
+    real_exists = os.path.exists
+    monkeypatch.setattr(os.path, "exists", lambda p: probes.append(p) or real_exists(p))
+    for _ in range(5):
+        assert manager.get_path("hot", category="srtm") == path
+        assert not manager.exists("cold", category="srtm")
+    assert probes == []
+
+    manager.invalidate("hot")
+    assert manager.get_path("hot", category="srtm") is None
+
+
+def test_cache_path_probe_expires(temp_cache_dir, monkeypatch):
+    """A cached miss is re-probed once PATH_CACHE_TTL has elapsed."""
+    monkeypatch.setattr(CacheManager, "PATH_CACHE_TTL", 0.0)
+    manager = CacheManager(temp_cache_dir)
+    assert manager.get_path("late", category="srtm") is None
+    with open(manager._get_full_path("late", "srtm"), "wb") as f:
+        f.write(b"data")
+    assert manager.get_path("late", category="srtm") is not None
+
+
+def test_cache_path_probes_are_bounded(temp_cache_dir, monkeypatch):
+    """Existence probes, misses included, are evicted least recently used first."""
+    monkeypatch.setattr(CacheManager, "PATH_CACHE_SIZE", 3)
+    manager = CacheManager(temp_cache_dir)
+    for i in range(5):
+        assert not manager.exists(f"miss{i}", category="srtm")
+    assert manager.exists("miss3", category="srtm") is False
+
+    assert len(manager._path_cache) == 3
+    cached = list(manager._path_cache)
+    assert cached[-1] == manager._get_full_path("miss3", "srtm")
+    assert manager._get_full_path("miss0", "srtm") not in cached
+
+
+@pytest.mark.parametrize("use_statx", [True, False])
+def test_fast_exists_matches_os_path_exists(tmp_path, monkeypatch, use_statx):
+    """_fast_exists agrees with os.path.exists with and without statx."""
+    from deep_earth import cache as cache_mod
+
+    if not use_statx:
+        monkeypatch.setattr(cache_mod, "_statx_func", lambda: None)
+    present = tmp_path / "present.tif"
+    present.write_bytes(b"x")
+    for path in (present, tmp_path, tmp_path / "missing.tif", present / "child"):
+        assert cache_mod._fast_exists(str(path)) == os.path.exists(path)
+
+
+def test_cache_clear_expired_writes_metadata_once(temp_cache_dir, monkeypatch):
+    """clear_expired unlinks every expired file and saves metadata once."""
+    manager = CacheManager(temp_cache_dir)
+    paths = [manager.save(f"old{i}", b"data", category="osm") for i in range(5)]
+    manager.save("new", b"data", category="osm")
+    for i in range(5):
+        manager.metadata["entries"][f"old{i}"]["expires_at"] = time.time() - 1
+    os.remove(paths[0])  # already gone on disk
+
+    writes = []
+    monkeypatch.setattr(manager, "_save_metadata", lambda: writes.append(1))
+    assert manager.clear_expired() == 5
+    assert len(writes) == 1
+    assert not any(os.path.exists(p) for p in paths)
+    assert list(manager.metadata["entries"]) == ["new"]
+
+
+def test_cache_get_path_memoized_and_bounded(temp_cache_dir, monkeypatch):
+    """get_path results are memoized, dropped on save/invalidate, and bounded."""
+    monkeypatch.setattr(CacheManager, "RESOLVE_CACHE_SIZE", 2)
+    manager = CacheManager(temp_cache_dir)
+    assert manager.get_path("k", category="srtm") is None
+
+    calls = []
+    real = manager._resolve_path
+    monkeypatch.setattr(
+        manager, "_resolve_path", lambda *a: calls.append(a) or real(*a)
+    )
+    assert manager.get_path("k", category="srtm") is None
+    assert calls == []
+
+    path = manager.save("k", b"data", category="srtm")
+    assert manager.get_path("k", category="srtm") == path
+    manager.invalidate("k")
+    assert manager.get_path("k", category="srtm") is None
+    assert len(calls) == 2
+
+    manager.get_path("a", category="srtm")
+    manager.get_path("b", category="srtm")
+    assert list(manager._resolve_cache) == [("a", "srtm", "tif"), ("b", "srtm", "tif")]
+
+
+def test_cache_metadata_roundtrip_without_orjson(temp_cache_dir, monkeypatch):
+    """The stdlib fallback codec reads metadata written by either codec."""
+    from deep_earth import cache as cache_mod
+
+    manager = CacheManager(temp_cache_dir)
+    manager.save("k", b"data", category="osm", extension="json")
+    manager.flush()
+
+    monkeypatch.setattr(cache_mod, "_load_file", lambda f: json.loads(f.read()))
+    monkeypatch.setattr(
+        cache_mod, "_dumps", lambda o: json.dumps(o, separators=(",", ":")).encode()
+    )
+    reloaded = CacheManager(temp_cache_dir)
+    assert reloaded.metadata == manager.metadata
+    reloaded.save("k2", b"data", category="srtm")
+    reloaded.flush()
+    with open(reloaded.metadata_path, "rb") as f:
+        assert "k2" in json.loads(f.read())["entries"]
+
+
+def test_category_ttl_seconds_table():
+    """The precomputed TTL table mirrors TTL_DAYS in seconds."""
+    from deep_earth.cache import CATEGORY_TTL_SECONDS
+    assert CATEGORY_TTL_SECONDS["srtm"] is None
+    assert CATEGORY_TTL_SECONDS["osm"] == 30 * 86400
+    assert set(CATEGORY_TTL_SECONDS) == set(CacheManager.TTL_DAYS)
+
+
+def test_cache_metadata_loaded_lazily(temp_cache_dir):
+    """Metadata JSON is not parsed until it is first needed."""
+    CacheManager(temp_cache_dir).save("k", b"data", category="srtm")
+    manager = CacheManager(temp_cache_dir)
+    assert manager._metadata is None
+    assert manager.exists("k", category="srtm")
+    assert manager._metadata is not None
+
+
+def test_cache_timestamp_formatted_on_flush(temp_cache_dir):
+    """save() records an epoch; the ISO timestamp is written on flush."""
+    manager = CacheManager(temp_cache_dir)
+    manager.save("k", b"data", category="osm")
+    entry = manager.metadata["entries"]["k"]
+    assert "timestamp" not in entry
+    manager.flush()
+
+    with open(manager.metadata_path) as f:
+        written = json.load(f)["entries"]["k"]
+    dt = datetime.fromisoformat(written["timestamp"])
+    assert abs(dt.timestamp() - written["created"]) < 1.0
+
+
+def test_cache_migration_deferred_to_flush(temp_cache_dir):
+    """v1 migration doesn't rewrite the metadata file until a flush."""
+    os.makedirs(temp_cache_dir, exist_ok=True)
+    meta_path = os.path.join(temp_cache_dir, "cache_metadata.json")
+    v1_meta = {
+        "version": "1.0",
+        "entries": {"old": {"category": "osm", "created": time.time(), "extension": "json"}},
+    }
+    with open(meta_path, "w") as f:
+        json.dump(v1_meta, f)
+
+    manager = CacheManager(temp_cache_dir)
+    assert manager.metadata["version"] == "2.0"
+    with open(meta_path) as f:
+        assert json.load(f)["version"] == "1.0"
+
+    manager.flush()
+    with open(meta_path) as f:
+        assert json.load(f)["version"] == "2.0"
+
+
+def test_cache_load_empty_metadata_file(temp_cache_dir):
+    """An empty metadata file is treated as corrupt, not a crash."""
+    os.makedirs(temp_cache_dir, exist_ok=True)
+    open(os.path.join(temp_cache_dir, "cache_metadata.json"), "wb").close()
+    manager = CacheManager(temp_cache_dir)
+    assert manager.metadata["entries"] == {}
+
+
+def test_cache_concurrent_saves_keep_all_entries(temp_cache_dir):
+    """Saves from several threads don't lose metadata entries."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    manager = CacheManager(temp_cache_dir)
+    manager.FLUSH_THRESHOLD = 3
+
+    def worker(i):
+        manager.save(f"k{i}", b"data", category="osm", extension="json")
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(worker, range(64)))
+    manager.flush()
+
+    with open(manager.metadata_path) as f:
+        entries = json.load(f)["entries"]
+    assert set(entries) == {f"k{i}" for i in range(64)}
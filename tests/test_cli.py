@@ -41,17 +41,13 @@ async def test_cli_execution_summary(tmp_path):
     mock_gee.fetch = AsyncMock(return_value=str(tmp_path / "gee.tif"))
 
     mock_osm = MagicMock()
-    mock_osm.fetch = AsyncMock(return_value={"elements": []})
-    mock_osm.get_cache_key.return_value = "osm_key"
+    mock_osm.fetch_path = AsyncMock(return_value=str(tmp_path / "osm.json"))
 
-    with patch("deep_earth.cli.SRTMAdapter", return_value=mock_srtm), \
-         patch("deep_earth.cli.EarthEngineAdapter", return_value=mock_gee), \
-         patch("deep_earth.cli.OverpassAdapter", return_value=mock_osm), \
+    with patch("deep_earth.providers.srtm.SRTMAdapter", return_value=mock_srtm), \
+         patch("deep_earth.providers.earth_engine.EarthEngineAdapter", return_value=mock_gee), \
+         patch("deep_earth.providers.osm.OverpassAdapter", return_value=mock_osm), \
          patch("deep_earth.cli.CredentialsManager"), \
-         patch("deep_earth.cli.CacheManager") as MockCache:
-
-        mock_cache_instance = MockCache.return_value
-        mock_cache_instance.get_path.return_value = str(tmp_path / "osm.json")
+         patch("deep_earth.cli.CacheManager"):
 
         from deep_earth.cli import run_fetch_all
         from deep_earth.region import RegionContext as BoundingBox
@@ -64,6 +60,7 @@ async def test_cli_execution_summary(tmp_path):
         assert "embeddings" in results
         assert "osm" in results
         assert results["srtm"].endswith("srtm.tif")
+        assert results["osm"].endswith("osm.json")
         assert "errors" not in output
 
 
@@ -79,17 +76,13 @@ async def test_cli_partial_failure_includes_errors():
     mock_gee.fetch = AsyncMock(return_value=None)
 
     mock_osm = MagicMock()
-    mock_osm.fetch = AsyncMock(return_value={"elements": []})
-    mock_osm.get_cache_key.return_value = "osm_key"
+    mock_osm.fetch_path = AsyncMock(return_value="/tmp/osm.json")
 
-    with patch("deep_earth.cli.SRTMAdapter", return_value=mock_srtm), \
-         patch("deep_earth.cli.EarthEngineAdapter", return_value=mock_gee), \
-         patch("deep_earth.cli.OverpassAdapter", return_value=mock_osm), \
+    with patch("deep_earth.providers.srtm.SRTMAdapter", return_value=mock_srtm), \
+         patch("deep_earth.providers.earth_engine.EarthEngineAdapter", return_value=mock_gee), \
+         patch("deep_earth.providers.osm.OverpassAdapter", return_value=mock_osm), \
          patch("deep_earth.cli.CredentialsManager"), \
-         patch("deep_earth.cli.CacheManager") as MockCache:
-
-        mock_cache_instance = MockCache.return_value
-        mock_cache_instance.get_path.return_value = "/tmp/osm.json"
+         patch("deep_earth.cli.CacheManager"):
 
         from deep_earth.cli import run_fetch_all
         from deep_earth.region import RegionContext
@@ -104,6 +97,40 @@ async def test_cli_partial_failure_includes_errors():
         assert "embeddings" in output["errors"]
 
 
+async def test_run_fetch_all_skips_providers_without_credentials():
+    """Providers whose credentials are missing are never started."""
+    mock_srtm = MagicMock()
+    mock_srtm.fetch = AsyncMock(return_value="/tmp/srtm.tif")
+    mock_gee = MagicMock()
+    mock_gee.fetch = AsyncMock(return_value="/tmp/gee.tif")
+    mock_osm = MagicMock()
+    mock_osm.fetch_path = AsyncMock(return_value="/tmp/osm.json")
+
+    creds = MagicMock()
+    creds.validate.return_value = {
+        "earth_engine": False, "opentopography": True,
+    }
+
+    with patch("deep_earth.providers.srtm.SRTMAdapter", return_value=mock_srtm), \
+         patch("deep_earth.providers.earth_engine.EarthEngineAdapter", return_value=mock_gee), \
+         patch("deep_earth.providers.osm.OverpassAdapter", return_value=mock_osm), \
+         patch("deep_earth.cli.CredentialsManager", return_value=creds), \
+         patch("deep_earth.cli.CacheManager"):
+
+        from deep_earth.cli import run_fetch_all
+        from deep_earth.region import RegionContext
+
+        bbox = RegionContext(45.0, 45.1, -93.0, -92.9)
+        output = await run_fetch_all(bbox, resolution=10, year=2023)
+
+    mock_gee.fetch.assert_not_called()
+    assert list(output["results"]) == ["srtm", "embeddings", "osm"]
+    assert output["results"]["embeddings"] is None
+    assert output["results"]["srtm"] == "/tmp/srtm.tif"
+    assert output["errors"] == {
+        "embeddings": "Earth Engine credentials missing",
+    }
+
 def test_cli_invalid_bbox_raises_cli_error():
     """Invalid bbox raises CLIError with descriptive message."""
     from deep_earth.cli import CLIError, main_logic
@@ -115,6 +142,18 @@ def test_cli_invalid_bbox_raises_cli_error():
         main_logic(args)
 
 
+@pytest.mark.parametrize("bbox", ["", "1,2,3", "1,2,3,4,5", "1,2,3,x"])
+def test_cli_bbox_needs_four_numbers(bbox):
+    """Too few, too many or non-numeric values are rejected."""
+    from deep_earth.cli import CLIError, main_logic
+
+    args = MagicMock()
+    args.bbox = bbox
+
+    with patch("deep_earth.cli.setup_logging"):
+        with pytest.raises(CLIError, match="Invalid bbox format"):
+            main_logic(args)
+
 def test_cli_fatal_error_raises_cli_error():
     """Unexpected error in run_fetch_all raises CLIError."""
     from deep_earth.cli import CLIError, main_logic
@@ -146,8 +185,8 @@ def test_cli_main_catches_cli_error_and_exits(capsys):
     assert "Invalid bbox format" in output["error"]
 
 
-def test_cli_run_preview_success(tmp_path, capsys):
-    """_run_preview generates a preview image from SRTM data."""
+def test_cli_render_preview_success(tmp_path):
+    """_render_preview generates a preview image from SRTM data."""
     import numpy as np
     import rasterio
 
@@ -161,32 +200,82 @@ def test_cli_run_preview_success(tmp_path, capsys):
         dst.write(data, 1)
 
     preview_out = str(tmp_path / "preview.png")
-    output = {"results": {"srtm": dem_path}}
-
-    from deep_earth.cli import _run_preview
-    _run_preview(output, preview_out)
 
-    captured = capsys.readouterr()
-    assert f"Preview saved to {preview_out}" in captured.out
+    from deep_earth.cli import _render_preview
+    assert _render_preview(dem_path, preview_out) is True
     assert os.path.exists(preview_out)
 
 
-def test_cli_run_preview_no_srtm(capsys):
-    """_run_preview with no SRTM data logs warning, does not crash."""
-    from deep_earth.cli import _run_preview
-    _run_preview({"results": {}}, "/tmp/nope.png")
-    # Should not crash; warning is logged but not printed to stdout
+@pytest.mark.asyncio
+async def test_cli_preview_no_srtm(tmp_path):
+    """Without SRTM data no preview is rendered and nothing crashes."""
+    from deep_earth.cli import run_fetch_all
+    from deep_earth.region import RegionContext
 
+    mock_srtm = MagicMock()
+    mock_srtm.fetch = AsyncMock(return_value=None)
+    mock_gee = MagicMock()
+    mock_gee.fetch = AsyncMock(return_value=None)
+    mock_osm = MagicMock()
+    mock_osm.fetch_path = AsyncMock(return_value=None)
+    adapters = {"srtm": mock_srtm, "gee": mock_gee, "osm": mock_osm}
 
-def test_cli_run_preview_error(capsys):
-    """_run_preview catches exceptions from generate_preview."""
-    from deep_earth.cli import _run_preview
-    with patch("rasterio.open", side_effect=Exception("corrupt file")):
-        _run_preview(
-            {"results": {"srtm": "/nonexistent.tif"}},
-            "/tmp/out.png",
+    bbox = RegionContext(45.0, 45.1, -93.0, -92.9)
+    with patch("deep_earth.cli._render_preview") as render:
+        output = await run_fetch_all(
+            bbox, 10, 2023, adapters=adapters,
+            preview_path=str(tmp_path / "nope.png"),
         )
-    # Should not crash — error is logged
+    render.assert_not_called()
+    assert "preview" not in output
+
+
+@pytest.mark.asyncio
+async def test_cli_preview_cancelled_when_fetch_loop_raises(tmp_path):
+    """A running preview task is cancelled, not orphaned, on failure."""
+    import asyncio
+    import threading
+
+    from deep_earth.cli import run_fetch_all
+    from deep_earth.region import RegionContext
+
+    release = threading.Event()
+    tasks = []
+    real_create_task = asyncio.create_task
+
+    def record_task(coro):
+        task = real_create_task(coro)
+        tasks.append(task)
+        return task
+
+    def on_result(name, path):
+        if name == "srtm":
+            raise RuntimeError("sink failed")
+
+    mock_srtm = MagicMock()
+    mock_srtm.fetch = AsyncMock(return_value=str(tmp_path / "s.tif"))
+    adapters = {"srtm": mock_srtm, "gee": MagicMock(), "osm": MagicMock()}
+    adapters["gee"].fetch = AsyncMock(return_value=None)
+    adapters["osm"].fetch_path = AsyncMock(return_value=None)
+
+    bbox = RegionContext(45.0, 45.1, -93.0, -92.9)
+    with patch("deep_earth.cli._render_preview",
+               side_effect=lambda *a: release.wait(5)), \
+         patch("deep_earth.cli.asyncio.create_task", side_effect=record_task):
+        with pytest.raises(RuntimeError, match="sink failed"):
+            await run_fetch_all(
+                bbox, 10, 2023, adapters=adapters,
+                preview_path=str(tmp_path / "p.png"), on_result=on_result,
+            )
+        assert len(tasks) == 1 and tasks[0].cancelling()
+    release.set()
+
+
+def test_cli_render_preview_error():
+    """_render_preview catches exceptions from reading the DEM."""
+    from deep_earth.cli import _render_preview
+    with patch("rasterio.open", side_effect=Exception("corrupt file")):
+        assert _render_preview("/nonexistent.tif", "/tmp/out.png") is False
 
 
 def test_cli_run_setup_wizard():
@@ -245,8 +334,7 @@ async def test_run_fetch_all_with_local_dir(tmp_path):
     mock_gee.fetch = AsyncMock(return_value=str(tmp_path / "g.tif"))
 
     mock_osm = MagicMock()
-    mock_osm.fetch = AsyncMock(return_value={"elements": []})
-    mock_osm.get_cache_key.return_value = "osm_key"
+    mock_osm.fetch_path = AsyncMock(return_value=str(tmp_path / "osm.json"))
 
     mock_local = MagicMock()
     mock_local.fetch = AsyncMock(
@@ -260,10 +348,7 @@ async def test_run_fetch_all_with_local_dir(tmp_path):
         "local": mock_local,
     }
 
-    with patch("deep_earth.cli.CacheManager") as MockCache:
-        MockCache.return_value.get_path.return_value = str(
-            tmp_path / "osm.json",
-        )
+    with patch("deep_earth.cli.CacheManager"):
         from deep_earth.cli import run_fetch_all
         from deep_earth.region import RegionContext
 
@@ -277,6 +362,44 @@ async def test_run_fetch_all_with_local_dir(tmp_path):
     mock_local.fetch.assert_called_once()
 
 
+async def test_run_fetch_all_starts_preview_before_slow_providers(tmp_path):
+    """The SRTM preview renders while slower providers are still fetching."""
+    import asyncio
+    import threading
+
+    rendered = threading.Event()
+
+    def fake_render(srtm_path, preview_path):
+        rendered.set()
+        return True
+
+    async def slow_gee(*args):
+        # Only finishes once the preview has been rendered.
+        assert await asyncio.to_thread(rendered.wait, 5)
+        return str(tmp_path / "g.tif")
+
+    mock_srtm = MagicMock()
+    mock_srtm.fetch = AsyncMock(return_value=str(tmp_path / "s.tif"))
+    mock_gee = MagicMock()
+    mock_gee.fetch = slow_gee
+    mock_osm = MagicMock()
+    mock_osm.fetch_path = AsyncMock(return_value=str(tmp_path / "osm.json"))
+
+    adapters = {"srtm": mock_srtm, "gee": mock_gee, "osm": mock_osm}
+    preview_out = str(tmp_path / "preview.png")
+
+    with patch("deep_earth.cli._render_preview", side_effect=fake_render):
+        from deep_earth.cli import run_fetch_all
+        from deep_earth.region import RegionContext
+
+        bbox = RegionContext(45.0, 45.1, -93.0, -92.9)
+        output = await run_fetch_all(
+            bbox, 10, 2023, adapters=adapters, preview_path=preview_out,
+        )
+
+    assert output["preview"] == preview_out
+    assert output["results"]["embeddings"].endswith("g.tif")
+
 def test_cli_error_has_exit_code():
     """CLIError stores an exit code (defaults to 1)."""
     from deep_earth.cli import CLIError
@@ -284,3 +407,124 @@ def test_cli_error_has_exit_code():
     assert err.exit_code == 1
     err2 = CLIError("boom", exit_code=2)
     assert err2.exit_code == 2
+
+
+def test_read_preview_band_decimates_large_rasters():
+    """Rasters larger than PREVIEW_MAX_DIM are read at reduced size."""
+    from deep_earth.cli import PREVIEW_MAX_DIM, _read_preview_band
+
+    src = MagicMock(height=PREVIEW_MAX_DIM * 4, width=PREVIEW_MAX_DIM * 2)
+    _read_preview_band(src)
+    src.read.assert_called_once_with(
+        1, out_shape=(PREVIEW_MAX_DIM, PREVIEW_MAX_DIM // 2),
+    )
+
+    small = MagicMock(height=10, width=10)
+    _read_preview_band(small)
+    small.read.assert_called_once_with(1)
+
+
+def test_cli_import_does_not_load_providers():
+    """Importing the CLI leaves provider and region modules unloaded."""
+    code = (
+        "import sys, deep_earth.cli; "
+        "heavy = [m for m in sys.modules if m.startswith("
+        "('deep_earth.providers', 'deep_earth.region', 'rasterio', 'ee'))]; "
+        "print(heavy)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == "[]"
+
+
+def test_print_json_matches_stdlib_output(capsys):
+    """orjson and stdlib fallback print the same indented JSON."""
+    from deep_earth.cli import _print_json
+
+    output = {"results": {"srtm": "/c/s.tif", "osm": None}, "errors": {"gee": "x"}}
+    _print_json(output)
+    fast = capsys.readouterr().out
+    with patch("deep_earth.cli.HAS_ORJSON", False):
+        _print_json(output)
+    slow = capsys.readouterr().out
+
+    assert fast == slow == json.dumps(output, indent=2) + "\n"
+
+
+def test_main_logic_streams_results_as_they_arrive(capsys):
+    """Results are on stdout before the run ends; the whole is valid JSON."""
+    from deep_earth.cli import main_logic
+
+    seen_before_return = []
+
+    async def fake_run_fetch_all(*args, on_result=None, **kwargs):
+        on_result("osm", "/c/osm.json")
+        seen_before_return.append(capsys.readouterr().out)
+        on_result("srtm", None)
+        return {
+            "results": {"srtm": None, "osm": "/c/osm.json"},
+            "errors": {"srtm": "boom"},
+        }
+
+    args = MagicMock(bbox="45.0,-93.0,45.1,-92.9", resolution=10.0, year=2023)
+    args.preview = None
+    with patch("deep_earth.cli.setup_logging"), \
+         patch("deep_earth.cli.run_fetch_all", side_effect=fake_run_fetch_all):
+        main_logic(args)
+
+    assert '"osm": "/c/osm.json"' in seen_before_return[0]
+    streamed = json.loads(seen_before_return[0] + capsys.readouterr().out)
+    assert streamed == {
+        "results": {"osm": "/c/osm.json", "srtm": None},
+        "errors": {"srtm": "boom"},
+    }
+
+
+def test_result_stream_matches_indented_json(capsys):
+    """Streamed output is laid out like json.dumps(indent=2)."""
+    from deep_earth.cli import _ResultStream
+
+    output = {
+        "results": {"srtm": "/c/s.tif", "embeddings": None},
+        "errors": {"embeddings": "no data"},
+        "preview": "/tmp/p.png",
+    }
+
+    def stream_all():
+        stream = _ResultStream()
+        for name, path in output["results"].items():
+            stream.add(name, path)
+        stream.finish(output)
+        return capsys.readouterr().out
+
+    from deep_earth.cli import HAS_ORJSON
+    if HAS_ORJSON:
+        # The stdlib encoder is only the fallback
+        with patch("deep_earth.cli.json.dumps", side_effect=AssertionError):
+            fast = stream_all()
+    else:
+        fast = stream_all()
+    with patch("deep_earth.cli.HAS_ORJSON", False):
+        slow = stream_all()
+
+    assert fast == slow == json.dumps(output, indent=2) + "\n"
+
+
+def test_build_parser_only_populates_selected_command():
+    """Subcommand arguments are defined only for the command being run."""
+    from deep_earth.cli import _build_parser, _selected_command
+
+    assert _selected_command(["--bbox", "1,2,3,4"]) is None
+    assert _selected_command(["fetch", "--bbox", "1,2,3,4"]) == "fetch"
+
+    args = _build_parser("fetch").parse_args(
+        ["fetch", "--bbox", "1,2,3,4", "--preview", "p.png"],
+    )
+    assert (args.command, args.preview) == ("fetch", "p.png")
+
+    args = _build_parser("setup").parse_args(["setup", "--generate-template"])
+    assert args.generate_template is True
+    with pytest.raises(SystemExit):
+        _build_parser("setup").parse_args(["fetch", "--bbox", "1,2,3,4"])
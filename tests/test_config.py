@@ -1,7 +1,7 @@
 import os
 import pytest
 from unittest.mock import patch
-from deep_earth.config import Config
+from deep_earth.config import Config, get_config, houdini_user_pref_dir
 
 def test_default_cache_path():
     with patch.dict(os.environ, {"HOUDINI_USER_PREF_DIR": "/fake/houdini"}):
@@ -17,3 +17,30 @@ def test_default_cache_path_no_env():
 def test_custom_cache_path():
     config = Config(cache_path="/custom/cache")
     assert config.cache_path == "/custom/cache"
+
+def test_cache_dir_created_once_per_path(tmp_path):
+    cache_path = str(tmp_path / "cache")
+    with patch("deep_earth.config.os.makedirs", wraps=os.makedirs) as spy:
+        Config(cache_path=cache_path)
+        Config(cache_path=cache_path)
+    assert os.path.isdir(cache_path)
+    assert spy.call_count == 1
+
+def test_get_config_is_cached(tmp_path):
+    get_config.cache_clear()
+    try:
+        first = get_config(str(tmp_path))
+        assert get_config(str(tmp_path)) is first
+        assert first.cache_path == str(tmp_path)
+    finally:
+        get_config.cache_clear()
+
+def test_houdini_user_pref_dir_expands_home_once():
+    """The env var is read per call; ~/.houdini is not re-expanded."""
+    with patch.dict(os.environ, {"HOUDINI_USER_PREF_DIR": "/fake/houdini"}):
+        assert houdini_user_pref_dir() == "/fake/houdini"
+    expected = os.path.expanduser("~/.houdini")
+    with patch.dict(os.environ, {}, clear=True), \
+         patch("deep_earth.config.os.path.expanduser") as expand:
+        assert houdini_user_pref_dir() == expected
+        expand.assert_not_called()
@@ -145,4 +145,22 @@ def test_get_gcs_bucket_none():
         manager = CredentialsManager(path="/x.json")
     with patch.dict(os.environ, {}, clear=True):
         os.environ.pop("DEEP_EARTH_GCS_BUCKET", None)
-        assert manager.get_gcs_bucket() is None
\ No newline at end of file
+        assert manager.get_gcs_bucket() is None
+
+def test_credentials_file_parsed_once_until_modified(tmp_path, mock_credentials):
+    """Unchanged credentials files are parsed once; edits are picked up."""
+    cred_path = tmp_path / "credentials.json"
+    cred_path.write_text(json.dumps(mock_credentials))
+
+    with patch("deep_earth.credentials.json.load", wraps=json.load) as spy:
+        first = CredentialsManager(path=str(cred_path))
+        second = CredentialsManager(path=str(cred_path))
+        assert spy.call_count == 1
+        assert second.get_opentopography_key() == "test_api_key"
+
+        mock_credentials["opentopography"]["api_key"] = "rotated_key"
+        cred_path.write_text(json.dumps(mock_credentials))
+        third = CredentialsManager(path=str(cred_path))
+        assert spy.call_count == 2
+        assert third.get_opentopography_key() == "rotated_key"
+    assert first.get_opentopography_key() == "test_api_key"
@@ -76,4 +76,27 @@ async def test_ee_fetch_logic_flow(mock_credentials, mock_cache, coordinate_mana
                         result = await adapter.fetch(coordinate_manager, resolution=10, year=2023)
                         
                         assert result == "/tmp/exported.tif"
-                        assert mock_fetch.called
\ No newline at end of file
+                        assert mock_fetch.called
+
+
+@pytest.mark.asyncio
+async def test_ee_fetch_memoizes_collection_size(mock_credentials, mock_cache, coordinate_manager):
+    """Repeat fetches for one asset and year query the image count once."""
+    with patch("ee.ServiceAccountCredentials"), patch("ee.Initialize"):
+        adapter = EarthEngineAdapter(mock_credentials, mock_cache)
+        mock_cache.exists.return_value = False
+
+        with patch("ee.ImageCollection") as mock_coll_cls, patch("ee.Geometry.Rectangle"):
+            mock_collection = MagicMock()
+            mock_coll_cls.return_value = mock_collection
+            mock_collection.filterDate.return_value = mock_collection
+            mock_collection.size.return_value.getInfo.return_value = 1
+
+            with patch.object(adapter, "_fetch_direct", return_value="/tmp/exported.tif"):
+                await adapter.fetch(coordinate_manager, resolution=10, year=2023)
+                await adapter.fetch(coordinate_manager, resolution=30, year=2023)
+                assert mock_collection.size.return_value.getInfo.call_count == 1
+
+                adapter.reset()
+                await adapter.fetch(coordinate_manager, resolution=10, year=2023)
+                assert mock_collection.size.return_value.getInfo.call_count == 2
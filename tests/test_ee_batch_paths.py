@@ -5,6 +5,7 @@ _fetch_direct success + fallback, _fetch_batch full path, _poll_task
 states, _download_from_gcs, transform_to_grid, and fetch cache hit.
 """
 import asyncio
+import os
 import pytest
 import numpy as np
 from unittest.mock import patch, MagicMock, AsyncMock, PropertyMock
@@ -116,19 +117,44 @@ async def test_fetch_direct_success(adapter_initialized):
     mock_image.projection.return_value.nominalScale.return_value.getInfo.return_value = 10
     mock_image.projection.return_value.crs.return_value.getInfo.return_value = "EPSG:32615"
 
-    adapter_initialized.cache.save.return_value = "/cache/embed.tif"
+    cache = adapter_initialized.cache
+    cache.partial_path.return_value = "/cache/embed.tif.part"
+    cache.save_file.return_value = "/cache/embed.tif"
 
-    with patch("deep_earth.providers.earth_engine.fetch_with_retry",
-               new_callable=AsyncMock, return_value=b"tiff-bytes"):
+    with patch("deep_earth.providers.earth_engine.download_with_retry",
+               new_callable=AsyncMock) as mock_download:
         with patch("aiohttp.ClientSession"):
             result = await adapter_initialized._fetch_direct(
                 mock_image, MagicMock(), "test_key",
             )
 
     assert result == "/cache/embed.tif"
-    adapter_initialized.cache.save.assert_called_once_with(
-        "test_key", b"tiff-bytes", category="embeddings",
+    # Streamed to the scratch path, then adopted into the cache
+    assert mock_download.await_args[0][1:] == (
+        "https://ee.example.com/dl", "/cache/embed.tif.part",
     )
+    cache.save_file.assert_called_once_with(
+        "test_key", "/cache/embed.tif.part", category="embeddings",
+    )
+
+
+@pytest.mark.asyncio
+async def test_fetch_direct_uses_given_projection(adapter_initialized):
+    """CRS and scale from fetch() -> no projection getInfo() round-trips."""
+    mock_image = MagicMock()
+    mock_image.getDownloadURL.return_value = "https://ee.example.com/dl"
+
+    with patch("deep_earth.providers.earth_engine.download_with_retry",
+               new_callable=AsyncMock):
+        await adapter_initialized._fetch_direct(
+            mock_image, MagicMock(), "test_key",
+            crs="EPSG:32615", scale=10,
+        )
+
+    assert not mock_image.projection.called
+    params = mock_image.getDownloadURL.call_args[0][0]
+    assert params["crs"] == "EPSG:32615"
+    assert params["scale"] == 10
 
 
 # ---------------------------------------------------------------------------
@@ -184,6 +210,52 @@ async def test_fetch_batch_success(adapter_initialized):
     mock_task.start.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_fetch_batch_uses_known_crs_and_scale(adapter_initialized):
+    """Given CRS and scale, the export skips the projection round trips."""
+    mock_image = MagicMock()
+    mock_task = MagicMock()
+
+    with patch("ee.batch.Export.image.toCloudStorage",
+               return_value=mock_task) as export, \
+         patch.object(
+             adapter_initialized, "_poll_task",
+             new_callable=AsyncMock,
+             return_value={"state": "COMPLETED"},
+         ), \
+         patch.object(
+             adapter_initialized, "_download_from_gcs",
+             new_callable=AsyncMock,
+             return_value="/cache/batch.tif",
+         ):
+        await adapter_initialized._fetch_batch(
+            mock_image, MagicMock(), "test_key",
+            crs="EPSG:32615", scale=10.0,
+        )
+
+    mock_image.projection.assert_not_called()
+    assert export.call_args.kwargs["crs"] == "EPSG:32615"
+    assert export.call_args.kwargs["scale"] == 10.0
+
+
+@pytest.mark.asyncio
+async def test_fetch_passes_crs_and_scale_to_batch(adapter_initialized, large_region):
+    """fetch hands the batch export the UTM CRS and resolution it reprojected to."""
+    with patch("ee.ImageCollection") as mock_ic, \
+         patch("ee.Geometry.Rectangle"), \
+         patch.object(adapter_initialized, "_fetch_batch",
+                      new_callable=AsyncMock,
+                      return_value="/cache/batch.tif") as batch:
+        mock_ic.return_value.filterDate.return_value.size.return_value \
+            .getInfo.return_value = 1
+        result = await adapter_initialized.fetch(large_region, resolution=10)
+
+    assert result == "/cache/batch.tif"
+    assert batch.await_args.kwargs == {
+        "crs": f"EPSG:{large_region.utm_epsg}", "scale": 10,
+    }
+
+
 @pytest.mark.asyncio
 async def test_fetch_batch_task_failed(adapter_initialized):
     """Task status FAILED -> returns None."""
@@ -223,6 +295,103 @@ async def test_fetch_batch_exception(adapter_initialized):
     assert result is None
 
 
+# ---------------------------------------------------------------------------
+# _fetch_tiled — parallel tile download + mosaic
+# ---------------------------------------------------------------------------
+
+def _tile_bytes(x0, value):
+    """Encode a 2-band 4x4 GeoTIFF tile whose left edge is at x0."""
+    import rasterio
+    from rasterio.io import MemoryFile
+    from rasterio.transform import from_origin
+
+    with MemoryFile() as mem:
+        with mem.open(
+            driver="GTiff", height=4, width=4, count=2, dtype="float32",
+            crs="EPSG:32615", transform=from_origin(x0, 100.0, 10.0, 10.0),
+        ) as dst:
+            dst.write(np.full((2, 4, 4), value, dtype=np.float32))
+        return mem.read()
+
+
+def test_merge_geotiffs_mosaics_adjacent_tiles(tmp_path):
+    """Side-by-side tiles merge into one wider raster on disk."""
+    import rasterio
+    from deep_earth.providers.earth_engine import _merge_geotiffs
+
+    paths = []
+    for i, (x0, value) in enumerate([(0.0, 1.0), (40.0, 2.0)]):
+        path = tmp_path / f"tile{i}.tif"
+        path.write_bytes(_tile_bytes(x0, value))
+        paths.append(str(path))
+    out = str(tmp_path / "mosaic.tif")
+
+    _merge_geotiffs(paths, out)
+
+    with rasterio.open(out) as src:
+        assert src.driver == "GTiff"
+        assert (src.count, src.height, src.width) == (2, 4, 8)
+        data = src.read()
+    assert np.all(data[:, :, :4] == 1.0)
+    assert np.all(data[:, :, 4:] == 2.0)
+
+
+@pytest.mark.asyncio
+async def test_fetch_tiled_downloads_and_merges(adapter_initialized, region, tmp_path):
+    """Each tile is streamed to its own file; the mosaic is adopted by the cache."""
+    from deep_earth.cache import CacheManager
+
+    cache = CacheManager(str(tmp_path / "cache"))
+    adapter_initialized.cache = cache
+    mock_image = MagicMock()
+    mock_image.getDownloadURL.side_effect = ["https://ee/1", "https://ee/2"]
+    tiles = {"https://ee/1": _tile_bytes(0.0, 1.0), "https://ee/2": _tile_bytes(40.0, 2.0)}
+
+    async def fake_download(session, url, path, params=None):
+        with open(path, "wb") as f:
+            f.write(tiles[url])
+
+    with patch("deep_earth.providers.earth_engine.download_with_retry",
+               side_effect=fake_download) as download, \
+         patch("ee.Geometry.Rectangle"):
+        result = await adapter_initialized._fetch_tiled(
+            mock_image, [region, region], "EPSG:32615", 10.0,
+            MagicMock(), "test_key",
+        )
+
+    assert result == cache.get_path("test_key", category="embeddings")
+    assert mock_image.getDownloadURL.call_count == 2
+    assert download.await_count == 2
+    # Tile scratch files are removed once merged
+    tile_dirs = {os.path.dirname(c.args[2]) for c in download.await_args_list}
+    assert not [f for d in tile_dirs for f in os.listdir(d) if f.endswith(".part")]
+    import rasterio
+    with rasterio.open(result) as src:
+        assert (src.count, src.height, src.width) == (2, 4, 8)
+
+
+@pytest.mark.asyncio
+async def test_fetch_uses_tiles_for_medium_region(adapter_initialized):
+    """A region spanning a few tiles uses _fetch_tiled, not batch export."""
+    medium = RegionContext(
+        lat_min=44.9, lat_max=45.0, lon_min=-93.3, lon_max=-93.2,
+    )
+    with patch("ee.ImageCollection") as mock_ic, \
+         patch("ee.Geometry.Rectangle"), \
+         patch.object(adapter_initialized, "_fetch_tiled",
+                      new_callable=AsyncMock,
+                      return_value="/cache/tiled.tif") as tiled, \
+         patch.object(adapter_initialized, "_fetch_batch",
+                      new_callable=AsyncMock) as batch:
+        mock_ic.return_value.filterDate.return_value.size.return_value \
+            .getInfo.return_value = 1
+        result = await adapter_initialized.fetch(medium, resolution=10)
+
+    assert result == "/cache/tiled.tif"
+    assert 1 < len(tiled.await_args.args[1]) <= 32
+    batch.assert_not_awaited()
+
+
 # ---------------------------------------------------------------------------
 # _poll_task
 # ---------------------------------------------------------------------------
@@ -286,13 +455,14 @@ async def test_poll_task_timeout(adapter_initialized):
 async def test_download_from_gcs_success(adapter_initialized):
     """Downloads blob, saves to cache, and deletes blob from GCS."""
     mock_blob = MagicMock()
-    mock_blob.download_as_bytes.return_value = b"geotiff-data"
     mock_bucket = MagicMock()
     mock_bucket.blob.return_value = mock_blob
     mock_client = MagicMock()
     mock_client.bucket.return_value = mock_bucket
 
-    adapter_initialized.cache.save.return_value = "/cache/dl.tif"
+    cache = adapter_initialized.cache
+    cache.partial_path.return_value = "/cache/dl.tif.part"
+    cache.save_file.return_value = "/cache/dl.tif"
 
     with patch(
         "deep_earth.providers.earth_engine.storage.Client"
@@ -304,9 +474,11 @@ async def test_download_from_gcs_success(adapter_initialized):
         )
 
     assert result == "/cache/dl.tif"
+    mock_blob.download_to_filename.assert_called_once_with("/cache/dl.tif.part")
+    assert not mock_blob.download_as_bytes.called
     mock_blob.delete.assert_called_once()
-    adapter_initialized.cache.save.assert_called_once_with(
-        "cache_key", b"geotiff-data", category="embeddings",
+    cache.save_file.assert_called_once_with(
+        "cache_key", "/cache/dl.tif.part", category="embeddings",
     )
 
 
@@ -314,14 +486,13 @@ async def test_download_from_gcs_success(adapter_initialized):
 async def test_download_from_gcs_cleanup_fails(adapter_initialized):
     """Blob delete fails -> still returns cache path (warning logged)."""
     mock_blob = MagicMock()
-    mock_blob.download_as_bytes.return_value = b"geotiff-data"
     mock_blob.delete.side_effect = Exception("permission denied")
     mock_bucket = MagicMock()
     mock_bucket.blob.return_value = mock_blob
     mock_client = MagicMock()
     mock_client.bucket.return_value = mock_bucket
 
-    adapter_initialized.cache.save.return_value = "/cache/dl.tif"
+    adapter_initialized.cache.save_file.return_value = "/cache/dl.tif"
 
     with patch(
         "deep_earth.providers.earth_engine.storage.Client"
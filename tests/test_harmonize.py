@@ -1,7 +1,10 @@
 import pytest
 import numpy as np
 import rasterio
-from deep_earth.harmonize import Harmonizer, FetchResult
+from rasterio.warp import Resampling, reproject
+from unittest.mock import patch
+from deep_earth import harmonize
+from deep_earth.harmonize import Harmonizer, FetchResult, NEAREST_GATHER_MAX_SOURCE_RATIO
 from deep_earth.region import RegionContext as CoordinateManager
 
 @pytest.fixture
@@ -127,6 +130,29 @@ def test_process_fetch_result_success(coordinate_manager, tmp_path):
     assert result.path == str(src_path)
 
 
+def test_process_fetch_results_concurrent(coordinate_manager, tmp_path):
+    h = Harmonizer(coordinate_manager, resolution=100)
+    dem_path = tmp_path / "dem.tif"
+    embed_path = tmp_path / "embed.tif"
+    _write_wgs84_tif(dem_path, np.random.rand(20, 20).astype(np.float32))
+    _write_wgs84_tif(embed_path, np.random.rand(3, 20, 20).astype(np.float32))
+
+    results = h.process_fetch_results({
+        "srtm": (str(dem_path), 1),
+        "gee": (str(embed_path), None),
+        "osm": (RuntimeError("boom"), None),
+    })
+
+    assert list(results) == ["srtm", "gee", "osm"]
+    dem, dem_result = results["srtm"]
+    assert dem_result.ok
+    assert np.array_equal(dem, h.resample(str(dem_path), bands=1))
+    embed, embed_result = results["gee"]
+    assert embed_result.ok and embed.shape == (3, h.height, h.width)
+    assert results["osm"][0] is None
+    assert not results["osm"][1].ok
+
+
 def test_process_fetch_result_bad_file(coordinate_manager, tmp_path):
     h = Harmonizer(coordinate_manager, resolution=100)
     bad_path = str(tmp_path / "missing.tif")
@@ -134,3 +160,336 @@ def test_process_fetch_result_bad_file(coordinate_manager, tmp_path):
     assert grid is None
     assert result.ok is False
     assert "resample failed" in result.error
+
+
+def _write_wgs84_tif(path, data):
+    count = 1 if data.ndim == 2 else data.shape[0]
+    rows, cols = data.shape[-2:]
+    with rasterio.open(
+        path, 'w',
+        driver='GTiff', height=rows, width=cols, count=count,
+        dtype=str(data.dtype), crs='EPSG:4326',
+        transform=rasterio.transform.from_bounds(
+            -93.1, 44.9, -92.9, 45.1, cols, rows
+        ),
+    ) as dst:
+        if data.ndim == 2:
+            dst.write(data, 1)
+        else:
+            dst.write(data)
+
+
+def test_resample_tiled_matches_single_tile(coordinate_manager, tmp_path):
+    h = Harmonizer(coordinate_manager, resolution=100)
+    src_path = tmp_path / "dem.tif"
+    _write_wgs84_tif(src_path, np.random.rand(3, 20, 20).astype(np.float32))
+
+    whole = h.resample(str(src_path), tile_size=max(h.width, h.height))
+    tiled = h.resample(str(src_path), tile_size=64)
+
+    assert tiled.shape == whole.shape == (3, h.height, h.width)
+    # GDAL's approximate transformer is evaluated per window, so tile
+    # seams differ from a single warp only within its error threshold.
+    assert np.allclose(tiled, whole, atol=1e-2)
+
+
+def test_resample_to_memmap(coordinate_manager, tmp_path):
+    h = Harmonizer(coordinate_manager, resolution=100)
+    src_path = tmp_path / "dem.tif"
+    _write_wgs84_tif(src_path, np.random.rand(20, 20).astype(np.float32))
+
+    out = h.resample(
+        str(src_path), bands=1, tile_size=64,
+        out_path=str(tmp_path / "out.dat"),
+    )
+
+    assert isinstance(out, np.memmap)
+    assert np.array_equal(out, h.resample(str(src_path), bands=1, tile_size=64))
+
+
+def test_resample_reuses_scratch_buffer(coordinate_manager, tmp_path):
+    h = Harmonizer(coordinate_manager, resolution=100)
+    src_path = tmp_path / "embed.tif"
+    _write_wgs84_tif(src_path, np.random.rand(3, 20, 20).astype(np.float32))
+
+    first = h.resample(str(src_path), tile_size=64)
+    scratch = h._scratch_cache[np.dtype("float32")]
+    second = h.resample(str(src_path), tile_size=64)
+
+    assert h._scratch_cache[np.dtype("float32")] is scratch
+    # Results are fresh arrays, never views of the shared buffer
+    assert not np.shares_memory(first, scratch)
+    assert np.array_equal(first, second)
+
+
+def test_resample_nearest_gathers_through_cached_index(coordinate_manager, tmp_path):
+    h = Harmonizer(coordinate_manager, resolution=100)
+    src_path = tmp_path / "classes.tif"
+    data = np.random.randint(1, 50, (3, 20, 20)).astype(np.int32)
+    _write_wgs84_tif(src_path, data)
+
+    gathered = h.resample(str(src_path), resampling=Resampling.nearest)
+
+    expected = np.empty_like(gathered)
+    with rasterio.open(src_path) as src:
+        reproject(
+            source=rasterio.band(src, [1, 2, 3]),
+            destination=expected,
+            src_transform=src.transform,
+            src_crs=src.crs,
+            dst_transform=h.dst_transform,
+            dst_crs=h.dst_crs,
+            resampling=Resampling.nearest,
+        )
+    assert np.array_equal(gathered, expected)
+
+    # Every band and later calls on the same grid reuse one warp
+    assert len(h._index_cache) == 1
+    with patch("deep_earth.harmonize.reproject") as spy:
+        again = h.resample(str(src_path), bands=2, resampling=Resampling.nearest)
+    assert not spy.called
+    assert np.array_equal(again, expected[1])
+
+
+def _nearest_reference(h, src_path, bands):
+    expected = np.empty((len(bands), h.height, h.width), dtype=np.int32)
+    with rasterio.open(src_path) as src:
+        reproject(
+            source=rasterio.band(src, bands),
+            destination=expected,
+            src_transform=src.transform,
+            src_crs=src.crs,
+            dst_transform=h.dst_transform,
+            dst_crs=h.dst_crs,
+            resampling=Resampling.nearest,
+        )
+    return expected
+
+
+def test_resample_nearest_reads_only_covered_window(tmp_path):
+    # Master grid covers the middle of the source
+    h = Harmonizer(
+        CoordinateManager(lat_min=44.95, lat_max=45.05, lon_min=-93.05, lon_max=-92.95),
+        resolution=100,
+    )
+    src_path = tmp_path / "classes.tif"
+    data = np.random.randint(1, 50, (2, 40, 40)).astype(np.int32)
+    _write_wgs84_tif(src_path, data)
+
+    gathered = h.resample(str(src_path), resampling=Resampling.nearest)
+
+    assert np.array_equal(gathered, _nearest_reference(h, src_path, [1, 2]))
+    (_, _, window), = h._index_cache.values()
+    assert window.width < 40 and window.height < 40
+
+
+def test_resample_nearest_warps_much_larger_sources(coordinate_manager, tmp_path):
+    h = Harmonizer(coordinate_manager, resolution=1000)
+    src_path = tmp_path / "classes.tif"
+    data = np.random.randint(1, 50, (1, 200, 200)).astype(np.int32)
+    _write_wgs84_tif(src_path, data)
+    assert data[0].size > NEAREST_GATHER_MAX_SOURCE_RATIO * h.width * h.height
+
+    warped = h.resample(str(src_path), bands=[1], resampling=Resampling.nearest)
+
+    assert not h._index_cache
+    assert np.array_equal(warped, _nearest_reference(h, src_path, [1])[0])
+
+
+def test_process_fetch_result_gathers_8bit_class_maps(coordinate_manager, tmp_path):
+    h = Harmonizer(coordinate_manager, resolution=100)
+    src_path = tmp_path / "landcover.tif"
+    data = np.random.choice([10, 20, 30], (20, 20)).astype(np.uint8)
+    _write_wgs84_tif(src_path, data)
+
+    grid, result = h.process_fetch_result(str(src_path), "local", bands=1)
+
+    assert result.ok
+    # Nearest by default: no interpolated classes, via the cached index
+    assert set(np.unique(grid)) <= {10, 20, 30}
+    assert len(h._index_cache) == 1
+    assert np.array_equal(grid, _nearest_reference(h, src_path, [1])[0])
+
+
+def test_nearest_index_cache_is_bounded(coordinate_manager, tmp_path):
+    from deep_earth.harmonize import INDEX_CACHE_SIZE
+
+    h = Harmonizer(coordinate_manager, resolution=1000)
+    data = np.random.randint(1, 50, (8, 8)).astype(np.uint8)
+    paths = []
+    for i in range(INDEX_CACHE_SIZE + 1):
+        path = tmp_path / f"grid{i}.tif"
+        _write_wgs84_tif(path, np.pad(data, ((0, i), (0, 0))))
+        paths.append(str(path))
+
+    for path in paths:
+        h.resample(path, bands=1)
+    h.resample(paths[1], bands=1)
+
+    assert len(h._index_cache) == INDEX_CACHE_SIZE
+    # The least recently used grid (the first) was evicted
+    heights = [key[2] for key in h._index_cache]
+    assert 8 not in heights
+    assert heights[-1] == 9
+
+
+def test_resample_aligned_source_skips_warp(coordinate_manager, tmp_path):
+    h = Harmonizer(coordinate_manager, resolution=100)
+    data = np.random.rand(2, h.height + 4, h.width + 6).astype(np.float32)
+    # Same CRS and pixel size, shifted by 3 columns and 1 row
+    t = h.dst_transform
+    src_transform = rasterio.Affine(t.a, 0, t.c - 3 * t.a, 0, t.e, t.f - t.e)
+    src_path = tmp_path / "aligned.tif"
+    with rasterio.open(
+        src_path, "w", driver="GTiff", height=data.shape[1],
+        width=data.shape[2], count=2, dtype="float32",
+        crs=h.dst_crs, transform=src_transform,
+    ) as dst:
+        dst.write(data)
+
+    with patch("deep_earth.harmonize.reproject") as spy:
+        out = h.resample(str(src_path))
+        band = h.resample(str(src_path), bands=2)
+
+    assert not spy.called
+    assert np.array_equal(out, data[:, 1:1 + h.height, 3:3 + h.width])
+    assert np.array_equal(band, data[1, 1:1 + h.height, 3:3 + h.width])
+
+
+def test_resample_aligned_partial_source_is_filled(coordinate_manager, tmp_path):
+    h = Harmonizer(coordinate_manager, resolution=100)
+    data = np.ones((h.height - 2, h.width), dtype=np.float32)
+    src_path = tmp_path / "short.tif"
+    with rasterio.open(
+        src_path, "w", driver="GTiff", height=data.shape[0],
+        width=data.shape[1], count=1, dtype="float32", nodata=-9999,
+        crs=h.dst_crs, transform=h.dst_transform,
+    ) as dst:
+        dst.write(data, 1)
+
+    out = h.resample(str(src_path), bands=1)
+
+    assert np.all(out[:-2] == 1)
+    assert np.all(out[-2:] == -9999)
+
+
+def test_resample_passes_warp_settings(coordinate_manager, tmp_path):
+    h = Harmonizer(
+        coordinate_manager, resolution=100, num_threads=3, warp_mem_limit=256
+    )
+    src_path = tmp_path / "dem.tif"
+    _write_wgs84_tif(src_path, np.random.rand(20, 20).astype(np.float32))
+
+    with patch("deep_earth.harmonize.reproject") as spy:
+        h.resample(str(src_path), bands=1)
+
+    assert spy.called
+    for call in spy.call_args_list:
+        assert call.kwargs["num_threads"] == 3
+        assert call.kwargs["warp_mem_limit"] == 256
+
+
+def test_default_num_threads_leaves_one_cpu(coordinate_manager):
+    with patch("deep_earth.harmonize.os.cpu_count", return_value=8):
+        assert Harmonizer(coordinate_manager).num_threads == 7
+    with patch("deep_earth.harmonize.os.cpu_count", return_value=None):
+        assert Harmonizer(coordinate_manager).num_threads == 1
+
+
+def test_compute_quality_layer_per_cell(coordinate_manager):
+    h = Harmonizer(coordinate_manager, resolution=100)
+    height_grid = np.zeros((h.height, h.width), dtype=np.float32)
+    height_grid[0, 0] = np.nan
+    embed_grid = np.zeros((64, h.height, h.width), dtype=np.float32)
+    embed_grid[3, 1, 1] = np.nan
+
+    q = h.compute_quality_layer(height_grid=height_grid, embed_grid=embed_grid)
+
+    assert q.dtype == np.float32
+    assert q[0, 0] == pytest.approx(0.5)   # embeddings only
+    assert q[1, 1] == pytest.approx(0.25)  # DEM only
+    assert q[2, 2] == pytest.approx(0.75)  # DEM + embeddings
+
+
+def test_compute_quality_layer_reduces_embeddings_per_band(coordinate_manager):
+    import tracemalloc
+
+    h = Harmonizer(coordinate_manager, resolution=100)
+    embed_grid = np.zeros((64, h.height, h.width), dtype=np.float32)
+    embed_grid[5, 2, 2] = np.nan
+
+    tracemalloc.start()
+    try:
+        q = h.compute_quality_layer(embed_grid=embed_grid)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    # Never a (64, H, W) boolean mask
+    assert peak < embed_grid.size
+    assert q[2, 2] == 0.0
+    assert q[3, 3] == pytest.approx(0.5)
+
+
+def test_compute_quality_layer_constant_is_broadcast(coordinate_manager):
+    h = Harmonizer(coordinate_manager, resolution=100)
+    q = h.compute_quality_layer(
+        height_grid=np.zeros((h.height, h.width), dtype=np.float32)
+    )
+
+    assert q.shape == (h.height, h.width)
+    assert q.dtype == np.float32
+    assert q.strides == (0, 0)
+    assert not q.flags.writeable
+    assert np.all(q == 0.25)
+
+
+def test_layer_kind_classified_on_add(coordinate_manager):
+    h = Harmonizer(coordinate_manager, resolution=100)
+    shape = (h.height, h.width)
+    h.add_layers({
+        "dist": np.zeros(shape, np.float32),
+        "ids": np.zeros(shape, np.int32),
+        "tags": np.full(shape, "road", dtype=object),
+        "mask": np.zeros(shape, bool),
+    })
+    h.layers["late"] = np.zeros(shape, np.float64)
+
+    assert [h.layer_kind(n) for n in ("dist", "ids", "tags", "mask", "late")] == [
+        "f", "i", "s", None, "f",
+    ]
+
+
+def test_resample_gpu_requires_cupy(coordinate_manager, monkeypatch):
+    monkeypatch.setattr(harmonize, "HAS_CUPY", False)
+    h = Harmonizer(coordinate_manager, resolution=100)
+    with pytest.raises(ImportError, match="cupy"):
+        h.resample_gpu("unused.tif")
+
+
+@pytest.mark.skipif(not harmonize.HAS_CUPY, reason="cupy not installed")
+def test_resample_gpu_matches_gdal_bilinear(coordinate_manager, tmp_path):
+    h = Harmonizer(coordinate_manager, resolution=100)
+    src_path = tmp_path / "smooth.tif"
+    yy, xx = np.mgrid[0:20, 0:20]
+    _write_wgs84_tif(src_path, (xx + 2.0 * yy).astype(np.float32))
+
+    cpu = h.resample(str(src_path), bands=1)
+    gpu = h.resample_gpu(str(src_path), bands=1)
+
+    assert gpu.shape == cpu.shape
+    # Both interpolate a linear ramp; they differ only by transformer error
+    assert np.allclose(gpu, cpu, atol=0.05)
+
+
+def test_cell_center_vectors_match_transform(coordinate_manager):
+    h = Harmonizer(coordinate_manager, resolution=100)
+    assert h.xs.shape == (h.width,)
+    assert h.ys.shape == (h.height,)
+
+    xx, yy = h.xy_meshgrid()
+    assert xx.shape == yy.shape == (h.height, h.width)
+
+    ex, ey = h.dst_transform * (2 + 0.5, 3 + 0.5)
+    assert xx[3, 2] == pytest.approx(ex)
+    assert yy[3, 2] == pytest.approx(ey)
@@ -1,6 +1,7 @@
 import pytest
 import numpy as np
 from unittest.mock import MagicMock, patch
+from affine import Affine
 from deep_earth.houdini.geometry import inject_heightfield
 
 def test_inject_heightfield_calls_hou():
@@ -14,14 +15,17 @@ def test_inject_heightfield_calls_hou():
         h = MagicMock()
         h.width = 10
         h.height = 10
-        h.dst_transform = MagicMock()
-        h.dst_transform.__mul__.return_value = (np.zeros((10, 10)), np.zeros((10, 10)))
+        h.dst_transform = Affine.identity()
+        h.xs = np.arange(10) + 0.5
+        h.ys = np.arange(10) + 0.5
         h.layers = {}
 
         height_grid = np.zeros((10, 10))
         embed_grid = np.zeros((64, 10, 10))
 
-        inject_heightfield(geo, cm, h, height_grid, embed_grid)
+        inject_heightfield(
+            geo, cm, h, height_grid, embed_grid, use_volumes=False
+        )
 
         # Should clear geometry first
         geo.clear.assert_called_once()
@@ -35,4 +39,4 @@ def test_inject_heightfield_calls_hou():
         assert len(height_calls) == 1
         # Should add embedding attribute
         assert geo.addAttrib.called
-        assert geo.setPointFloatAttribValues.called
+        assert geo.setPointFloatAttribValuesFromString.called
@@ -17,16 +17,25 @@ def test_inject_heightfield_sets_positions():
         height_grid = np.zeros((h.height, h.width))
         embed_grid = np.zeros((64, h.height, h.width))
 
-        inject_heightfield(geo, cm, h, height_grid, embed_grid)
+        inject_heightfield(
+            geo, cm, h, height_grid, embed_grid, use_volumes=False
+        )
 
         # Should clear then create points
         geo.clear.assert_called_once()
         create_points_calls = geo.createPoints.call_args_list
         assert len(create_points_calls) == 1
+        assert len(create_points_calls[0][0][0]) == h.width * h.height
 
-        positions = create_points_calls[0][0][0]
+        # Positions are uploaded as one packed float32 P buffer
+        p_calls = [
+            c for c in geo.setPointFloatAttribValuesFromString.call_args_list
+            if c[0][0] == "P"
+        ]
+        assert len(p_calls) == 1
+        positions = np.frombuffer(p_calls[0][0][1], dtype=np.float32)
+        positions = positions.reshape(-1, 3)
         assert len(positions) == h.width * h.height
-        assert len(positions[0]) == 3
 
         # Check first point position (top-left cell center)
         expected_x, expected_y = h.dst_transform * (0.5, 0.5)
@@ -36,6 +45,11 @@ def test_inject_heightfield_sets_positions():
         assert positions[0][1] == pytest.approx(expected_z)
         assert positions[0][2] == pytest.approx(expected_y)
 
+        # Last point is the bottom-right cell centre
+        last_x, last_y = h.dst_transform * (h.width - 0.5, h.height - 0.5)
+        assert positions[-1][0] == pytest.approx(last_x)
+        assert positions[-1][2] == pytest.approx(last_y)
+
         # Height attribute should be created
         height_calls = [
             c for c in geo.addAttrib.call_args_list
@@ -63,7 +77,9 @@ def test_inject_heightfield_injects_osm_attributes():
         height_grid = np.zeros((h.height, h.width))
         embed_grid = np.zeros((64, h.height, h.width))
 
-        inject_heightfield(geo, cm, h, height_grid, embed_grid)
+        inject_heightfield(
+            geo, cm, h, height_grid, embed_grid, use_volumes=False
+        )
 
         add_attrib_calls = [
             call[0][1] for call in geo.addAttrib.call_args_list
@@ -73,13 +89,13 @@ def test_inject_heightfield_injects_osm_attributes():
         assert "height" in add_attrib_calls
 
         road_dist_calls = [
-            call for call in geo.setPointFloatAttribValues.call_args_list
+            call for call in geo.setPointFloatAttribValuesFromString.call_args_list
             if call[0][0] == "road_distance"
         ]
         assert len(road_dist_calls) == 1
 
         landuse_id_calls = [
-            call for call in geo.setPointIntAttribValues.call_args_list
+            call for call in geo.setPointIntAttribValuesFromString.call_args_list
             if call[0][0] == "landuse_id"
         ]
         assert len(landuse_id_calls) == 1
@@ -135,7 +151,7 @@ def test_inject_heightfield_viz_pca():
         assert "Cd" in add_attrib_calls
 
         cd_calls = [
-            call for call in geo.setPointFloatAttribValues.call_args_list
+            call for call in geo.setPointFloatAttribValuesFromString.call_args_list
             if call[0][0] == "Cd"
         ]
         assert len(cd_calls) == 1
@@ -167,11 +183,11 @@ def test_inject_heightfield_viz_biome():
         assert "Cd" in add_attrib_calls
 
         cd_calls = [
-            call for call in geo.setPointFloatAttribValues.call_args_list
+            call for call in geo.setPointFloatAttribValuesFromString.call_args_list
             if call[0][0] == "Cd"
         ]
         assert len(cd_calls) == 1
-        cd_values = cd_calls[0][0][1]
+        cd_values = np.frombuffer(cd_calls[0][0][1], dtype=np.float32)
         assert cd_values[0] == pytest.approx(0.1)
         assert cd_values[1] == pytest.approx(0.5)
         assert cd_values[2] == pytest.approx(0.1)
@@ -191,7 +207,9 @@ def test_inject_heightfield_data_quality():
         quality = h.compute_quality_layer(height_grid, embed_grid)
         h.add_layers({"data_quality": quality})
 
-        inject_heightfield(geo, cm, h, height_grid, embed_grid)
+        inject_heightfield(
+            geo, cm, h, height_grid, embed_grid, use_volumes=False
+        )
 
         add_attrib_calls = [
             call[0][1] for call in geo.addAttrib.call_args_list
@@ -199,11 +217,12 @@ def test_inject_heightfield_data_quality():
         assert "data_quality" in add_attrib_calls
 
         dq_calls = [
-            call for call in geo.setPointFloatAttribValues.call_args_list
+            call for call in geo.setPointFloatAttribValuesFromString.call_args_list
             if call[0][0] == "data_quality"
         ]
         assert len(dq_calls) == 1
-        assert dq_calls[0][0][1][0] == pytest.approx(0.75)
+        dq_values = np.frombuffer(dq_calls[0][0][1], dtype=np.float32)
+        assert dq_values[0] == pytest.approx(0.75)
 
 def test_inject_heightfield_provenance():
     mock_hou = MagicMock()
@@ -230,3 +249,226 @@ def test_inject_heightfield_provenance():
         assert "fetch_timestamp" in global_attribs
         assert "source_year" in global_attribs
         assert "status_ee" in global_attribs
+
+def test_inject_heightfield_uploads_packed_buffers():
+    mock_hou = MagicMock()
+    mock_hou.attribType.Point = "Point"
+
+    with patch.dict("sys.modules", {"hou": mock_hou}):
+        geo = MagicMock()
+        cm = CoordinateManager(45.0, 45.1, 10.0, 10.1)
+        h = Harmonizer(cm, resolution=100)
+
+        height_grid = np.random.rand(h.height, h.width)
+        embed_grid = np.random.rand(64, h.height, h.width)
+
+        inject_heightfield(
+            geo, cm, h, height_grid, embed_grid, use_volumes=False
+        )
+
+        uploads = {
+            c[0][0]: c[0] for c in
+            geo.setPointFloatAttribValuesFromString.call_args_list
+        }
+        _, height_bytes, height_type = uploads["height"]
+        assert height_type == mock_hou.numericData.Float32
+        np.testing.assert_allclose(
+            np.frombuffer(height_bytes, dtype=np.float32),
+            height_grid.ravel(), rtol=1e-6,
+        )
+
+        # Embeddings are interleaved per point: 64 bands of point 0 first
+        embed = np.frombuffer(uploads["embedding"][1], dtype=np.float32)
+        assert embed.size == 64 * h.height * h.width
+        np.testing.assert_allclose(embed[:64], embed_grid[:, 0, 0], rtol=1e-6)
+        assert not geo.setPointFloatAttribValues.called
+
+def test_inject_heightfield_scalar_layers_as_volumes():
+    mock_hou = MagicMock()
+    mock_hou.attribType.Point = "Point"
+    mock_hou.attribType.Prim = "Prim"
+
+    with patch.dict("sys.modules", {"hou": mock_hou}):
+        geo = MagicMock()
+        vols = [MagicMock(), MagicMock(), MagicMock()]
+        geo.createVolume.side_effect = vols
+        cm = CoordinateManager(45.0, 45.1, 10.0, 10.1)
+        h = Harmonizer(cm, resolution=100)
+        road_dist = np.random.rand(h.height, h.width).astype(np.float32)
+        mask = np.random.randint(0, 2, (h.height, h.width)).astype(np.uint8)
+        h.add_layers({"road_distance": road_dist, "building_mask": mask})
+
+        height_grid = np.random.rand(h.height, h.width)
+
+        inject_heightfield(geo, cm, h, height_grid, None)
+
+        # No embeddings, viz or string layers: no point per cell
+        assert not geo.createPoints.called
+        for c in geo.createVolume.call_args_list:
+            assert c[0] == (h.width, h.height, 1)
+
+        names = [v.setAttribValue.call_args[0] for v in vols]
+        assert names == [
+            ("name", "height"), ("name", "road_distance"),
+            ("name", "building_mask"),
+        ]
+        mask_voxels = np.frombuffer(
+            vols[2].setAllVoxelsFromString.call_args[0][0], dtype=np.float32
+        )
+        assert np.array_equal(mask_voxels, mask.ravel())
+        height_voxels = np.frombuffer(
+            vols[0].setAllVoxelsFromString.call_args[0][0], dtype=np.float32
+        )
+        np.testing.assert_allclose(
+            height_voxels, height_grid.ravel(), rtol=1e-6
+        )
+
+        # Volume spans the grid extent, centred on the grid centre
+        xform = mock_hou.Matrix4.call_args[0][0]
+        center_x, center_z = h.dst_transform * (h.width / 2, h.height / 2)
+        assert xform[3] == (center_x, 0.0, center_z, 1.0)
+        assert xform[0][0] == pytest.approx(h.dst_transform.a * h.width / 2)
+
+def test_inject_heightfield_volumes_keep_points_for_embeddings():
+    mock_hou = MagicMock()
+    mock_hou.attribType.Point = "Point"
+
+    with patch.dict("sys.modules", {"hou": mock_hou}):
+        geo = MagicMock()
+        cm = CoordinateManager(45.0, 45.1, 10.0, 10.1)
+        h = Harmonizer(cm, resolution=100)
+        h.add_layers({
+            "road_distance": np.zeros((h.height, h.width), np.float32),
+            "landuse_id": np.zeros((h.height, h.width), np.int32),
+            "landuse": np.full((h.height, h.width), "", dtype=object),
+        })
+
+        height_grid = np.zeros((h.height, h.width))
+        embed_grid = np.zeros((64, h.height, h.width))
+
+        inject_heightfield(geo, cm, h, height_grid, embed_grid)
+
+        assert geo.createPoints.called
+        point_attribs = [
+            c[0][1] for c in geo.addAttrib.call_args_list
+            if c[0][0] == "Point"
+        ]
+        # Numeric grids live on volumes; strings stay per point
+        assert "embedding" in point_attribs
+        assert "landuse" in point_attribs
+        assert "landuse_id" not in point_attribs
+        assert "height" not in point_attribs
+        assert "road_distance" not in point_attribs
+
+def test_inject_heightfield_quantized_embeddings():
+    mock_hou = MagicMock()
+    mock_hou.attribType.Point = "Point"
+    mock_hou.attribType.Global = "Global"
+
+    with patch.dict("sys.modules", {"hou": mock_hou}):
+        geo = MagicMock()
+        cm = CoordinateManager(45.0, 45.1, 10.0, 10.1)
+        h = Harmonizer(cm, resolution=100)
+
+        height_grid = np.zeros((h.height, h.width))
+        embed_grid = np.random.uniform(-1, 1, (64, h.height, h.width))
+        embed_grid[5] = 0.0
+
+        inject_heightfield(
+            geo, cm, h, height_grid, embed_grid, quantize_embeddings=True
+        )
+
+        q_calls = [
+            c[0] for c in geo.setPointIntAttribValuesFromString.call_args_list
+            if c[0][0] == "embedding_q8"
+        ]
+        assert len(q_calls) == 1
+        assert q_calls[0][2] == mock_hou.numericData.Int8
+        q = np.frombuffer(q_calls[0][1], dtype=np.int8).reshape(-1, 64)
+
+        geo.setGlobalAttribValue.assert_called_once()
+        name, scales = geo.setGlobalAttribValue.call_args[0]
+        assert name == "embedding_scale"
+        scales = np.asarray(scales, dtype=np.float32)
+
+        # Dequantized values are within half a step of the originals
+        restored = q * scales
+        original = embed_grid.transpose(1, 2, 0).reshape(-1, 64)
+        assert np.all(np.abs(restored - original) <= scales / 2 + 1e-6)
+        assert np.all(q[:, 5] == 0)
+        assert not any(
+            c[0][0] == "embedding"
+            for c in geo.setPointFloatAttribValuesFromString.call_args_list
+        )
+
+def test_quantize_int8_ignores_nan_cells():
+    from deep_earth.houdini.geometry import _quantize_int8
+
+    embed_grid = np.random.uniform(-1, 1, (64, 4, 5))
+    embed_grid[3, 1, 2] = np.nan
+    embed_grid[7] = np.nan
+
+    with np.errstate(all="raise"):
+        quantized, scales = _quantize_int8(embed_grid)
+
+    assert np.all(np.isfinite(scales))
+    assert scales[7] == 1.0
+    assert np.all(quantized[..., 7] == 0)
+    assert quantized[1, 2, 3] == 0
+    # The rest of the band keeps its scale and values
+    valid = ~np.isnan(embed_grid[3])
+    restored = quantized[..., 3][valid] * scales[3]
+    assert np.all(np.abs(restored - embed_grid[3][valid]) <= scales[3] / 2 + 1e-6)
+    assert np.abs(quantized[..., 3]).max() == 127
+
+@pytest.mark.parametrize("quantize", [False, True])
+def test_inject_heightfield_sizes_embedding_by_band_count(quantize):
+    mock_hou = MagicMock()
+    mock_hou.attribType.Point = "Point"
+    mock_hou.attribType.Global = "Global"
+
+    with patch.dict("sys.modules", {"hou": mock_hou}):
+        geo = MagicMock()
+        cm = CoordinateManager(45.0, 45.1, 10.0, 10.1)
+        h = Harmonizer(cm, resolution=100)
+
+        # e.g. a 3-band optical dataset instead of 64-band embeddings
+        embed_grid = np.random.uniform(-1, 1, (3, h.height, h.width))
+        inject_heightfield(
+            geo, cm, h, np.zeros((h.height, h.width)), embed_grid,
+            quantize_embeddings=quantize,
+        )
+
+        defaults = {c[0][1]: c[0][2] for c in geo.addAttrib.call_args_list}
+        if quantize:
+            assert defaults["embedding_q8"] == (0, 0, 0)
+            assert defaults["embedding_scale"] == (0.0, 0.0, 0.0)
+            _, scales = geo.setGlobalAttribValue.call_args[0]
+            assert len(scales) == 3
+        else:
+            assert defaults["embedding"] == (0.0, 0.0, 0.0)
+
+def test_inject_heightfield_uniform_quality_volume():
+    mock_hou = MagicMock()
+    mock_hou.attribType.Point = "Point"
+
+    with patch.dict("sys.modules", {"hou": mock_hou}):
+        geo = MagicMock()
+        vols = [MagicMock(), MagicMock()]
+        geo.createVolume.side_effect = vols
+        cm = CoordinateManager(45.0, 45.1, 10.0, 10.1)
+        h = Harmonizer(cm, resolution=100)
+
+        height_grid = np.zeros((h.height, h.width), dtype=np.float32)
+        quality = h.compute_quality_layer(height_grid)
+        assert quality.strides == (0, 0)
+        h.add_layers({"data_quality": quality})
+
+        inject_heightfield(geo, cm, h, height_grid, None)
+
+        assert vols[1].setAttribValue.call_args[0] == ("name", "data_quality")
+        voxels = np.frombuffer(
+            vols[1].setAllVoxelsFromString.call_args[0][0], dtype=np.float32
+        )
+        assert voxels.size == h.width * h.height
+        assert np.all(voxels == np.float32(0.25))
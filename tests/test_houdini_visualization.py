@@ -31,3 +31,15 @@ def test_apply_biome_colors():
     assert np.allclose(colors[2], [0.5, 0.5, 0.5])
     # Unknown should be default grey
     assert np.allclose(colors[3], [0.5, 0.5, 0.5])
+
+def test_apply_biome_colors_grid_and_custom_map():
+    landuse = np.array([["sand", "forest"], ["", "sand"]], dtype=object)
+    colors = apply_biome_colors(landuse, color_map={"sand": [1.0, 0.0, 0.0]})
+
+    assert colors.shape == (2, 2, 3)
+    assert colors.dtype == np.float32
+    assert np.allclose(colors[0, 0], [1.0, 0.0, 0.0])
+    assert np.allclose(colors[1, 1], [1.0, 0.0, 0.0])
+    # Labels missing from the custom map fall back to grey
+    assert np.allclose(colors[0, 1], [0.5, 0.5, 0.5])
+    assert np.allclose(colors[1, 0], [0.5, 0.5, 0.5])
@@ -0,0 +1,69 @@
+"""Tests for http_client.py — the shared aiohttp session."""
+import asyncio
+
+from deep_earth import http_client
+
+
+def test_get_session_reused_within_loop():
+    """Repeated calls on one loop return the same open session."""
+    async def main():
+        first = await http_client.get_session()
+        second = await http_client.get_session()
+        assert first is second
+        assert not first.closed
+        await http_client.close_session()
+        assert first.closed
+
+    asyncio.run(main())
+
+
+def test_get_session_replaced_after_close():
+    """A closed session is replaced on the next call."""
+    async def main():
+        first = await http_client.get_session()
+        await http_client.close_session()
+        second = await http_client.get_session()
+        assert second is not first
+        await http_client.close_session()
+
+    asyncio.run(main())
+
+
+def test_get_session_replaced_on_new_loop():
+    """Each event loop gets its own session."""
+    async def grab():
+        return await http_client.get_session()
+
+    first = asyncio.run(grab())
+    second = asyncio.run(grab())
+    assert first is not second
+    asyncio.run(http_client.close_session())
+
+
+def test_host_semaphore_shared_per_host():
+    """URLs on one host share a semaphore; other hosts get their own."""
+    async def main():
+        a = http_client.host_semaphore("https://overpass-api.de/api/interpreter")
+        b = http_client.host_semaphore("https://overpass-api.de/api/status")
+        c = http_client.host_semaphore("https://portal.opentopography.org/API")
+        assert a is b
+        assert a is not c
+        return a
+
+    first = asyncio.run(main())
+    # A new loop gets fresh semaphores.
+    assert asyncio.run(main()) is not first
+
+
+def test_host_semaphore_uses_per_host_limits():
+    """The GEE high-volume host admits more parallel requests than Overpass."""
+    from deep_earth.providers.earth_engine import HIGH_VOLUME_URL
+
+    async def main():
+        gee = http_client.host_semaphore(HIGH_VOLUME_URL + "/v1/thumbnails")
+        osm = http_client.host_semaphore("https://overpass-api.de/api/interpreter")
+        return gee._value, osm._value
+
+    gee_limit, osm_limit = asyncio.run(main())
+    assert gee_limit == http_client.CONNECTOR_LIMIT_PER_HOST
+    assert osm_limit == http_client.HOST_CONCURRENCY
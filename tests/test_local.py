@@ -105,6 +105,110 @@ class TestLocalFileAdapter:
         assert result is not None
         assert os.path.exists(result)
 
+    @pytest.mark.asyncio
+    async def test_fetch_directory_mosaics_adjacent_tiles(
+        self, tmp_path, region_minneapolis,
+    ):
+        """Non-overlapping tiles each keep their pixels in the mosaic."""
+        cache = CacheManager(str(tmp_path / "cache"))
+        adapter = LocalFileAdapter(cache)
+
+        r = region_minneapolis
+        mid = (r.lon_min + r.lon_max) / 2
+        subdir = tmp_path / "tiles"
+        subdir.mkdir()
+        for name, lon0, lon1, value in [
+            ("a.tif", r.lon_min, mid, 1.0), ("b.tif", mid, r.lon_max, 2.0),
+        ]:
+            with rasterio.open(
+                str(subdir / name), "w", driver="GTiff",
+                height=16, width=8, count=1, dtype="float32",
+                crs="EPSG:4326",
+                transform=rasterio.transform.from_bounds(
+                    lon0, r.lat_min, lon1, r.lat_max, 8, 16,
+                ),
+            ) as dst:
+                dst.write(np.full((1, 16, 8), value, dtype=np.float32))
+
+        result = await adapter.fetch(r, 30.0, str(subdir))
+
+        with rasterio.open(result) as src:
+            row = src.read(1)[src.height // 2]
+        assert row[1] == pytest.approx(1.0)
+        assert row[-2] == pytest.approx(2.0)
+
+    @pytest.mark.asyncio
+    async def test_fetch_bounds_warps_in_flight(
+        self, tmp_path, region_minneapolis, monkeypatch,
+    ):
+        """No more warps are started than there are workers."""
+        import asyncio
+        import threading
+        from deep_earth.providers import local
+
+        cache = CacheManager(str(tmp_path / "cache"))
+        adapter = LocalFileAdapter(cache)
+        subdir = tmp_path / "rasters"
+        subdir.mkdir()
+        for i in range(5):
+            _write_synthetic_tif(
+                str(subdir / f"{i}.tif"), region_minneapolis,
+            )
+
+        release = threading.Event()
+        started = []
+        real_reproject_one = local._reproject_one
+
+        def slow_first(fpath, *args):
+            started.append(fpath)
+            if len(started) == 1:
+                release.wait(5)
+            return real_reproject_one(fpath, *args)
+
+        monkeypatch.setattr(local.os, "cpu_count", lambda: 2)
+        monkeypatch.setattr(local, "_reproject_one", slow_first)
+
+        task = asyncio.create_task(
+            adapter.fetch(region_minneapolis, 30.0, str(subdir)),
+        )
+        await asyncio.sleep(0.2)
+        # The first file blocks compositing, so no third warp starts
+        assert len(started) == 2
+        release.set()
+
+        assert await task is not None
+        assert len(started) == 5
+
+    @pytest.mark.asyncio
+    async def test_fetch_caps_workers_regardless_of_cores(
+        self, tmp_path, region_minneapolis, monkeypatch,
+    ):
+        """Many-core machines still warp at most MAX_WARP_WORKERS files."""
+        from deep_earth.providers import local
+
+        subdir = tmp_path / "rasters"
+        subdir.mkdir()
+        for i in range(6):
+            _write_synthetic_tif(
+                str(subdir / f"{i}.tif"), region_minneapolis,
+            )
+
+        pools = []
+        real_pool = local.ThreadPoolExecutor
+
+        def spy_pool(max_workers):
+            pools.append(max_workers)
+            return real_pool(max_workers=max_workers)
+
+        monkeypatch.setattr(local.os, "cpu_count", lambda: 64)
+        monkeypatch.setattr(local, "ThreadPoolExecutor", spy_pool)
+
+        adapter = LocalFileAdapter(CacheManager(str(tmp_path / "cache")))
+        assert await adapter.fetch(
+            region_minneapolis, 30.0, str(subdir),
+        ) is not None
+        assert pools == [local.MAX_WARP_WORKERS]
+
     @pytest.mark.asyncio
     async def test_fetch_nonexistent_path_returns_none(
         self, region_minneapolis,
@@ -20,6 +20,12 @@ def test_overpass_adapter_custom_url():
     adapter = OverpassAdapter(base_url=custom_url)
     assert adapter.base_url == custom_url
 
+def test_overpass_adapter_shared_cache():
+    """An injected CacheManager is used as-is instead of building a new one."""
+    shared = MagicMock()
+    adapter = OverpassAdapter(cache=shared)
+    assert adapter.cache is shared
+
 def test_build_query():
     """Test generating an Overpass QL query."""
     adapter = OverpassAdapter()
@@ -29,6 +35,8 @@ def test_build_query():
     assert "[timeout:25]" in query
     bbox_str = f"{bbox[0]},{bbox[1]},{bbox[2]},{bbox[3]}"
     assert bbox_str in query
+    # The bbox is given once, as a global setting
+    assert query.count(bbox_str) == 1
 
     features = [
         'way["highway"]',
@@ -98,6 +106,21 @@ def test_get_cache_key():
     key2 = adapter.get_cache_key(bbox2, resolution)
     assert key != key2
 
+def test_get_cache_key_memoized():
+    """RegionContext and tuple inputs share one memoized key."""
+    from deep_earth.providers.osm import _bbox_cache_key
+    from deep_earth.region import RegionContext
+
+    adapter = OverpassAdapter()
+    region = RegionContext(44.97, 44.99, -93.28, -93.25)
+    _bbox_cache_key.cache_clear()
+
+    key = adapter.get_cache_key(region, 10.0)
+    assert adapter.get_cache_key(region.as_tuple(), 30.0) == key
+    assert adapter.get_cache_key(list(region.as_tuple()), 10.0) == key
+    info = _bbox_cache_key.cache_info()
+    assert (info.misses, info.hits) == (1, 2)
+
 @pytest.mark.asyncio
 async def test_fetch_caching():
     """Test that fetched data is cached."""
@@ -221,3 +244,33 @@ def test_transform_to_grid():
         assert np.any(result["building_mask"] == 1)
         # Verify highway has 'primary'
         assert "primary" in result["highway"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_path_cache_hit_skips_network():
+    """fetch_path returns the cached JSON path without touching the API."""
+    adapter = OverpassAdapter(cache=MagicMock())
+    adapter.cache.get_path.return_value = "/cache/osm/key.json"
+
+    with patch("aiohttp.ClientSession") as MockSession:
+        path = await adapter.fetch_path((44.97, -93.28, 44.99, -93.25), 10.0)
+
+    assert path == "/cache/osm/key.json"
+    MockSession.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_fetch_path_cache_miss_returns_saved_path():
+    """On a miss, fetch_path downloads, caches and returns the saved path."""
+    adapter = OverpassAdapter(cache=MagicMock())
+    adapter.cache.get_path.return_value = None
+    adapter.cache.save.return_value = "/cache/osm/key.json"
+
+    with patch(
+        "deep_earth.providers.osm.fetch_with_retry",
+        AsyncMock(return_value=b'{"elements": []}'),
+    ), patch("aiohttp.ClientSession"):
+        path = await adapter.fetch_path((44.97, -93.28, 44.99, -93.25), 10.0)
+
+    assert path == "/cache/osm/key.json"
+    assert adapter.cache.save.call_args[0][1:] == (b'{"elements": []}', "osm", "json")
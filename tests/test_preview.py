@@ -72,3 +72,16 @@ def test_preview_save_to_file(tmp_path):
     assert os.path.exists(out)
     assert os.path.getsize(out) > 0
 
+
+
+def test_preview_import_does_not_load_matplotlib():
+    """Importing deep_earth.preview leaves matplotlib unloaded."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, deep_earth.preview; "
+        "sys.exit('matplotlib.pyplot' in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", code])
+    assert result.returncode == 0
@@ -73,3 +73,79 @@ def test_region_get_tiles():
         assert tile.lat_max <= region.lat_max
         assert tile.lon_min >= region.lon_min
         assert tile.lon_max <= region.lon_max
+
+def test_transformer_is_cached():
+    """Regions in the same UTM zone share a Transformer instance."""
+    a = RegionContext(44.97, 44.98, -93.27, -93.26)
+    b = RegionContext(45.0, 45.1, -93.1, -92.9)
+    assert a.transformer is b.transformer
+    assert a.transformer is a.transformer
+
+
+def test_get_utm_bbox_matches_corner_transforms():
+    """Batched corner transform agrees with per-corner to_utm."""
+    cm = RegionContext(lat_min=44.9, lat_max=45.1, lon_min=-93.1, lon_max=-92.9)
+    corners = [
+        cm.to_utm(lat, lon)
+        for lat in (cm.lat_min, cm.lat_max)
+        for lon in (cm.lon_min, cm.lon_max)
+    ]
+    xs = [c[0] for c in corners]
+    ys = [c[1] for c in corners]
+    assert cm.get_utm_bbox() == pytest.approx(
+        (min(xs), min(ys), max(xs), max(ys))
+    )
+
+
+def test_region_is_hashable_and_memoizes_utm():
+    """Equal regions hash alike; UTM lookups are computed once."""
+    a = RegionContext(44.97, 44.98, -93.27, -93.26)
+    b = RegionContext(44.97, 44.98, -93.27, -93.26)
+    assert a == b
+    assert hash(a) == hash(b)
+    assert len({a, b}) == 1
+
+    assert a.utm_epsg == 32615
+    assert vars(a)["utm_epsg"] == 32615
+    assert a.utm_zone == "15N"
+
+
+@pytest.mark.parametrize("bounds", [
+    (44.9, 45.1, -93.1, -92.9),    # Minneapolis, 15N
+    (-34.0, -33.8, 151.0, 151.2),  # Sydney, 56S
+    (60.0, 61.0, 0.0, 5.9),        # Full zone width, 31N
+])
+def test_to_utm_array_matches_pyproj(bounds):
+    """Closed-form transverse Mercator agrees with PROJ."""
+    cm = RegionContext(*bounds)
+    lats = np.linspace(cm.lat_min, cm.lat_max, 50)
+    lons = np.linspace(cm.lon_min, cm.lon_max, 50)
+
+    xs, ys = cm.to_utm_array(lats, lons)
+    ref_x, ref_y = cm.transformer.transform(lons, lats)
+
+    assert np.allclose(xs, ref_x, atol=1e-3)
+    assert np.allclose(ys, ref_y, atol=1e-3)
+
+
+def test_as_wsen_and_extent():
+    """as_wsen orders lon/lat for GEE-style rectangles; extents are stable."""
+    r = RegionContext(44.97, 44.98, -93.27, -93.26)
+    assert r.as_wsen() == (-93.27, 44.97, -93.26, 44.98)
+    assert r.area_km2() == pytest.approx(r.width_km() * r.height_km())
+    assert r.height_km() == pytest.approx(0.01 * 111.32)
+
+
+def test_to_utm_array_pyproj_fallback_leaves_inputs_untouched():
+    """Points far outside the zone use PROJ without mutating inputs."""
+    cm = RegionContext(44.9, 45.1, -93.1, -92.9)
+    lats = np.array([45.0, 45.0])
+    lons = np.array([-93.0, -40.0])  # second point is ~50 deg off-zone
+
+    xs, ys = cm.to_utm_array(lats, lons)
+    ref_x, ref_y = cm.transformer.transform(lons, lats)
+
+    assert np.allclose(xs, ref_x)
+    assert np.allclose(ys, ref_y)
+    assert lons.tolist() == [-93.0, -40.0]
+    assert lats.tolist() == [45.0, 45.0]
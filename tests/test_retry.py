@@ -74,3 +74,78 @@ async def test_fetch_retry_give_up():
             
     # Should be 3 attempts
     assert mock_session.get.call_count == 3
+
+@pytest.mark.asyncio
+async def test_fetch_retry_honours_retry_after():
+    from deep_earth.retry import fetch_with_retry
+
+    limited = MagicMock()
+    limited.raise_for_status.side_effect = aiohttp.ClientResponseError(
+        MagicMock(), (), status=429, headers={"Retry-After": "7"},
+    )
+    limited.__aenter__ = AsyncMock(return_value=limited)
+    limited.__aexit__ = AsyncMock(return_value=None)
+
+    ok = MagicMock()
+    ok.read = AsyncMock(return_value=b"success")
+    ok.__aenter__ = AsyncMock(return_value=ok)
+    ok.__aexit__ = AsyncMock(return_value=None)
+
+    mock_session = MagicMock()
+    mock_session.get.side_effect = [limited, ok]
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as sleep:
+        result = await fetch_with_retry(mock_session, "http://test.com")
+
+    assert result == b"success"
+    sleep.assert_awaited_once_with(7.0)
+
+
+def _streaming_response(chunks):
+    response = MagicMock()
+    response.status = 200
+
+    async def iter_chunked(size):
+        for chunk in chunks:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+    response.content.iter_chunked = iter_chunked
+    response.__aenter__ = AsyncMock(return_value=response)
+    response.__aexit__ = AsyncMock(return_value=None)
+    return response
+
+@pytest.mark.asyncio
+async def test_download_with_retry_streams_to_file(tmp_path):
+    from deep_earth.retry import download_with_retry
+
+    mock_session = MagicMock()
+    mock_session.get.side_effect = [
+        _streaming_response([b"par", aiohttp.ClientPayloadError("cut")]),
+        _streaming_response([b"abc", b"def"]),
+    ]
+    path = tmp_path / "out.tif"
+
+    with patch("asyncio.sleep"):
+        await download_with_retry(mock_session, "http://test.com", str(path))
+
+    # The broken first attempt is discarded, not appended to
+    assert path.read_bytes() == b"abcdef"
+    assert mock_session.get.call_count == 2
+
+@pytest.mark.asyncio
+async def test_download_with_retry_removes_file_on_failure(tmp_path):
+    from deep_earth.retry import download_with_retry
+
+    mock_session = MagicMock()
+    mock_session.get.side_effect = lambda *a, **k: _streaming_response(
+        [b"par", aiohttp.ClientPayloadError("cut")]
+    )
+    path = tmp_path / "out.tif"
+
+    with patch("asyncio.sleep"):
+        with pytest.raises(aiohttp.ClientPayloadError):
+            await download_with_retry(mock_session, "http://test.com", str(path))
+
+    assert not path.exists()
@@ -1,12 +1,14 @@
 import pytest
 import numpy as np
+from deep_earth import terrain_analysis
 from deep_earth.terrain_analysis import (
     compute_slope, 
     compute_aspect, 
     compute_curvature, 
     compute_roughness, 
     compute_tpi,
-    compute_twi
+    compute_twi,
+    compute_terrain
 )
 
 def test_compute_slope():
@@ -91,3 +93,51 @@ def test_compute_twi():
     assert twi.shape == (10, 10)
     # TWI should be defined
     assert not np.any(np.isnan(twi))
+
+def test_compute_roughness_matches_generic_filter():
+    from scipy.ndimage import generic_filter
+    dem = np.random.rand(16, 16) * 100.0
+
+    rough = compute_roughness(dem, window_size=3)
+    expected = generic_filter(dem, np.std, size=3)
+
+    assert np.allclose(rough, expected, atol=1e-6)
+
+def test_compute_terrain_matches_individual():
+    dem = np.random.rand(16, 16) * 100.0
+
+    terrain = compute_terrain(dem, cell_size=1.0)
+
+    assert np.allclose(terrain["slope"], compute_slope(dem, cell_size=1.0))
+    assert np.allclose(terrain["aspect"], compute_aspect(dem, cell_size=1.0))
+    assert np.allclose(terrain["twi"], compute_twi(dem, cell_size=1.0))
+
+@pytest.mark.skipif(
+    not terrain_analysis.HAS_NUMBA, reason="numba not installed"
+)
+def test_numba_kernels_match_scipy(monkeypatch):
+    dem = np.random.rand(23, 31) * 100.0
+
+    jit = compute_terrain(dem, cell_size=2.0)
+    jit_tpi = compute_tpi(dem, window_size=5)
+
+    monkeypatch.setattr(terrain_analysis, "HAS_NUMBA", False)
+    ref = compute_terrain(dem, cell_size=2.0)
+    ref_tpi = compute_tpi(dem, window_size=5)
+
+    for key in ("slope", "aspect", "twi"):
+        assert np.allclose(jit[key], ref[key])
+    assert np.allclose(jit_tpi, ref_tpi)
+
+@pytest.mark.parametrize("dtype", [np.int16, np.int32, np.float32, np.float64])
+def test_output_dtype_independent_of_numba(monkeypatch, dtype):
+    dem = (np.random.rand(12, 12) * 100.0).astype(dtype)
+    expected = np.result_type(dtype, np.float32)
+
+    for has_numba in sorted({terrain_analysis.HAS_NUMBA, False}):
+        monkeypatch.setattr(terrain_analysis, "HAS_NUMBA", has_numba)
+        assert compute_slope(dem).dtype == expected
+        assert compute_aspect(dem).dtype == expected
+        terrain = compute_terrain(dem)
+        assert terrain["slope"].dtype == expected
+        assert terrain["aspect"].dtype == expected